@@ -0,0 +1,271 @@
+"""Bet-size abstraction and translation of off-grid bets.
+
+Any total between the minimum raise and all-in is a legal bet, which is far
+too many actions for search or learning. ``ActionAbstraction`` keeps a few
+of them: ``BetSizing`` lists, per street and per raise depth
+(``GameState.num_raises``), the pot fractions a player may bet or raise,
+and ``actions`` returns fold/check/call plus those sizes (and all-in)
+clamped to what ``simulator.legal_actions`` allows. Sizes are relative to
+the pot after calling: fraction ``f`` bets or raises to
+``current_bet + f * (pot + to_call)``, so ``1.0`` is a pot-sized bet or
+raise.
+
+Opponents bet whatever they like, so ``translate`` maps an arbitrary bet
+onto the grid with the pseudo-harmonic mapping: a bet of pot fraction ``x``
+between abstract sizes ``a < x < b`` becomes ``a`` with probability::
+
+    ((b - x) * (1 + a)) / ((b - a) * (1 + x))
+
+and ``b`` otherwise, with the check or call standing in as size 0 below
+the smallest bet. Without a random generator the more likely size is used.
+
+The abstract actions depend on nine numbers of the state (street, depth,
+pot, current bet, the actor's bet, stack and whether they already acted,
+the minimum raise and whether anyone can call a raise), so each betting
+state is built once and kept in a table per abstraction: after warm-up,
+``actions`` and ``translate`` cost a tuple and a dict lookup, cheap enough
+for the simulator loop.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from random import Random
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from .cards import Action, PlayerAction
+from .game_state import GameState
+from .rules import Street
+from .simulator import legal_actions
+
+BETTING_STREETS = (Street.PREFLOP, Street.FLOP, Street.TURN, Street.RIVER)
+
+_FOLD = PlayerAction(Action.FOLD)
+_CHECK = PlayerAction(Action.CHECK)
+_CALL = PlayerAction(Action.CALL)
+
+# State fields an abstract action set depends on
+StateKey = Tuple[Street, int, int, int, int, int, bool, int, bool]
+
+
+@dataclass(frozen=True, slots=True)
+class BetSizing:
+    """Pot fractions to bet or raise, by street and raise depth.
+
+    Args:
+        fractions: Per betting street, one tuple of pot fractions per raise
+            depth: ``fractions[street][0]`` sizes the first bet of the round
+            (the open raise preflop), ``[1]`` the raise over it, and so on.
+            Streets left out and depths past the last tuple have no sized
+            bets
+        all_in: Whether going all-in is always an abstract action
+    """
+
+    fractions: Mapping[Street, Tuple[Tuple[float, ...], ...]]
+    all_in: bool = True
+
+    def __post_init__(self) -> None:
+        """Validate the fractions."""
+        for street, depths in self.fractions.items():
+            if street not in BETTING_STREETS:
+                raise ValueError(f"No betting on the {street.value}")
+            for sizes in depths:
+                if any(size <= 0 for size in sizes):
+                    raise ValueError(
+                        f"Pot fractions must be positive, got {sizes} "
+                        f"on the {street.value}"
+                    )
+                if any(low >= high for low, high in zip(sizes, sizes[1:])):
+                    raise ValueError(
+                        f"Pot fractions must be strictly increasing, got {sizes} "
+                        f"on the {street.value}"
+                    )
+
+    @classmethod
+    def standard(cls) -> BetSizing:
+        """A compact default: two or three sizes to open, pot-sized raises."""
+        return cls(
+            {
+                Street.PREFLOP: ((0.5, 1.0), (1.0,), (1.0,)),
+                Street.FLOP: ((0.33, 0.75, 1.0), (1.0,)),
+                Street.TURN: ((0.5, 1.0), (1.0,)),
+                Street.RIVER: ((0.5, 1.0, 2.0), (1.0,)),
+            }
+        )
+
+    def sizes(self, street: Street, depth: int) -> Tuple[float, ...]:
+        """Return the pot fractions available at ``depth`` on ``street``."""
+        depths = self.fractions.get(street, ())
+        return depths[depth] if depth < len(depths) else ()
+
+
+@dataclass(frozen=True, slots=True)
+class AbstractActions:
+    """Abstract actions of the player to act in one betting state.
+
+    Args:
+        actions: Fold (only when facing a bet), the check or call, then the
+            sized bets or raises from smallest to all-in
+        passive: The check or call
+        sized: The bets or raises, smallest first
+        fractions: Pot fraction of each entry of ``sized``
+        pot_after_call: Pot the fractions are taken of (pot plus the call)
+    """
+
+    actions: Tuple[PlayerAction, ...]
+    passive: PlayerAction
+    sized: Tuple[PlayerAction, ...]
+    fractions: Tuple[float, ...]
+    pot_after_call: int
+
+
+def pseudo_harmonic(low: float, high: float, size: float) -> float:
+    """Probability that a bet of ``size`` maps down to ``low`` (not ``high``).
+
+    Args:
+        low: Smaller abstract size, as a pot fraction (0 for check/call)
+        high: Larger abstract size, as a pot fraction
+        size: Observed bet, as a pot fraction, with ``low <= size <= high``
+
+    Returns:
+        1.0 at ``low``, 0.0 at ``high``, decreasing in between
+    """
+    return ((high - size) * (1.0 + low)) / ((high - low) * (1.0 + size))
+
+
+class ActionAbstraction:
+    """Maps betting states to a small grid of abstract actions and back."""
+
+    def __init__(
+        self, sizing: Optional[BetSizing] = None, *, max_states: int = 1 << 18
+    ) -> None:
+        """Set up an empty table of betting states.
+
+        Args:
+            sizing: Pot fractions to use (default ``BetSizing.standard()``)
+            max_states: Betting states kept before the table is cleared
+        """
+        self.sizing = sizing if sizing is not None else BetSizing.standard()
+        self.max_states = max_states
+        self._table: Dict[StateKey, AbstractActions] = {}
+
+    def __len__(self) -> int:
+        """Number of betting states built so far."""
+        return len(self._table)
+
+    def lookup(self, state: GameState) -> AbstractActions:
+        """Return the abstract actions of the player to act.
+
+        Raises:
+            ValueError: If the hand is over
+        """
+        seat = state.to_act
+        if seat is None:
+            raise ValueError("No player to act: the hand is over")
+        player = state.players[seat]
+        key = (
+            state.street,
+            state.num_raises,
+            state.pot,
+            state.current_bet,
+            player.bet,
+            player.stack,
+            player.acted,
+            state.min_raise,
+            state.num_can_act > 1,
+        )
+        entry = self._table.get(key)
+        if entry is None:
+            entry = self._build(state, player.bet)
+            if len(self._table) >= self.max_states:
+                self._table.clear()
+            self._table[key] = entry
+        return entry
+
+    def actions(self, state: GameState) -> Tuple[PlayerAction, ...]:
+        """Return the legal abstract actions of the player to act.
+
+        Raises:
+            ValueError: If the hand is over
+        """
+        return self.lookup(state).actions
+
+    def translate(
+        self, state: GameState, action: PlayerAction, rng: Optional[Random] = None
+    ) -> PlayerAction:
+        """Map an action of the player to act onto the abstract grid.
+
+        Folds, checks and calls are already abstract and come back as they
+        are. A bet or raise maps to its neighbouring abstract sizes with the
+        pseudo-harmonic mapping; bets above the largest size map to it.
+
+        Args:
+            state: State the action is taken in
+            action: Legal action of ``state.to_act``
+            rng: Generator to sample the mapping with (default: take the
+                more likely size)
+
+        Returns:
+            An action from ``actions(state)``
+
+        Raises:
+            ValueError: If the hand is over
+        """
+        kind = action.action
+        if kind is not Action.BET and kind is not Action.RAISE:
+            return action
+        entry = self.lookup(state)
+        sized = entry.sized
+        if not sized:
+            return entry.passive
+        size = (action.amount - state.current_bet) / entry.pot_after_call
+
+        fractions = entry.fractions
+        index = bisect_left(fractions, size)
+        if index == len(fractions):
+            return sized[-1]
+        high = fractions[index]
+        if size == high:
+            return sized[index]
+        if index:
+            low, below = fractions[index - 1], sized[index - 1]
+        else:
+            low, below = 0.0, entry.passive
+        down = pseudo_harmonic(low, high, max(size, low))
+        if rng is None:
+            return below if down >= 0.5 else sized[index]
+        return below if rng.random() < down else sized[index]
+
+    def _build(self, state: GameState, bet: int) -> AbstractActions:
+        """Clamp the configured sizes to the legal range of ``state``."""
+        legal = legal_actions(state)
+        kinds = legal.actions
+        passive = _CALL if Action.CALL in kinds else _CHECK
+        actions = [_FOLD, passive] if Action.FOLD in kinds else [passive]
+
+        current = state.current_bet
+        # At least 1 so a fraction always means some chips
+        basis = max(state.pot + current - bet, 1)
+        sized = []
+        fractions = []
+        top = legal.max_amount
+        if top:
+            kind = kinds[-1]
+            amounts: List[int] = []
+            for fraction in self.sizing.sizes(state.street, state.num_raises):
+                amount = max(current + round(fraction * basis), legal.min_amount)
+                if amount >= top:
+                    amounts.append(top)
+                    break
+                if not amounts or amount > amounts[-1]:
+                    amounts.append(amount)
+            if self.sizing.all_in and (not amounts or amounts[-1] != top):
+                amounts.append(top)
+            for amount in amounts:
+                sized.append(PlayerAction(kind, amount))
+                fractions.append((amount - current) / basis)
+            actions += sized
+        return AbstractActions(
+            tuple(actions), passive, tuple(sized), tuple(fractions), basis
+        )
@@ -0,0 +1,436 @@
+"""Engine microbenchmark suite.
+
+Each benchmark isolates one hot path so a regression can be pinned on the
+component that caused it: card construction, deck operations, 5/6/7-card
+evaluation (object and integer entry points, plus batches), showdown
+resolution, blind posting, whole simulated hands and hands played through
+the bet-size abstraction. Inputs are drawn from
+a fixed seed during setup, outside the timed region.
+
+Run from the command line::
+
+    python -m texas_holdem_ml_bot.engine.benchmarks            # run and record
+    python -m texas_holdem_ml_bot.engine.benchmarks --compare  # fail on regression
+    python -m texas_holdem_ml_bot.engine.benchmarks -k eval --repeats 15
+
+Results are appended to ``data/benchmarks/history.json`` unless
+``--no-save`` is given. ``--compare`` checks the run against the latest
+recorded entry (or ``--baseline-label``) and exits with status 1 if any
+benchmark's median throughput dropped by more than ``--threshold``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from random import Random
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from ..utils.benchmarking import (
+    Benchmark,
+    BenchmarkResult,
+    append_history,
+    compare_results,
+    format_results,
+    load_history,
+    make_record,
+    record_results,
+    run_suite,
+)
+from ..utils.paths import BENCHMARKS_DIR
+from . import lookup
+from .abstraction import ActionAbstraction
+from .cards import NUM_CARDS, RANKS, SUITS, Card, Deck
+from .evaluator import (
+    EVALUATOR_BACKENDS,
+    evaluate_hand,
+    get_evaluator_backend,
+    set_evaluator_backend,
+)
+from .game_state import GameState, PlayerState
+from .rules import Street
+from .showdown import resolve_showdown
+from .simulator import apply, settle, simulate_random_hands, start_hand
+from .table_batch import simulate_random_batch
+
+DEFAULT_HISTORY = BENCHMARKS_DIR / "history.json"
+
+SEED = 20240101
+
+
+def _random_hands(num_hands: int, size: int, seed: int = SEED) -> List[List[int]]:
+    """Draw ``num_hands`` distinct-card index hands of the given size."""
+    rng = Random(seed)
+    deck = list(range(NUM_CARDS))
+    return [rng.sample(deck, size) for _ in range(num_hands)]
+
+
+# ---------------------------------------------------------------------------
+# Benchmark setups: build inputs, return the timed callable
+# ---------------------------------------------------------------------------
+
+
+def _card_construct(ops: int) -> Callable[[], object]:
+    """Validated public constructor."""
+    rng = Random(SEED)
+    specs = [(rng.choice(RANKS), rng.choice(SUITS)) for _ in range(ops)]
+
+    def run() -> None:
+        for rank, suit in specs:
+            Card(rank, suit)
+
+    return run
+
+
+def _card_from_index(ops: int) -> Callable[[], object]:
+    """Interned lookup without validation."""
+    rng = Random(SEED)
+    indices = [rng.randrange(NUM_CARDS) for _ in range(ops)]
+    from_index = Card.from_index
+
+    def run() -> None:
+        for index in indices:
+            from_index(index)
+
+    return run
+
+
+def _deck_deal(ops: int) -> Callable[[], object]:
+    """Fresh deck per hand, as a naive simulator deals."""
+    rng = Random(SEED)
+
+    def run() -> None:
+        for _ in range(ops):
+            deck = Deck(rng=rng)
+            deck.shuffle()
+            deck.draw(7)
+
+    return run
+
+
+def _deck_reuse(ops: int) -> Callable[[], object]:
+    """One reused deck dealing integer indices."""
+    deck = Deck(seed=SEED)
+
+    def run() -> None:
+        for _ in range(ops):
+            deck.reset()
+            deck.shuffle()
+            deck.draw_indices(7)
+
+    return run
+
+
+def _evaluate_hand(size: int) -> Callable[[int], Callable[[], object]]:
+    """``evaluate_hand`` through the active backend."""
+
+    def setup(ops: int) -> Callable[[], object]:
+        hands = [
+            [Card.from_index(index) for index in hand]
+            for hand in _random_hands(ops, size)
+        ]
+
+        def run() -> None:
+            for hand in hands:
+                evaluate_hand(hand)
+
+        return run
+
+    return setup
+
+
+def _rank_indices(size: int) -> Callable[[int], Callable[[], object]]:
+    """Lookup-table ranks of integer hands."""
+
+    def setup(ops: int) -> Callable[[], object]:
+        hands = _random_hands(ops, size)
+        rank_indices = lookup.rank_indices
+        rank_indices(hands[0])  # Load tables before timing
+
+        def run() -> None:
+            for hand in hands:
+                rank_indices(hand)
+
+        return run
+
+    return setup
+
+
+def _evaluate_batch(ops: int) -> Callable[[], object]:
+    """One vectorized call over ``ops`` hands."""
+    hands = np.array(_random_hands(ops, 7), dtype=np.int8)
+
+    def run() -> None:
+        lookup.evaluate_batch(hands)
+
+    return run
+
+
+def _showdown(num_players: int) -> Callable[[int], Callable[[], object]]:
+    """River showdowns with random holdings."""
+
+    def setup(ops: int) -> Callable[[], object]:
+        rng = Random(SEED)
+        deals = []
+        for _ in range(ops):
+            deck = Deck(rng=rng)
+            deck.shuffle()
+            holes = [deck.draw(2) for _ in range(num_players)]
+            board = deck.draw(5)
+            players = [PlayerState(1000) for _ in range(num_players)]
+            state = GameState(
+                players=players,
+                button=rng.randrange(num_players),
+                street=Street.RIVER,
+                board=board,
+                pot=100 * num_players,
+            )
+            deals.append((state, holes))
+
+        def run() -> None:
+            for state, holes in deals:
+                resolve_showdown(state, holes)
+
+        return run
+
+    return setup
+
+
+def _post_blinds(num_players: int) -> Callable[[int], Callable[[], object]]:
+    """``GameState.post_blinds`` on prebuilt states."""
+
+    def setup(ops: int) -> Callable[[], object]:
+        # Deep stacks so repeated rounds never run a player out of chips
+        states = [
+            GameState(
+                players=[PlayerState(10**12) for _ in range(num_players)],
+                button=index % num_players,
+            )
+            for index in range(ops)
+        ]
+
+        def run() -> None:
+            for state in states:
+                state.post_blinds()
+
+        return run
+
+    return setup
+
+
+def _simulate(num_players: int) -> Callable[[int], Callable[[], object]]:
+    """Whole hands between random agents, showdown included."""
+
+    def setup(ops: int) -> Callable[[], object]:
+        def run() -> None:
+            simulate_random_hands(ops, num_players, seed=SEED)
+
+        return run
+
+    return setup
+
+
+def _simulate_batch(num_players: int) -> Callable[[int], Callable[[], object]]:
+    """Random hands on a ``TableBatch`` of 1,024 tables."""
+
+    def setup(ops: int) -> Callable[[], object]:
+        def run() -> None:
+            simulate_random_batch(ops, num_players, seed=SEED)
+
+        return run
+
+    return setup
+
+
+def _abstract_play(num_players: int) -> Callable[[int], Callable[[], object]]:
+    """Random hands choosing only among abstract actions (warm table)."""
+
+    def setup(ops: int) -> Callable[[], object]:
+        rng = Random(SEED)
+        abstraction = ActionAbstraction()
+        state = GameState(
+            players=[PlayerState(200) for _ in range(num_players)], button=0
+        )
+        deck = Deck(rng=rng)
+
+        def run() -> None:
+            for hand in range(ops):
+                state.button = hand % num_players
+                for player in state.players:
+                    player.stack = 200
+                holes = start_hand(state, deck)
+                while state.to_act is not None:
+                    actions = abstraction.actions(state)
+                    apply(state, actions[int(rng.random() * len(actions))])
+                settle(state, holes)
+
+        return run
+
+    return setup
+
+
+def default_benchmarks() -> List[Benchmark]:
+    """Return the engine suite in reporting order."""
+    suite = [
+        Benchmark("card_construct", _card_construct, 50_000, "Card(rank, suit)"),
+        Benchmark("card_from_index", _card_from_index, 100_000, "Card.from_index"),
+        Benchmark("deck_deal_7", _deck_deal, 10_000, "New deck, shuffle, draw 7"),
+        Benchmark(
+            "deck_reuse_7", _deck_reuse, 20_000, "Reset, shuffle, draw 7 indices"
+        ),
+    ]
+    for size in (5, 6, 7):
+        suite.append(
+            Benchmark(
+                f"evaluate_hand_{size}",
+                _evaluate_hand(size),
+                10_000,
+                f"evaluate_hand on {size} cards (active backend)",
+            )
+        )
+    for size in (5, 6, 7):
+        suite.append(
+            Benchmark(
+                f"rank_indices_{size}",
+                _rank_indices(size),
+                20_000,
+                f"Lookup-table rank of {size} card indices",
+            )
+        )
+    suite += [
+        Benchmark(
+            "evaluate_batch_7", _evaluate_batch, 200_000, "Vectorized 7-card ranks"
+        ),
+        Benchmark("showdown_2", _showdown(2), 5_000, "Heads-up showdown"),
+        Benchmark("showdown_9", _showdown(9), 2_000, "9-handed showdown"),
+        Benchmark("post_blinds_2", _post_blinds(2), 20_000, "Heads-up blinds"),
+        Benchmark("post_blinds_9", _post_blinds(9), 20_000, "9-handed blinds"),
+        Benchmark("simulate_2", _simulate(2), 5_000, "Heads-up random hands"),
+        Benchmark("simulate_9", _simulate(9), 2_000, "9-handed random hands"),
+        Benchmark("batch_simulate_2", _simulate_batch(2), 20_000, "Heads-up, batched"),
+        Benchmark("batch_simulate_9", _simulate_batch(9), 10_000, "9-handed, batched"),
+        Benchmark(
+            "abstract_play_2", _abstract_play(2), 5_000, "Heads-up abstract actions"
+        ),
+    ]
+    return suite
+
+
+def select_benchmarks(
+    benchmarks: Sequence[Benchmark], patterns: Optional[Sequence[str]]
+) -> List[Benchmark]:
+    """Keep benchmarks whose name contains any of the patterns (all if none)."""
+    if not patterns:
+        return list(benchmarks)
+    return [b for b in benchmarks if any(p in b.name for p in patterns)]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m texas_holdem_ml_bot.engine.benchmarks",
+        description="Run the engine microbenchmarks.",
+    )
+    parser.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        help="Only run benchmarks whose name contains this (repeatable)",
+    )
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed rounds")
+    parser.add_argument("--repeats", type=int, default=7, help="Timed rounds")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiplier on operation counts"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=EVALUATOR_BACKENDS,
+        default=None,
+        help="evaluate_hand backend (default: current)",
+    )
+    parser.add_argument(
+        "--history", default=str(DEFAULT_HISTORY), help="JSON history file"
+    )
+    parser.add_argument("--label", default=None, help="Tag stored with the run")
+    parser.add_argument(
+        "--no-save", action="store_true", help="Do not append to the history"
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Compare with a recorded run; exit 1 on regression",
+    )
+    parser.add_argument(
+        "--baseline-label",
+        default=None,
+        help="Compare with the latest run carrying this label",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Tolerated throughput drop as a fraction (default: 0.10)",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns the process exit status."""
+    args = _build_parser().parse_args(argv)
+    benchmarks = select_benchmarks(default_benchmarks(), args.patterns)
+    if not benchmarks:
+        print("No benchmarks match the given patterns", file=sys.stderr)
+        return 2
+
+    history = load_history(args.history)
+    baseline = None
+    if args.compare:
+        candidates = [
+            record
+            for record in history
+            if args.baseline_label is None or record.get("label") == args.baseline_label
+        ]
+        if not candidates:
+            print(f"No baseline run found in {args.history}", file=sys.stderr)
+            return 2
+        baseline = record_results(candidates[-1])
+
+    previous_backend = get_evaluator_backend()
+    if args.backend is not None:
+        set_evaluator_backend(args.backend)
+    backend = get_evaluator_backend()
+    try:
+        results: List[BenchmarkResult] = run_suite(
+            benchmarks,
+            warmup=args.warmup,
+            repeats=args.repeats,
+            scale=args.scale,
+            progress=lambda result: print(f"  {result.name} done", file=sys.stderr),
+        )
+    finally:
+        set_evaluator_backend(previous_backend)
+
+    comparisons = []
+    if baseline is not None:
+        comparisons = compare_results(baseline, results, args.threshold)
+    print(format_results(results, comparisons))
+
+    if not args.no_save:
+        record = make_record(results, args.label, evaluator_backend=backend)
+        append_history(args.history, record)
+        print(f"Recorded run in {args.history}")
+
+    regressions = [c for c in comparisons if c.regressed]
+    if regressions:
+        names = ", ".join(c.name for c in regressions)
+        print(
+            f"Throughput regressed by more than {args.threshold:.0%}: {names}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""Suit-isomorphic canonicalization of hole cards and boards.
+
+Relabelling suits never changes a hand's strength, equity or strategy, so
+hands that differ only by a suit permutation can share one computation. Each
+suit is summarized by a ``(hole_mask, board_mask)`` pair of 13-bit rank
+masks; sorting suits by that pair (strongest first) and relabelling them
+0..3 yields the canonical form. Hole and board cards are kept apart because
+they are not interchangeable (a suited hole pair differs from a suited pair
+on the board).
+
+Dense class indexes cover the common cases:
+    169 preflop starting hands (13 pairs, 78 suited, 78 offsuit)
+    1,755 flops
+
+Expensive suit-invariant computations (equities, hand-strength features)
+can be memoized per canonical class with ``isomorphic_cache``.
+
+All functions take integer card indices (see ``cards.card_to_index``).
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+from itertools import combinations
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TypeVar
+
+from ..utils.cache import LRUCache
+from .cards import NUM_CARDS
+from .lookup import rank_indices
+
+V = TypeVar("V")
+
+NUM_PREFLOP_CLASSES = 169
+NUM_FLOP_CLASSES = 1755
+
+RANK_CHARS = "23456789TJQKA"
+
+# Per-suit (hole_mask, board_mask) pairs, strongest suit first
+CanonicalKey = Tuple[Tuple[int, int], ...]
+
+_FLOP_CLASS_INDEX: Dict[CanonicalKey, int] = {}
+_FLOP_REPRESENTATIVES: List[Tuple[int, int, int]] = []
+
+
+def _suit_pattern(hole: Sequence[int], board: Sequence[int]) -> List[List[int]]:
+    """Collect ``[hole_mask, board_mask, suit]`` for each suit."""
+    pattern = [[0, 0, suit] for suit in range(4)]
+    for index in hole:
+        pattern[index & 3][0] |= 1 << (index >> 2)
+    for index in board:
+        pattern[index & 3][1] |= 1 << (index >> 2)
+    return pattern
+
+
+def canonical_key(hole: Sequence[int], board: Sequence[int] = ()) -> CanonicalKey:
+    """Return a hashable key shared by all suit permutations of a hand.
+
+    Args:
+        hole: Hole card indices (may be empty)
+        board: Board card indices (may be empty)
+
+    Returns:
+        Suit summaries sorted strongest first; equal keys mean the hands are
+        identical up to relabelling suits
+    """
+    pattern = _suit_pattern(hole, board)
+    return tuple(sorted(((h, b) for h, b, _ in pattern), reverse=True))
+
+
+def suit_permutation(hole: Sequence[int], board: Sequence[int] = ()) -> List[int]:
+    """Return ``mapping`` with ``mapping[old_suit]`` the canonical suit."""
+    pattern = sorted(_suit_pattern(hole, board), reverse=True)
+    mapping = [0, 0, 0, 0]
+    for new_suit, (_, _, old_suit) in enumerate(pattern):
+        mapping[old_suit] = new_suit
+    return mapping
+
+
+def canonicalize(
+    hole: Sequence[int], board: Sequence[int] = ()
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Map a hand to its canonical representative.
+
+    Args:
+        hole: Hole card indices
+        board: Board card indices
+
+    Returns:
+        ``(hole, board)`` with suits relabelled canonically, each sorted
+        from highest index to lowest
+    """
+    mapping = suit_permutation(hole, board)
+    new_hole = sorted(((i & ~3) | mapping[i & 3] for i in hole), reverse=True)
+    new_board = sorted(((i & ~3) | mapping[i & 3] for i in board), reverse=True)
+    return tuple(new_hole), tuple(new_board)
+
+
+# ---------------------------------------------------------------------------
+# Preflop classes
+# ---------------------------------------------------------------------------
+
+
+def preflop_class(first: int, second: int) -> int:
+    """Return the starting-hand class (0..168) of two hole cards.
+
+    Classes form a 13x13 grid over rank indices: pairs on the diagonal,
+    suited hands at ``high * 13 + low`` and offsuit hands at
+    ``low * 13 + high``.
+    """
+    high, low = first >> 2, second >> 2
+    if high < low:
+        high, low = low, high
+    if (first & 3) == (second & 3):
+        return high * 13 + low
+    return low * 13 + high
+
+
+def preflop_class_name(index: int) -> str:
+    """Return the conventional name of a class, e.g. ``"AKs"`` or ``"TT"``.
+
+    Raises:
+        ValueError: If index is outside 0..168
+    """
+    if not (0 <= index < NUM_PREFLOP_CLASSES):
+        raise ValueError(f"Invalid preflop class: {index} (must be 0-168)")
+    row, col = divmod(index, 13)
+    if row == col:
+        return RANK_CHARS[row] * 2
+    if row > col:
+        return f"{RANK_CHARS[row]}{RANK_CHARS[col]}s"
+    return f"{RANK_CHARS[col]}{RANK_CHARS[row]}o"
+
+
+def preflop_class_combos(index: int) -> List[Tuple[int, int]]:
+    """List the concrete hole-card combos (6, 4 or 12) of a class.
+
+    Raises:
+        ValueError: If index is outside 0..168
+    """
+    if not (0 <= index < NUM_PREFLOP_CLASSES):
+        raise ValueError(f"Invalid preflop class: {index} (must be 0-168)")
+    row, col = divmod(index, 13)
+    high, low = max(row, col), min(row, col)
+    combos = []
+    for suit_a in range(4):
+        for suit_b in range(4):
+            first, second = high * 4 + suit_a, low * 4 + suit_b
+            if first <= second and row == col:
+                continue
+            suited = suit_a == suit_b
+            if row != col and suited != (row > col):
+                continue
+            combos.append((first, second))
+    return combos
+
+
+# ---------------------------------------------------------------------------
+# Flop classes
+# ---------------------------------------------------------------------------
+
+
+def _build_flop_classes() -> None:
+    """Index the canonical flops in a fixed order (first occurrence)."""
+    for flop in combinations(range(NUM_CARDS - 1, -1, -1), 3):
+        key = canonical_key((), flop)
+        if key not in _FLOP_CLASS_INDEX:
+            _FLOP_CLASS_INDEX[key] = len(_FLOP_REPRESENTATIVES)
+            _, board = canonicalize((), flop)
+            _FLOP_REPRESENTATIVES.append((board[0], board[1], board[2]))
+
+
+def flop_class(board: Sequence[int]) -> int:
+    """Return the suit-isomorphic class (0..1754) of a three-card flop.
+
+    Raises:
+        ValueError: If the board does not hold exactly 3 cards
+    """
+    if len(board) != 3:
+        raise ValueError(f"Flop must have 3 cards, got {len(board)}")
+    if not _FLOP_CLASS_INDEX:
+        _build_flop_classes()
+    return _FLOP_CLASS_INDEX[canonical_key((), board)]
+
+
+def canonical_flops() -> List[Tuple[int, int, int]]:
+    """Return one representative flop per class, indexed by ``flop_class``."""
+    if not _FLOP_CLASS_INDEX:
+        _build_flop_classes()
+    return list(_FLOP_REPRESENTATIVES)
+
+
+# ---------------------------------------------------------------------------
+# Memoization
+# ---------------------------------------------------------------------------
+
+
+def isomorphic_cache(
+    maxsize: int,
+) -> Callable[[Callable[..., V]], Callable[..., V]]:
+    """Memoize ``fn(hole, board, *args)`` per suit-isomorphic class.
+
+    The wrapped function must give the same result for every suit
+    permutation of its cards. Extra positional arguments must be hashable
+    and become part of the key. The ``LRUCache`` is exposed as
+    ``wrapper.cache`` for statistics, ``clear()`` and ``resize()``.
+
+    Args:
+        maxsize: Entry limit of the cache
+    """
+
+    def decorator(fn: Callable[..., V]) -> Callable[..., V]:
+        cache: LRUCache[Any, V] = LRUCache(maxsize)
+
+        @wraps(fn)
+        def wrapper(hole: Sequence[int], board: Sequence[int], *args: Any) -> V:
+            key = (canonical_key(hole, board), args)
+            return cache.get_or_compute(key, lambda: fn(hole, board, *args))
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+@isomorphic_cache(maxsize=1 << 16)
+def cached_hand_rank(hole: Sequence[int], board: Sequence[int]) -> int:
+    """Hand-class rank of hole plus board cards, memoized per class.
+
+    A single table evaluation costs about as much as building the key, so
+    prefer ``BoardContext`` in tight loops; this wrapper pays off when
+    callers repeat the same classes across otherwise expensive pipelines.
+    """
+    return rank_indices([*hole, *board])
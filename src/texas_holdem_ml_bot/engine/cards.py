@@ -2,21 +2,37 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from enum import Enum
-from random import shuffle
-from typing import Iterable, List
+from random import Random
+from typing import Dict, Iterable, List
 
 # Unicode suit symbols
 SUITS = ("♣", "♦", "♥", "♠")
 # Ranks: 2-14 where 11=J, 12=Q, 13=K, 14=A
 RANKS = tuple(range(2, 15))
 
+# Integer encoding: index = (rank - 2) * 4 + suit_index, so 0 = 2♣ and
+# 51 = A♠. ``index >> 2`` is the rank index and ``index & 3`` the suit index.
+# A hand mask is a 52-bit int with bit ``index`` set for each card held.
+NUM_CARDS = 52
+
+
+# Face letters for string forms; other ranks print as their number
+_FACES = {11: "J", 12: "Q", 13: "K", 14: "A"}
+
 
 @dataclass(frozen=True, slots=True)
 class Card:
     """Immutable playing card with rank and suit.
 
+    Public construction validates rank and suit. Hot code should instead
+    reuse the 52 interned instances from ``Card.from_index`` or
+    ``Card.parse``: no validation, identity comparisons and precomputed
+    string forms. Cards compare and hash by value, so interned and freshly
+    constructed cards mix freely.
+
     Args:
         rank: Integer rank (2-14, where 11=J, 12=Q, 13=K, 14=A)
         suit: Unicode suit symbol (♣, ♦, ♥, ♠)
@@ -24,6 +40,8 @@ class Card:
 
     rank: int
     suit: str
+    # Integer encoding (see NUM_CARDS), derived from rank and suit
+    index: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate rank and suit on initialization."""
@@ -31,38 +49,234 @@ class Card:
             raise ValueError(f"Invalid rank: {self.rank} (must be 2-14)")
         if self.suit not in SUITS:
             raise ValueError(f"Invalid suit: {self.suit} (must be one of {SUITS})")
+        object.__setattr__(self, "index", (self.rank - 2) * 4 + SUITS.index(self.suit))
+
+    @staticmethod
+    def from_index(index: int) -> Card:
+        """Return the interned card for an integer index (0-51).
+
+        Raises:
+            ValueError: If index is outside 0-51
+        """
+        if not (0 <= index < NUM_CARDS):
+            raise ValueError(f"Invalid card index: {index} (must be 0-51)")
+        return _INDEX_TO_CARD[index]
+
+    @staticmethod
+    def parse(text: str) -> Card:
+        """Return the interned card for text such as ``"As"``, ``"A♠"``, ``"10h"``.
+
+        Ranks: 2-9, T or 10, J, Q, K, A. Suits: c/d/h/s or ♣/♦/♥/♠. Case is
+        ignored.
+
+        Raises:
+            ValueError: If the text is not a card
+        """
+        card = _PARSE_TABLE.get(text.strip().lower())
+        if card is None:
+            raise ValueError(f"Cannot parse card: {text!r}")
+        return card
 
     def __str__(self) -> str:
         """Human-readable card representation (e.g., 'A♠', 'K♥')."""
-        face_map = {11: "J", 12: "Q", 13: "K", 14: "A"}
-        face = face_map.get(self.rank, str(self.rank))
-        return f"{face}{self.suit}"
+        return _CARD_STRINGS[self.index]
 
     def __repr__(self) -> str:
         """Developer-friendly representation."""
         return f"Card({self.rank}, '{self.suit}')"
 
+    def __reduce__(self) -> tuple:
+        """Unpickle to the interned instance (e.g. across worker processes)."""
+        return (index_to_card, (self.index,))
+
+
+def _build_parse_table(cards: Iterable[Card]) -> Dict[str, Card]:
+    """Map every accepted lower-case spelling to its interned card."""
+    table = {}
+    for card in cards:
+        rank_names = [_FACES.get(card.rank, str(card.rank))]
+        if card.rank == 10:
+            rank_names.append("T")
+        for suit_name in (card.suit, "cdhs"[card.index & 3]):
+            for rank_name in rank_names:
+                table[f"{rank_name}{suit_name}".lower()] = card
+    return table
+
+
+_INDEX_TO_CARD = tuple(Card(rank, suit) for rank in RANKS for suit in SUITS)
+_CARD_STRINGS = tuple(
+    f"{_FACES.get(card.rank, str(card.rank))}{card.suit}" for card in _INDEX_TO_CARD
+)
+_PARSE_TABLE = _build_parse_table(_INDEX_TO_CARD)
+_FULL_DECK = list(range(NUM_CARDS))
+_SHARED_RNG = Random()
+
+# A forked child would otherwise inherit the parent's generator state and
+# deal the same cards as every sibling (CPython reseeds only ``random``'s
+# own instance after fork)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_SHARED_RNG.seed)
+
+
+def card_to_index(card: Card) -> int:
+    """Encode a card as an integer 0-51 (rank-major, suit-minor)."""
+    return card.index
+
+
+def index_to_card(index: int) -> Card:
+    """Decode an integer 0-51 back to its card.
+
+    Raises:
+        ValueError: If index is outside 0-51
+    """
+    if not (0 <= index < NUM_CARDS):
+        raise ValueError(f"Invalid card index: {index} (must be 0-51)")
+    return _INDEX_TO_CARD[index]
+
+
+def cards_to_indices(cards: Iterable[Card]) -> List[int]:
+    """Encode cards as a list of integer indices."""
+    return [card.index for card in cards]
+
+
+def indices_to_mask(indices: Iterable[int]) -> int:
+    """Build a 52-bit hand mask from card indices."""
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+
+def mask_to_indices(mask: int) -> List[int]:
+    """List the card indices set in a hand mask, lowest first.
+
+    Raises:
+        ValueError: If the mask is negative or has bits above the 52-card range
+    """
+    if mask < 0 or mask >> NUM_CARDS:
+        raise ValueError(f"Invalid hand mask: {mask:#x} (must fit in 52 bits)")
+    indices = []
+    while mask:
+        low = mask & -mask
+        indices.append(low.bit_length() - 1)
+        mask ^= low
+    return indices
+
+
+def cards_to_mask(cards: Iterable[Card]) -> int:
+    """Build a 52-bit hand mask from cards."""
+    return indices_to_mask(card.index for card in cards)
+
+
+def mask_to_cards(mask: int) -> List[Card]:
+    """Decode a hand mask to cards, ordered by index.
+
+    Raises:
+        ValueError: If the mask is negative or has bits above the 52-card range
+    """
+    return [_INDEX_TO_CARD[index] for index in mask_to_indices(mask)]
+
 
 class Deck:
     """Standard 52-card deck with shuffle and draw operations.
 
+    Cards are held as a preallocated array of integer indices with a draw
+    pointer, so drawing never copies the remaining deck and ``reset`` is
+    O(1). Shuffling is lazy: after ``shuffle`` each drawn card is picked
+    uniformly from the cards still in the deck (one Fisher-Yates step per
+    card), so dealing k cards only pays for k swaps.
+
+    Each deck owns its random source. Pass ``seed`` or ``rng`` for
+    reproducible, independent streams (e.g. one per worker); unseeded decks
+    share a module-level generator, reseeded from OS entropy in forked
+    children so workers never repeat each other's deals.
+
     Can be initialized with a custom set of cards for testing.
     """
 
-    def __init__(self, *, cards: Iterable[Card] | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        cards: Iterable[Card] | None = None,
+        seed: int | None = None,
+        rng: Random | None = None,
+    ) -> None:
         """Initialize deck with all 52 cards or custom cards.
 
         Args:
             cards: Optional iterable of cards. If None, creates full 52-card deck.
+            seed: Seed for a private random generator
+            rng: Random generator to use (takes precedence over seed)
         """
         if cards is not None:
-            self._cards: List[Card] = list(cards)
+            self._cards: List[int] = [card.index for card in cards]
         else:
-            self._cards = [Card(rank, suit) for suit in SUITS for rank in RANKS]
+            self._cards = _FULL_DECK[:]
+        self._pos = 0
+        self._shuffled = False
+        if rng is not None:
+            self._rng = rng
+        elif seed is not None:
+            self._rng = Random(seed)
+        else:
+            self._rng = _SHARED_RNG
+
+    @property
+    def rng(self) -> Random:
+        """Random generator used by this deck."""
+        return self._rng
 
     def shuffle(self) -> None:
-        """Shuffle the deck in place using Fisher-Yates algorithm."""
-        shuffle(self._cards)
+        """Shuffle the remaining cards (lazily, see class docstring)."""
+        self._shuffled = True
+
+    def reset(self) -> None:
+        """Return every dealt card to the deck in O(1).
+
+        A shuffled deck stays shuffled, so the next hand is dealt at random
+        without calling ``shuffle`` again.
+        """
+        self._pos = 0
+
+    def draw_indices(self, n: int = 1) -> List[int]:
+        """Draw n cards as integer indices (no ``Card`` objects created).
+
+        Args:
+            n: Number of cards to draw (default 1)
+
+        Returns:
+            List of drawn card indices
+
+        Raises:
+            ValueError: If n is invalid or deck doesn't have enough cards
+        """
+        cards = self._cards
+        start = self._pos
+        size = len(cards)
+        if not (1 <= n <= size - start):
+            raise ValueError(f"Cannot draw {n} cards (deck has {size - start} cards)")
+
+        end = start + n
+        if self._shuffled:
+            rand = self._rng.random
+            for i in range(start, end):
+                j = i + int(rand() * (size - i))
+                cards[i], cards[j] = cards[j], cards[i]
+        self._pos = end
+        return cards[start:end]
+
+    def undraw(self, n: int = 1) -> None:
+        """Put the last n drawn cards back into the deck in O(1).
+
+        An unshuffled deck deals them again in the same order; a shuffled
+        one draws from them at random again.
+
+        Raises:
+            ValueError: If fewer than n cards have been drawn
+        """
+        if not (0 <= n <= self._pos):
+            raise ValueError(f"Cannot undraw {n} cards ({self._pos} drawn)")
+        self._pos -= n
 
     def draw(self, n: int = 1) -> List[Card]:
         """Draw n cards from the top of the deck.
@@ -76,16 +290,11 @@ class Deck:
         Raises:
             ValueError: If n is invalid or deck doesn't have enough cards
         """
-        if not (1 <= n <= len(self._cards)):
-            raise ValueError(
-                f"Cannot draw {n} cards (deck has {len(self._cards)} cards)"
-            )
-        drawn, self._cards = self._cards[:n], self._cards[n:]
-        return drawn
+        return [_INDEX_TO_CARD[index] for index in self.draw_indices(n)]
 
     def __len__(self) -> int:
         """Return number of cards remaining in deck."""
-        return len(self._cards)
+        return len(self._cards) - self._pos
 
     def __repr__(self) -> str:
         """Developer-friendly representation."""
@@ -14,18 +14,61 @@ Hand categories (higher is better):
     1: Two Pair
     0: One Pair
    -1: High Card
+
+Two interchangeable backends produce identical scores:
+    "python": the reference implementation in this module (default)
+    "lookup": precomputed, memory-mapped tables (see ``engine/lookup.py``)
+
+Select a backend with ``set_evaluator_backend`` or the
+``TEXAS_HOLDEM_EVALUATOR`` environment variable; callers are unchanged.
+
+Inner loops that already hold integer-encoded cards (see ``cards.py``) should
+call ``evaluate_indices`` or ``evaluate_mask``, which read the lookup tables
+directly and never allocate ``Card`` objects. Offline jobs holding many
+hands in an ``(N, 5-7)`` index array should use ``evaluate_batch``, which
+scores the whole array with vectorized NumPy operations.
+
+Hand ranks:
+    ``evaluate_rank`` returns a single integer 1..7462, one per equivalence
+    class of five-card hands (7-5-4-3-2 offsuit is 1, a royal flush 7462).
+    Ranks follow the same total order as ``HandScore`` tuples, so showdowns,
+    sorting and int32 storage can use plain integer comparisons;
+    ``decode_rank`` maps a rank back to its ``(category, kickers)``.
+
+Shared boards:
+    When many hole-card pairs are scored against the same community cards,
+    build a ``BoardContext`` once per board and call its ``rank`` (or
+    ``rank_many`` for arrays of pairs); ``deal`` advances flop -> turn ->
+    river incrementally. ``rank_boards`` does the same for arrays of
+    boards, aggregating each board once (e.g. all runouts of a turn).
 """
 
 from __future__ import annotations
 
+import os
 from collections import Counter
-from typing import List, Sequence, Set, Tuple
+from typing import Callable, List, Sequence, Set, Tuple
 
+from . import lookup
 from .cards import Card
+from .lookup import (  # noqa: F401  (re-exported)
+    NUM_HAND_CLASSES,
+    BoardContext,
+    decode_rank,
+    evaluate_batch,
+    evaluate_indices,
+    evaluate_mask,
+    rank_boards,
+)
+from .lookup import rank_indices as evaluate_rank_indices  # noqa: F401
+from .lookup import rank_mask as evaluate_rank_mask  # noqa: F401
 
 # Public return type: (category, kickers)
 HandScore = Tuple[int, Tuple[int, ...]]
 
+# Single-integer hand strength: class rank 1..7462, higher is better
+HandRank = int
+
 
 # Hand category constants for clarity
 ROYAL_FLUSH = 8
@@ -51,6 +94,13 @@ for high in range(5, 15):
     STRAIGHT_BITMASKS[high] = mask
 
 
+EVALUATOR_BACKEND_ENV = "TEXAS_HOLDEM_EVALUATOR"
+EVALUATOR_BACKENDS = ("python", "lookup")
+
+_backend_name = "python"
+_backend_fn: Callable[[Sequence[Card]], HandScore] | None = None
+
+
 def evaluate_hand(cards: List[Card]) -> Tuple[int, Tuple[int, ...]]:
     """Evaluate a 5-7 card poker hand and return (category, kickers).
 
@@ -73,6 +123,9 @@ def evaluate_hand(cards: List[Card]) -> Tuple[int, Tuple[int, ...]]:
     if not (5 <= len(cards) <= 7):
         raise ValueError(f"Must evaluate 5-7 cards, got {len(cards)}")
 
+    if _backend_fn is not None:
+        return _backend_fn(cards)
+
     # For 6-7 cards, find best 5-card hand
     if len(cards) == 5:
         return _evaluate_5(cards)
@@ -284,7 +337,53 @@ def _collect_high_cards(
     return collected
 
 
+def evaluate_rank(cards: Sequence[Card]) -> HandRank:
+    """Evaluate 5-7 cards to a single comparable integer.
+
+    Args:
+        cards: List of 5-7 Card objects
+
+    Returns:
+        Hand-class rank 1..7462 (higher is better); ``decode_rank`` turns it
+        back into the ``(category, kickers)`` of ``evaluate_hand``
+
+    Raises:
+        ValueError: If cards list has wrong length
+    """
+    if not (5 <= len(cards) <= 7):
+        raise ValueError(f"Must evaluate 5-7 cards, got {len(cards)}")
+    return lookup.rank_cards(cards)
+
+
 # Convenience function matching roadmap naming
 def evaluate_7(cards: List[Card]) -> Tuple[int, Tuple[int, ...]]:
     """Alias for evaluate_hand to match roadmap documentation."""
     return evaluate_hand(cards)
+
+
+def set_evaluator_backend(name: str) -> None:
+    """Select the backend used by ``evaluate_hand``.
+
+    Args:
+        name: One of ``EVALUATOR_BACKENDS``
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    global _backend_name, _backend_fn
+
+    if name not in EVALUATOR_BACKENDS:
+        raise ValueError(
+            f"Unknown evaluator backend: {name} (must be one of {EVALUATOR_BACKENDS})"
+        )
+
+    _backend_fn = lookup.evaluate_lookup if name == "lookup" else None
+    _backend_name = name
+
+
+def get_evaluator_backend() -> str:
+    """Return the name of the active evaluator backend."""
+    return _backend_name
+
+
+set_evaluator_backend(os.environ.get(EVALUATOR_BACKEND_ENV, "python"))
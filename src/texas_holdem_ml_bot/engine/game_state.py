@@ -8,7 +8,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from .cards import Card
+from .cards import Card, Deck
 from .rules import BLIND_STRUCTURE, Street
 
 
@@ -21,12 +21,19 @@ class PlayerState:
         in_hand: Whether player is still in the hand (not folded)
         bet: Current bet amount in this betting round
         position: Player position (0=button, 1=SB, 2=BB, etc.)
+        committed: Chips put into the pot this hand, over all streets
+            (what side pots are built from, see ``showdown.build_pots``)
+        acted: Whether the player has acted in the current betting round
+            (decides if a short all-in lets them raise again, see
+            ``simulator``)
     """
 
     stack: int
     in_hand: bool = True
     bet: int = 0
     position: Optional[int] = None
+    committed: int = 0
+    acted: bool = False
 
     def __post_init__(self) -> None:
         """Validate player state."""
@@ -34,6 +41,8 @@ class PlayerState:
             raise ValueError(f"Stack cannot be negative: {self.stack}")
         if self.bet < 0:
             raise ValueError(f"Bet cannot be negative: {self.bet}")
+        if self.committed < 0:
+            raise ValueError(f"Committed chips cannot be negative: {self.committed}")
 
 
 @dataclass(slots=True)
@@ -48,6 +57,16 @@ class GameState:
         pot: Total chips in the pot
         to_act: Index of player to act next (None if action closed)
         current_bet: Highest bet in current round
+        min_raise: Smallest legal raise increment in the current round
+        pending: Players still to act before the current round closes
+        num_raises: Bets and raises made in the current round (blinds do
+            not count)
+        deck: Deck that later streets are dealt from (see ``simulator``)
+
+    ``num_in_hand`` and ``num_can_act`` (players in the hand, and those of
+    them with chips behind) are counted from ``players`` on construction and
+    then kept up to date by ``simulator.apply``, so the hot path never
+    rebuilds ``active_players``.
     """
 
     players: List[PlayerState]
@@ -57,6 +76,12 @@ class GameState:
     pot: int = 0
     to_act: Optional[int] = None
     current_bet: int = 0
+    min_raise: int = 0
+    pending: int = 0
+    num_raises: int = 0
+    deck: Optional[Deck] = None
+    num_in_hand: int = field(init=False, default=0)
+    num_can_act: int = field(init=False, default=0)
 
     def __post_init__(self) -> None:
         """Validate game state."""
@@ -68,6 +93,12 @@ class GameState:
             raise ValueError(
                 f"Board cannot have more than 5 cards, got {len(self.board)}"
             )
+        self.recount()
+
+    def recount(self) -> None:
+        """Recompute ``num_in_hand`` and ``num_can_act`` from ``players``."""
+        self.num_in_hand = sum(1 for p in self.players if p.in_hand)
+        self.num_can_act = sum(1 for p in self.players if p.in_hand and p.stack > 0)
 
     def post_blinds(self) -> None:
         """Post small blind and big blind, set action to player after BB.
@@ -95,12 +126,14 @@ class GameState:
         sb_amount = min(self.players[sb_idx].stack, BLIND_STRUCTURE["small_blind"])
         self.players[sb_idx].stack -= sb_amount
         self.players[sb_idx].bet += sb_amount
+        self.players[sb_idx].committed += sb_amount
         self.pot += sb_amount
 
         # Post big blind
         bb_amount = min(self.players[bb_idx].stack, BLIND_STRUCTURE["big_blind"])
         self.players[bb_idx].stack -= bb_amount
         self.players[bb_idx].bet += bb_amount
+        self.players[bb_idx].committed += bb_amount
         self.pot += bb_amount
 
         # Set current bet to BB
@@ -0,0 +1,316 @@
+"""Heads-up betting tree of an abstracted game, as flat arrays.
+
+``build_tree`` walks every betting sequence of a heads-up hand in which
+both players choose only among ``ActionAbstraction`` actions, using the
+simulator's rules (blinds from ``rules.BLIND_STRUCTURE``, streets from
+``rules.Street``). One object per node would not fit in memory for a
+useful abstraction, so the tree is stored column-wise in a ``GameTree``:
+one NumPy array per field, indexed by node.
+
+Nodes are numbered depth first, but the children of a node are always
+given consecutive indices when it is expanded, so ``first_child`` and
+``num_children`` locate them without any per-node lists. Card deals are
+implicit: a child on a later street than its parent follows the deal of
+that street. Every decision node is one betting history, and with the
+actor's private cards (or card bucket) that is an information set, so
+decision nodes get contiguous information-set indices in node order;
+``action_offsets`` then lays out one slot per infoset action for flat
+regret and strategy arrays.
+
+``save_tree`` writes one ``.npy`` file per array and ``load_tree``
+memory-maps them back, so solver processes share a tree without copying
+it.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from ..utils.storage import save_npy_atomic
+from .abstraction import ActionAbstraction
+from .cards import Action, Deck, PlayerAction
+from .game_state import GameState, PlayerState
+from .rules import Street
+from .simulator import BIG_BLIND, start_hand
+from .table_batch import ACTIONS
+from .undo import UndoLog
+
+# Terminal types
+NOT_TERMINAL, FOLD_TERMINAL, SHOWDOWN_TERMINAL = range(3)
+
+# Largest tree build_tree will allocate by default
+DEFAULT_MAX_NODES = 50_000_000
+
+STREETS = tuple(Street)
+
+_ACTION_CODE = {action: code for code, action in enumerate(ACTIONS)}
+_STREET_CODE = {street: code for code, street in enumerate(STREETS)}
+
+
+@dataclass(frozen=True, slots=True)
+class GameTree:
+    """Column-wise heads-up betting tree; node 0 is the root.
+
+    Args:
+        parent: ``(n,)`` int32 parent node, -1 at the root
+        first_child: ``(n,)`` int32 index of the first child, -1 at leaves
+        num_children: ``(n,)`` int16 number of children (consecutive nodes)
+        actor: ``(n,)`` int8 seat to act, -1 at terminals
+        street: ``(n,)`` int8 street code (index into ``STREETS``)
+        action: ``(n,)`` int8 code (see ``table_batch.ACTIONS``) of the
+            action leading to the node, -1 at the root
+        amount: ``(n,)`` int32 bet/raise total of that action, else 0
+        pot: ``(n,)`` int32 chips in the pot
+        committed: ``(n, 2)`` int32 chips each seat has put in the hand
+        terminal: ``(n,)`` int8 ``NOT_TERMINAL``, ``FOLD_TERMINAL`` or
+            ``SHOWDOWN_TERMINAL``
+        infoset: ``(n,)`` int32 information-set index of decision nodes,
+            -1 at terminals
+        stack: Starting stack of both seats
+    """
+
+    parent: np.ndarray
+    first_child: np.ndarray
+    num_children: np.ndarray
+    actor: np.ndarray
+    street: np.ndarray
+    action: np.ndarray
+    amount: np.ndarray
+    pot: np.ndarray
+    committed: np.ndarray
+    terminal: np.ndarray
+    infoset: np.ndarray
+    stack: int
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.parent)
+
+    @property
+    def num_infosets(self) -> int:
+        """Number of decision nodes."""
+        return int(np.count_nonzero(self.terminal == NOT_TERMINAL))
+
+    @property
+    def infoset_nodes(self) -> np.ndarray:
+        """``(num_infosets,)`` node of each information set."""
+        return np.flatnonzero(self.terminal == NOT_TERMINAL)
+
+    @property
+    def action_offsets(self) -> np.ndarray:
+        """Start of each infoset's actions in a flat per-action array.
+
+        ``(num_infosets + 1,)``; the actions of an infoset are the children
+        of its node, in order.
+        """
+        counts = self.num_children[self.infoset_nodes]
+        return np.concatenate([[0], np.cumsum(counts, dtype=np.int64)])
+
+    def children(self, node: int) -> range:
+        """Return the child nodes of ``node``."""
+        first = int(self.first_child[node])
+        return range(first, first + int(self.num_children[node]))
+
+    def history(self, node: int) -> List[PlayerAction]:
+        """Return the actions leading from the root to ``node``."""
+        actions = []
+        while self.parent[node] >= 0:
+            kind = ACTIONS[self.action[node]]
+            sized = kind is Action.BET or kind is Action.RAISE
+            actions.append(PlayerAction(kind, int(self.amount[node]) if sized else 0))
+            node = int(self.parent[node])
+        actions.reverse()
+        return actions
+
+
+# Array fields of GameTree with their dtypes (one .npy file each)
+_ARRAY_DTYPES = {
+    "parent": np.int32,
+    "first_child": np.int32,
+    "num_children": np.int16,
+    "actor": np.int8,
+    "street": np.int8,
+    "action": np.int8,
+    "amount": np.int32,
+    "pot": np.int32,
+    "committed": np.int32,
+    "terminal": np.int8,
+    "infoset": np.int32,
+}
+
+
+class _TreeBuilder:
+    """Depth-first walk that appends nodes to typed columns."""
+
+    __slots__ = (
+        "abstraction",
+        "log",
+        "max_nodes",
+        "parent",
+        "first_child",
+        "num_children",
+        "actor",
+        "street",
+        "action",
+        "amount",
+        "pot",
+        "committed",
+        "terminal",
+    )
+
+    def __init__(
+        self, abstraction: ActionAbstraction, state: GameState, max_nodes: int
+    ) -> None:
+        self.abstraction = abstraction
+        self.log = UndoLog(state)
+        self.max_nodes = max_nodes
+        self.parent = array("i")
+        self.first_child = array("i")
+        self.num_children = array("h")
+        self.actor = array("b")
+        self.street = array("b")
+        self.action = array("b")
+        self.amount = array("i")
+        self.pot = array("i")
+        self.committed = array("i")
+        self.terminal = array("b")
+
+    def add(self, parent: int, action: Optional[PlayerAction]) -> int:
+        """Append a node reached by ``action`` (state not yet recorded)."""
+        node = len(self.parent)
+        self.parent.append(parent)
+        self.first_child.append(-1)
+        self.num_children.append(0)
+        self.action.append(-1 if action is None else _ACTION_CODE[action.action])
+        self.amount.append(0 if action is None else action.amount)
+        for column in (self.actor, self.street, self.pot, self.terminal):
+            column.append(0)
+        self.committed.extend((0, 0))
+        return node
+
+    def record(self, node: int) -> None:
+        """Fill the state-derived fields of ``node`` from the current state."""
+        state = self.log.state
+        seat = state.to_act
+        self.actor[node] = -1 if seat is None else seat
+        self.street[node] = _STREET_CODE[state.street]
+        self.pot[node] = state.pot
+        self.committed[2 * node] = state.players[0].committed
+        self.committed[2 * node + 1] = state.players[1].committed
+        if seat is None:
+            self.terminal[node] = (
+                FOLD_TERMINAL if state.num_in_hand == 1 else SHOWDOWN_TERMINAL
+            )
+
+    def expand(self, node: int) -> None:
+        """Add the subtree below ``node``, whose state is current."""
+        state = self.log.state
+        if state.to_act is None:
+            return
+        actions = self.abstraction.actions(state)
+        first = len(self.parent)
+        if first + len(actions) > self.max_nodes:
+            raise ValueError(f"Game tree exceeds max_nodes={self.max_nodes}")
+        self.first_child[node] = first
+        self.num_children[node] = len(actions)
+        for action in actions:
+            self.add(node, action)
+        for child, action in enumerate(actions, start=first):
+            self.log.make(action)
+            self.record(child)
+            self.expand(child)
+            self.log.unmake()
+
+
+def build_tree(
+    abstraction: Optional[ActionAbstraction] = None,
+    *,
+    stack: int = 100 * BIG_BLIND,
+    max_nodes: int = DEFAULT_MAX_NODES,
+) -> GameTree:
+    """Build the heads-up betting tree of an abstracted game.
+
+    Seat 0 is the button and posts the small blind; both seats start with
+    ``stack`` chips.
+
+    Args:
+        abstraction: Actions available at every node (default
+            ``ActionAbstraction()``)
+        stack: Starting stack of both seats
+        max_nodes: Largest number of nodes to allocate
+
+    Returns:
+        The tree as flat arrays
+
+    Raises:
+        ValueError: If the tree has more than ``max_nodes`` nodes
+    """
+    abstraction = abstraction if abstraction is not None else ActionAbstraction()
+    state = GameState(players=[PlayerState(stack), PlayerState(stack)], button=0)
+    # The deck only feeds board cards the betting tree never looks at
+    start_hand(state, Deck(seed=0))
+    builder = _TreeBuilder(abstraction, state, max_nodes)
+    root = builder.add(-1, None)
+    builder.record(root)
+    builder.expand(root)
+
+    columns = {
+        name: np.frombuffer(getattr(builder, name), dtype=dtype).copy()
+        for name, dtype in _ARRAY_DTYPES.items()
+        if name != "infoset"
+    }
+    columns["committed"] = columns["committed"].reshape(-1, 2)
+    decision = columns["terminal"] == NOT_TERMINAL
+    infoset = np.where(decision, np.cumsum(decision) - 1, -1).astype(np.int32)
+    return GameTree(**columns, infoset=infoset, stack=stack)
+
+
+def save_tree(tree: GameTree, directory: Path | str) -> Path:
+    """Write a tree as one ``.npy`` file per array.
+
+    Args:
+        tree: Tree to store
+        directory: Destination directory (created if missing)
+
+    Returns:
+        The directory the tree was written to
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in _ARRAY_DTYPES:
+        save_npy_atomic(directory / f"{name}.npy", getattr(tree, name))
+    save_npy_atomic(directory / "stack.npy", np.array(tree.stack, dtype=np.int64))
+    return directory
+
+
+def load_tree(directory: Path | str, *, mmap: bool = True) -> GameTree:
+    """Load a tree written by ``save_tree``.
+
+    Args:
+        directory: Directory holding the ``.npy`` files
+        mmap: Memory-map the arrays read-only instead of reading them
+
+    Returns:
+        The stored tree
+
+    Raises:
+        FileNotFoundError: If any array is missing
+    """
+    directory = Path(directory)
+    paths = {name: directory / f"{name}.npy" for name in (*_ARRAY_DTYPES, "stack")}
+    missing = [name for name, path in paths.items() if not path.exists()]
+    if missing:
+        raise FileNotFoundError(
+            f"Game tree in {directory} is missing {', '.join(missing)}"
+        )
+    arrays = {
+        name: np.load(paths[name], mmap_mode="r") if mmap else np.load(paths[name])
+        for name in _ARRAY_DTYPES
+    }
+    return GameTree(**arrays, stack=int(np.load(paths["stack"])))
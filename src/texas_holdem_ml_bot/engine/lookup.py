@@ -0,0 +1,740 @@
+"""Precomputed lookup-table backend for hand evaluation.
+
+The table-driven evaluator replaces per-call list, dict and ``Counter`` work
+with a handful of integer array reads. It relies on two observations:
+
+* Without a flush, a hand's value depends only on the multiset of its ranks.
+  Every multiset of up to 7 ranks (at most 4 of each) is a state in a small
+  state machine; adding a card is one table read, and states with 5-7 cards
+  carry the hand value directly.
+* With at most 7 cards, a flush excludes quads and full houses, so a hand
+  holding 5+ cards of one suit is scored from that suit's 13-bit rank mask.
+
+Values are hand-class ranks: ``1`` is the weakest five-card hand (7-5-4-3-2
+offsuit) and ``7462`` a royal flush. Each rank decodes to the same
+``(category, kickers)`` tuple that :func:`evaluator.evaluate_hand` returns.
+
+Tables are generated once from the reference evaluator, written as ``.npy``
+files under ``data/models`` and memory-mapped read-only on first use, so many
+worker processes share one copy of the pages. Pre-generate them with::
+
+    python -m texas_holdem_ml_bot.engine.lookup
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import combinations_with_replacement
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.paths import MODELS_DIR
+from ..utils.storage import save_npy_atomic
+from .cards import NUM_CARDS, SUITS, Card
+
+if TYPE_CHECKING:
+    from .evaluator import HandScore
+
+TABLE_VERSION = 1
+DEFAULT_TABLE_DIR = MODELS_DIR / f"hand_evaluator_v{TABLE_VERSION}"
+
+NUM_HAND_CLASSES = 7462
+
+# State machine rows hold one next-state offset per rank (2..14 -> 0..12)
+_ROW = 13
+_MAX_CARDS = 7
+
+# Suit counters: 4 bits per suit, each pre-loaded with 3 so that bit 3 of a
+# field is set exactly when that suit holds 5 or more cards.
+_SUIT_COUNT_INIT = 0x3333
+_SUIT_FLUSH_BITS = 0x8888
+_INDEX_SUIT_KEY = tuple(1 << (4 * (index & 3)) for index in range(NUM_CARDS))
+
+_TABLE_FILES = ("rank_next", "rank_values", "flush_values", "hand_classes")
+
+
+@dataclass(frozen=True, slots=True)
+class LookupTables:
+    """Loaded lookup tables.
+
+    Args:
+        rank_next: Flat state machine; ``rank_next[offset + rank_index]`` is
+            the offset (state id * 13) reached by adding a card of that rank
+        rank_values: Hand-class rank per state (0 for fewer than 5 cards)
+        flush_values: Hand-class rank per 13-bit suited rank mask (0 if <5)
+        hand_classes: ``HandScore`` per rank; index 0 is an unused placeholder
+        directory: Directory the tables are mapped from (None if in memory)
+    """
+
+    rank_next: Sequence[int]
+    rank_values: Sequence[int]
+    flush_values: Sequence[int]
+    hand_classes: Tuple[HandScore, ...]
+    directory: Path | None = None
+
+
+_TABLES: LookupTables | None = None
+
+
+# ---------------------------------------------------------------------------
+# Generation
+# ---------------------------------------------------------------------------
+
+
+def _unsuited_cards(rank_indices: Sequence[int]) -> List[Card]:
+    """Build cards for sorted rank indices with no four cards of one suit.
+
+    Cycling suits over the sorted ranks keeps copies of a rank on distinct
+    suits and never puts more than two of seven cards on one suit.
+    """
+    return [Card(r + 2, SUITS[i % 4]) for i, r in enumerate(rank_indices)]
+
+
+def _reference_score(cards: List[Card]) -> HandScore:
+    """Score with the Python evaluator regardless of the active backend."""
+    # Imported lazily: evaluator.py imports this module for its fast paths
+    from .evaluator import _evaluate_5, _evaluate_best_5_fast
+
+    return _evaluate_5(cards) if len(cards) == 5 else _evaluate_best_5_fast(cards)
+
+
+def _enumerate_hand_classes() -> List[HandScore]:
+    """List every distinct five-card ``HandScore`` from weakest to strongest."""
+    scores = set()
+    for combo in combinations_with_replacement(range(13), 5):
+        if combo[0] == combo[4]:
+            continue  # five of a kind
+        scores.add(_reference_score(_unsuited_cards(combo)))
+        if len(set(combo)) == 5:
+            scores.add(_reference_score([Card(r + 2, SUITS[0]) for r in combo]))
+    classes = sorted(scores)
+    if len(classes) != NUM_HAND_CLASSES:
+        raise RuntimeError(f"Expected {NUM_HAND_CLASSES} classes, got {len(classes)}")
+    return classes
+
+
+def generate_tables() -> Dict[str, np.ndarray]:
+    """Compute all lookup tables from the reference evaluator.
+
+    Returns:
+        Mapping of table name to array, as written by :func:`write_tables`
+    """
+    classes = _enumerate_hand_classes()
+    rank_of = {score: i + 1 for i, score in enumerate(classes)}
+
+    # Breadth-first over rank multisets so states are ordered by card count;
+    # only states with fewer than 7 cards need outgoing transitions.
+    states: List[Tuple[int, ...]] = [()]
+    state_ids: Dict[Tuple[int, ...], int] = {(): 0}
+    level: List[Tuple[int, ...]] = [()]
+    for _ in range(_MAX_CARDS):
+        next_level = []
+        for state in level:
+            for rank in range(_ROW):
+                if state.count(rank) == 4:
+                    continue
+                child = tuple(sorted(state + (rank,)))
+                if child not in state_ids:
+                    state_ids[child] = len(states)
+                    states.append(child)
+                    next_level.append(child)
+        level = next_level
+
+    num_inner = sum(1 for state in states if len(state) < _MAX_CARDS)
+    rank_next = np.zeros(num_inner * _ROW, dtype=np.int32)
+    for state_id, state in enumerate(states[:num_inner]):
+        for rank in range(_ROW):
+            if state.count(rank) < 4:
+                child = tuple(sorted(state + (rank,)))
+                rank_next[state_id * _ROW + rank] = state_ids[child] * _ROW
+
+    rank_values = np.zeros(len(states), dtype=np.int16)
+    for state_id, state in enumerate(states):
+        if len(state) >= 5:
+            rank_values[state_id] = rank_of[_reference_score(_unsuited_cards(state))]
+
+    flush_values = np.zeros(1 << _ROW, dtype=np.int16)
+    for mask in range(1 << _ROW):
+        ranks = [r + 2 for r in range(_ROW) if mask >> r & 1]
+        if 5 <= len(ranks) <= _MAX_CARDS:
+            suited = [Card(rank, SUITS[0]) for rank in ranks]
+            flush_values[mask] = rank_of[_reference_score(suited)]
+
+    # Row per class: category followed by up to five kickers, zero padded
+    hand_classes = np.zeros((NUM_HAND_CLASSES, 6), dtype=np.int8)
+    for i, (category, kickers) in enumerate(classes):
+        hand_classes[i, 0] = category
+        hand_classes[i, 1 : 1 + len(kickers)] = kickers
+
+    return {
+        "rank_next": rank_next,
+        "rank_values": rank_values,
+        "flush_values": flush_values,
+        "hand_classes": hand_classes,
+    }
+
+
+def write_tables(directory: Path | str = DEFAULT_TABLE_DIR) -> Path:
+    """Generate the lookup tables and write them as ``.npy`` files.
+
+    Each file is written to a temporary name and atomically renamed, so
+    concurrent workers never observe a partially written table.
+
+    Args:
+        directory: Destination directory (created if missing)
+
+    Returns:
+        The directory the tables were written to
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, array in generate_tables().items():
+        save_npy_atomic(directory / f"{name}.npy", array)
+    return directory
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+
+def _int_view(array: np.ndarray) -> memoryview:
+    """Expose an integer array as a memoryview that indexes to Python ints."""
+    raw = array.data.cast("B")
+    return raw.cast("h") if array.dtype == np.int16 else raw.cast("i")
+
+
+def load_tables(
+    directory: Path | str = DEFAULT_TABLE_DIR, *, generate: bool = True
+) -> LookupTables:
+    """Memory-map the lookup tables, generating them first if missing.
+
+    Args:
+        directory: Directory holding the ``.npy`` table files
+        generate: Write the tables if any file is missing
+
+    Returns:
+        Loaded tables backed by read-only memory maps
+
+    Raises:
+        FileNotFoundError: If tables are missing and ``generate`` is False
+    """
+    directory = Path(directory)
+    paths = {name: directory / f"{name}.npy" for name in _TABLE_FILES}
+    if not all(path.exists() for path in paths.values()):
+        if not generate:
+            raise FileNotFoundError(f"Lookup tables not found in {directory}")
+        write_tables(directory)
+
+    arrays = {name: np.load(path, mmap_mode="r") for name, path in paths.items()}
+    classes: List[HandScore] = [(0, ())]
+    for row in arrays["hand_classes"].tolist():
+        category, kickers = row[0], tuple(k for k in row[1:] if k)
+        classes.append((category, kickers))
+
+    return LookupTables(
+        rank_next=_int_view(arrays["rank_next"]),
+        rank_values=_int_view(arrays["rank_values"]),
+        flush_values=_int_view(arrays["flush_values"]),
+        hand_classes=tuple(classes),
+        directory=directory.resolve(),
+    )
+
+
+def get_tables() -> LookupTables:
+    """Return the process-wide tables, loading them on first use."""
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = load_tables()
+    return _TABLES
+
+
+def use_tables(tables: LookupTables | None) -> None:
+    """Install ``tables`` as the process-wide tables (None to reload lazily)."""
+    global _TABLES
+    _TABLES = tables
+
+
+def shared_table_dir() -> Path:
+    """Return a directory holding the active tables, writing them if needed.
+
+    Worker processes map the tables from this directory with
+    ``attach_tables``; the operating system shares the mapped pages, so
+    nothing is pickled or copied per worker.
+    """
+    tables = get_tables()
+    if tables.directory is None:
+        return write_tables()
+    return tables.directory
+
+
+def attach_tables(directory: Path | str) -> None:
+    """Map the tables in ``directory`` unless they are already active.
+
+    Raises:
+        FileNotFoundError: If the directory holds no tables
+    """
+    directory = Path(directory).resolve()
+    if _TABLES is None or _TABLES.directory != directory:
+        use_tables(load_tables(directory, generate=False))
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+
+def rank_cards(cards: Sequence[Card]) -> int:
+    """Return the hand-class rank (1..7462) of 5-7 cards.
+
+    Args:
+        cards: 5-7 distinct cards (size is checked by the callers)
+
+    Returns:
+        Hand-class rank; higher is stronger
+    """
+    tables = _TABLES or get_tables()
+    rank_next = tables.rank_next
+    suit_key = _INDEX_SUIT_KEY
+
+    state = 0
+    suit_counts = _SUIT_COUNT_INIT
+    for card in cards:
+        index = card.index
+        state = rank_next[state + (index >> 2)]
+        suit_counts += suit_key[index]
+
+    if suit_counts & _SUIT_FLUSH_BITS:
+        suit = ((suit_counts & _SUIT_FLUSH_BITS).bit_length() - 4) // 4
+        mask = 0
+        for card in cards:
+            index = card.index
+            if index & 3 == suit:
+                mask |= 1 << (index >> 2)
+        return tables.flush_values[mask]
+
+    return tables.rank_values[state // _ROW]
+
+
+def rank_indices(indices: Sequence[int]) -> int:
+    """Return the hand-class rank of 5-7 integer-encoded cards.
+
+    Args:
+        indices: 5-7 distinct card indices (0-51, see ``cards.card_to_index``)
+
+    Returns:
+        Hand-class rank (1..7462); higher is stronger
+
+    Raises:
+        ValueError: If the number of cards is not 5-7, an index is outside
+            0-51 or repeated indices form no valid hand (other repeats are
+            not detected)
+    """
+    if not (5 <= len(indices) <= 7):
+        raise ValueError(f"Must evaluate 5-7 cards, got {len(indices)}")
+    if min(indices) < 0 or max(indices) >= NUM_CARDS:
+        raise ValueError(f"Card indices must be 0-{NUM_CARDS - 1}, got {indices}")
+
+    tables = _TABLES or get_tables()
+    rank_next = tables.rank_next
+    suit_key = _INDEX_SUIT_KEY
+
+    state = 0
+    suit_counts = _SUIT_COUNT_INIT
+    for index in indices:
+        state = rank_next[state + (index >> 2)]
+        suit_counts += suit_key[index]
+
+    if suit_counts & _SUIT_FLUSH_BITS:
+        suit = ((suit_counts & _SUIT_FLUSH_BITS).bit_length() - 4) // 4
+        mask = 0
+        for index in indices:
+            if index & 3 == suit:
+                mask |= 1 << (index >> 2)
+        rank = tables.flush_values[mask]
+    else:
+        rank = tables.rank_values[state // _ROW]
+    if not rank:
+        raise ValueError(f"Card indices form no valid hand: {indices}")
+    return rank
+
+
+def rank_mask(mask: int) -> int:
+    """Return the hand-class rank of a 52-bit hand mask holding 5-7 cards.
+
+    Args:
+        mask: Hand mask with bit ``index`` set for each card held
+
+    Returns:
+        Hand-class rank (1..7462); higher is stronger
+
+    Raises:
+        ValueError: If the mask has bits outside the deck or does not hold
+            5-7 cards
+    """
+    if mask < 0 or mask >> NUM_CARDS:
+        raise ValueError(f"Hand mask must only use bits 0-{NUM_CARDS - 1}")
+    count = mask.bit_count()
+    if not (5 <= count <= 7):
+        raise ValueError(f"Must evaluate 5-7 cards, got {count}")
+
+    tables = _TABLES or get_tables()
+    rank_next = tables.rank_next
+    suit_key = _INDEX_SUIT_KEY
+
+    state = 0
+    suit_counts = _SUIT_COUNT_INIT
+    remaining = mask
+    while remaining:
+        low = remaining & -remaining
+        index = low.bit_length() - 1
+        state = rank_next[state + (index >> 2)]
+        suit_counts += suit_key[index]
+        remaining ^= low
+
+    if suit_counts & _SUIT_FLUSH_BITS:
+        suit = ((suit_counts & _SUIT_FLUSH_BITS).bit_length() - 4) // 4
+        flush_mask = 0
+        for rank_index in range(_ROW):
+            if mask >> (4 * rank_index + suit) & 1:
+                flush_mask |= 1 << rank_index
+        return tables.flush_values[flush_mask]
+
+    return tables.rank_values[state // _ROW]
+
+
+def decode_rank(rank: int) -> HandScore:
+    """Map a hand-class rank (1..7462) back to its ``(category, kickers)``.
+
+    Raises:
+        ValueError: If rank is outside 1..7462
+    """
+    if not (1 <= rank <= NUM_HAND_CLASSES):
+        raise ValueError(f"Invalid hand rank: {rank} (must be 1-{NUM_HAND_CLASSES})")
+    return (_TABLES or get_tables()).hand_classes[rank]
+
+
+def evaluate_lookup(cards: Sequence[Card]) -> HandScore:
+    """Evaluate 5-7 cards with the lookup tables.
+
+    Args:
+        cards: 5-7 distinct cards
+
+    Returns:
+        ``(category, kickers)`` identical to the reference evaluator
+    """
+    return (_TABLES or get_tables()).hand_classes[rank_cards(cards)]
+
+
+def evaluate_indices(indices: Sequence[int]) -> HandScore:
+    """Evaluate 5-7 integer-encoded cards without building ``Card`` objects.
+
+    Args:
+        indices: 5-7 distinct card indices (0-51, see ``cards.card_to_index``)
+
+    Returns:
+        ``(category, kickers)`` identical to the reference evaluator
+
+    Raises:
+        ValueError: If the number of cards is not 5-7, an index is outside
+            0-51 or repeated indices form no valid hand (other repeats are
+            not detected)
+    """
+    return (_TABLES or get_tables()).hand_classes[rank_indices(indices)]
+
+
+def evaluate_mask(mask: int) -> HandScore:
+    """Evaluate a 52-bit hand mask holding 5-7 cards.
+
+    Args:
+        mask: Hand mask with bit ``index`` set for each card held
+
+    Returns:
+        ``(category, kickers)`` identical to the reference evaluator
+
+    Raises:
+        ValueError: If the mask has bits outside the deck or does not hold
+            5-7 cards
+    """
+    return (_TABLES or get_tables()).hand_classes[rank_mask(mask)]
+
+
+def evaluate_batch(cards: np.ndarray) -> np.ndarray:
+    """Score a batch of hands with vectorized table reads.
+
+    Each row is one hand of integer-encoded cards; all rows are scored with
+    a fixed number of array operations, independent of the batch size.
+
+    Args:
+        cards: Integer array of shape ``(N, k)`` with ``5 <= k <= 7`` and
+            distinct card indices (0-51) within each row
+
+    Returns:
+        ``int32`` array of shape ``(N,)`` holding each hand's class rank
+        (1..7462, higher is stronger). ``LookupTables.hand_classes`` maps a
+        rank back to the ``(category, kickers)`` of ``evaluate_hand``.
+
+    Raises:
+        ValueError: If the array shape or card indices are invalid
+    """
+    cards = np.asarray(cards)
+    if cards.ndim != 2 or not (5 <= cards.shape[1] <= 7):
+        raise ValueError(f"Must evaluate an (N, 5-7) card array, got {cards.shape}")
+    if cards.size and (cards.min() < 0 or cards.max() >= NUM_CARDS):
+        raise ValueError("Card indices must be in 0-51")
+
+    tables = _TABLES or get_tables()
+    rank_next = np.asarray(tables.rank_next)
+    # Column-major copy: one contiguous row of N cards per hand position
+    columns = np.ascontiguousarray(cards.T, dtype=np.intp)
+    rank_index = columns >> 2
+    suit_index = columns & 3
+
+    state = np.zeros(len(cards), dtype=np.intp)
+    for ranks in rank_index:
+        state = rank_next[state + ranks]
+    scores = np.asarray(tables.rank_values)[state // _ROW].astype(np.int32)
+
+    suit_counts = (1 << (suit_index << 2)).sum(axis=0) + _SUIT_COUNT_INIT
+    flush_bits = suit_counts & _SUIT_FLUSH_BITS
+    flushed = np.flatnonzero(flush_bits)
+    if flushed.size:
+        # Bit 3, 7, 11 or 15 marks the flush suit; at most one per hand
+        flush_suit = np.log2(flush_bits[flushed]).astype(np.intp) // 4
+        in_suit = suit_index[:, flushed] == flush_suit
+        masks = np.where(in_suit, 1 << rank_index[:, flushed], 0).sum(axis=0)
+        scores[flushed] = np.asarray(tables.flush_values)[masks]
+
+    return scores
+
+
+# ---------------------------------------------------------------------------
+# Board-conditioned evaluation
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class BoardContext:
+    """Pre-aggregated community cards for scoring many hole-card pairs.
+
+    The board's state-machine offset, suit counters and per-suit rank masks
+    are computed once; scoring a hole pair then costs two table reads plus a
+    flush check. ``deal`` extends the board by one card (flop -> turn ->
+    river) from the existing aggregates instead of starting over. Contexts
+    are immutable, so one flop context can be shared by every turn dealt
+    from it.
+
+    Args:
+        cards: Board card indices in deal order (0-5 cards)
+        mask: 52-bit mask of the board cards
+        state: State-machine offset after the board ranks
+        suit_counts: Packed suit counters (see ``_SUIT_COUNT_INIT``)
+        suit_masks: 13-bit rank mask of the board cards in each suit
+    """
+
+    cards: Tuple[int, ...] = ()
+    mask: int = 0
+    state: int = 0
+    suit_counts: int = _SUIT_COUNT_INIT
+    suit_masks: Tuple[int, int, int, int] = (0, 0, 0, 0)
+
+    @classmethod
+    def from_indices(cls, indices: Sequence[int]) -> BoardContext:
+        """Build a context from 0-5 board card indices in one pass.
+
+        Raises:
+            ValueError: If the board is too large or holds invalid cards
+        """
+        if len(indices) > 5:
+            raise ValueError("Board cannot have more than 5 cards")
+
+        rank_next = (_TABLES or get_tables()).rank_next
+        mask = 0
+        state = 0
+        suit_counts = _SUIT_COUNT_INIT
+        suit_masks = [0, 0, 0, 0]
+        for index in indices:
+            if not (0 <= index < NUM_CARDS):
+                raise ValueError(f"Invalid card index: {index} (must be 0-51)")
+            if mask >> index & 1:
+                raise ValueError(f"Card index {index} is already on the board")
+            mask |= 1 << index
+            state = rank_next[state + (index >> 2)]
+            suit_counts += _INDEX_SUIT_KEY[index]
+            suit_masks[index & 3] |= 1 << (index >> 2)
+
+        return cls(
+            cards=tuple(indices),
+            mask=mask,
+            state=state,
+            suit_counts=suit_counts,
+            suit_masks=(suit_masks[0], suit_masks[1], suit_masks[2], suit_masks[3]),
+        )
+
+    @classmethod
+    def from_cards(cls, cards: Sequence[Card]) -> BoardContext:
+        """Build a context from 0-5 board ``Card`` objects."""
+        return cls.from_indices([card.index for card in cards])
+
+    def deal(self, index: int) -> BoardContext:
+        """Return a new context with one more board card.
+
+        Raises:
+            ValueError: If the board is full or the card is invalid or dealt
+        """
+        if len(self.cards) >= 5:
+            raise ValueError("Board cannot have more than 5 cards")
+        if not (0 <= index < NUM_CARDS):
+            raise ValueError(f"Invalid card index: {index} (must be 0-51)")
+        if self.mask >> index & 1:
+            raise ValueError(f"Card index {index} is already on the board")
+
+        rank_next = (_TABLES or get_tables()).rank_next
+        suit_masks = list(self.suit_masks)
+        suit_masks[index & 3] |= 1 << (index >> 2)
+        return BoardContext(
+            cards=self.cards + (index,),
+            mask=self.mask | 1 << index,
+            state=rank_next[self.state + (index >> 2)],
+            suit_counts=self.suit_counts + _INDEX_SUIT_KEY[index],
+            suit_masks=(suit_masks[0], suit_masks[1], suit_masks[2], suit_masks[3]),
+        )
+
+    def rank(self, first: int, second: int) -> int:
+        """Return the hand-class rank of the board plus two hole cards.
+
+        The caller guarantees that the hole cards are distinct, absent from
+        the board, and that the board holds at least 3 cards.
+
+        Args:
+            first: Index of the first hole card
+            second: Index of the second hole card
+
+        Returns:
+            Hand-class rank (1..7462); higher is stronger
+        """
+        tables = _TABLES or get_tables()
+        rank_next = tables.rank_next
+        suit_counts = (
+            self.suit_counts + _INDEX_SUIT_KEY[first] + _INDEX_SUIT_KEY[second]
+        )
+        if suit_counts & _SUIT_FLUSH_BITS:
+            suit = ((suit_counts & _SUIT_FLUSH_BITS).bit_length() - 4) // 4
+            mask = self.suit_masks[suit]
+            if first & 3 == suit:
+                mask |= 1 << (first >> 2)
+            if second & 3 == suit:
+                mask |= 1 << (second >> 2)
+            return tables.flush_values[mask]
+
+        state = rank_next[rank_next[self.state + (first >> 2)] + (second >> 2)]
+        return tables.rank_values[state // _ROW]
+
+    def evaluate(self, first: int, second: int) -> HandScore:
+        """Return the ``(category, kickers)`` of the board plus two hole cards."""
+        return (_TABLES or get_tables()).hand_classes[self.rank(first, second)]
+
+    def rank_many(self, holes: np.ndarray) -> np.ndarray:
+        """Score many hole-card pairs against this board at once.
+
+        Args:
+            holes: Integer array of shape ``(M, 2)`` of hole card indices;
+                rows must not share cards with the board
+
+        Returns:
+            ``int32`` array of shape ``(M,)`` with each pair's class rank
+
+        Raises:
+            ValueError: If the board has fewer than 3 cards or the array
+                shape is invalid
+        """
+        if len(self.cards) < 3:
+            raise ValueError(f"Need at least 3 board cards, got {len(self.cards)}")
+        holes = np.asarray(holes, dtype=np.intp)
+        if holes.ndim != 2 or holes.shape[1] != 2:
+            raise ValueError(f"Hole cards must have shape (M, 2), got {holes.shape}")
+
+        tables = _TABLES or get_tables()
+        rank_next = np.asarray(tables.rank_next)
+        first, second = holes[:, 0], holes[:, 1]
+
+        state = rank_next[rank_next[self.state + (first >> 2)] + (second >> 2)]
+        scores = np.asarray(tables.rank_values)[state // _ROW].astype(np.int32)
+
+        suit_counts = (
+            self.suit_counts + (1 << ((first & 3) << 2)) + (1 << ((second & 3) << 2))
+        )
+        flush_bits = suit_counts & _SUIT_FLUSH_BITS
+        flushed = np.flatnonzero(flush_bits)
+        if flushed.size:
+            suit = np.log2(flush_bits[flushed]).astype(np.intp) // 4
+            masks = np.array(self.suit_masks, dtype=np.intp)[suit]
+            for hole in (first[flushed], second[flushed]):
+                masks = masks | np.where((hole & 3) == suit, 1 << (hole >> 2), 0)
+            scores[flushed] = np.asarray(tables.flush_values)[masks]
+        return scores
+
+
+def rank_boards(boards: np.ndarray, holes: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Score hole-card pairs against many boards, aggregating each board once.
+
+    The vectorized counterpart of building one ``BoardContext`` per board:
+    every board's state-machine offset and suit summary is computed once,
+    then each pair costs two table steps plus a flush check.
+
+    Args:
+        boards: Integer array of shape ``(B, k)`` with ``3 <= k <= 5``
+        holes: Integer array of shape ``(N, 2)`` of hole card indices
+        rows: Integer array of shape ``(N,)`` naming each pair's board row;
+            pairs must not share cards with their board
+
+    Returns:
+        ``int32`` array of shape ``(N,)`` with each pair's class rank
+
+    Raises:
+        ValueError: If the array shapes are invalid
+    """
+    boards = np.asarray(boards, dtype=np.intp)
+    holes = np.asarray(holes, dtype=np.intp)
+    rows = np.asarray(rows, dtype=np.intp)
+    if boards.ndim != 2 or not (3 <= boards.shape[1] <= 5):
+        raise ValueError(f"Boards must have shape (B, 3-5), got {boards.shape}")
+    if holes.ndim != 2 or holes.shape[1] != 2:
+        raise ValueError(f"Hole cards must have shape (N, 2), got {holes.shape}")
+    if rows.shape != (len(holes),):
+        raise ValueError(f"Need one board row per pair, got shape {rows.shape}")
+
+    tables = _TABLES or get_tables()
+    rank_next = np.asarray(tables.rank_next)
+
+    # Per board: state offset, suit counters and per-suit rank masks
+    board_state = np.zeros(len(boards), dtype=np.intp)
+    for column in boards.T:
+        board_state = rank_next[board_state + (column >> 2)]
+    board_suits = (1 << ((boards & 3) << 2)).sum(axis=1) + _SUIT_COUNT_INIT
+    suit_masks = np.zeros((len(boards), 4), dtype=np.intp)
+    for column in boards.T:
+        suit_masks[np.arange(len(boards)), column & 3] |= 1 << (column >> 2)
+
+    first, second = holes[:, 0], holes[:, 1]
+    state = rank_next[rank_next[board_state[rows] + (first >> 2)] + (second >> 2)]
+    scores = np.asarray(tables.rank_values)[state // _ROW].astype(np.int32)
+
+    suit_counts = (
+        board_suits[rows] + (1 << ((first & 3) << 2)) + (1 << ((second & 3) << 2))
+    )
+    flush_bits = suit_counts & _SUIT_FLUSH_BITS
+    flushed = np.flatnonzero(flush_bits)
+    if flushed.size:
+        suit = np.log2(flush_bits[flushed]).astype(np.intp) // 4
+        masks = suit_masks[rows[flushed], suit]
+        for hole in (first[flushed], second[flushed]):
+            masks = masks | np.where((hole & 3) == suit, 1 << (hole >> 2), 0)
+        scores[flushed] = np.asarray(tables.flush_values)[masks]
+    return scores
+
+
+if __name__ == "__main__":
+    print(f"Wrote lookup tables to {write_tables()}")
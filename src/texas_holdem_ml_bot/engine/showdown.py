@@ -0,0 +1,295 @@
+"""Showdown resolution for Texas Hold'em.
+
+Scores every live player's hand against a shared board and splits the pot.
+The board is aggregated once into a ``BoardContext`` and each player then
+costs a single two-card lookup, so a 9-handed showdown stays cheap enough for
+the per-hand simulation hot path.
+
+When players are all-in for different amounts, ``build_pots`` splits the
+chips into a main pot and side pots from each seat's ``committed`` chips in
+one sorted pass, and ``award_pots`` pays every pot from a single ranking of
+the live hands, so each extra all-in adds a pot but never another hand
+evaluation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .cards import Card
+from .evaluator import HandScore
+from .game_state import GameState
+from .lookup import BoardContext, decode_rank
+
+# Hole cards per seat, aligned with GameState.players (None for unknown/mucked)
+HoleCards = Sequence[Optional[Sequence[Card]]]
+
+
+@dataclass(frozen=True, slots=True)
+class Pot:
+    """A main or side pot.
+
+    Args:
+        amount: Chips in the pot
+        eligible: Live seats that can win it, in seat order
+    """
+
+    amount: int
+    eligible: Tuple[int, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ShowdownResult:
+    """Outcome of a showdown.
+
+    Args:
+        winners: Seats sharing the main pot, in odd-chip order (left of button)
+        payouts: Chips awarded per seat, aligned with ``GameState.players``
+        ranks: Hand-class rank (1..7462) per live seat that was evaluated
+        standings: Live seats grouped by equal hands, strongest group first
+        pots: Main pot followed by the side pots
+        pot_winners: Seats sharing each pot, in odd-chip order
+    """
+
+    winners: Tuple[int, ...]
+    payouts: Tuple[int, ...]
+    ranks: Dict[int, int]
+    standings: Tuple[Tuple[int, ...], ...]
+    pots: Tuple[Pot, ...] = ()
+    pot_winners: Tuple[Tuple[int, ...], ...] = ()
+
+    @property
+    def is_split(self) -> bool:
+        """Whether the main pot is shared by more than one player."""
+        return len(self.winners) > 1
+
+    def hand(self, seat: int) -> HandScore:
+        """Return the ``(category, kickers)`` a seat showed down."""
+        return decode_rank(self.ranks[seat])
+
+
+def seats_from_button(button: int, num_players: int) -> List[int]:
+    """List seats clockwise starting with the first seat left of the button."""
+    return [(button + offset) % num_players for offset in range(1, num_players + 1)]
+
+
+def split_pot(amount: int, winners: Sequence[int], num_players: int) -> List[int]:
+    """Split chips evenly between winners, odd chips going to the first ones.
+
+    Args:
+        amount: Chips to distribute
+        winners: Winning seats in odd-chip priority order
+        num_players: Number of seats at the table
+
+    Returns:
+        Chips awarded per seat
+    """
+    payouts = [0] * num_players
+    share, odd_chips = divmod(amount, len(winners))
+    for position, seat in enumerate(winners):
+        payouts[seat] = share + (1 if position < odd_chips else 0)
+    return payouts
+
+
+def build_pots(
+    contributions: Sequence[int], live: Sequence[bool], uncounted: int = 0
+) -> List[Pot]:
+    """Split the chips of a hand into a main pot and side pots.
+
+    Seats are sorted by contribution once. Each contribution level adds a
+    layer of ``(level - previous level)`` chips from every seat that put in
+    at least that much, which the live seats at or above the level can win.
+    A layer joins the pot below it while no live seat has dropped out, so
+    levels reached only by folded seats add no pot, and chips above the
+    last live seat's level (dead money) go to the top pot.
+
+    Args:
+        contributions: Chips each seat put in this hand
+        live: Whether each seat is still in the hand
+        uncounted: Chips in the pot not covered by ``contributions`` (a
+            state built without them); they go to a main pot for every
+            live seat
+
+    Returns:
+        Pots from the main pot up (empty if there are no chips)
+
+    Raises:
+        ValueError: If the lengths differ, a contribution is negative, or no
+            seat is live
+    """
+    num_players = len(contributions)
+    if len(live) != num_players:
+        raise ValueError(f"Expected {num_players} live flags, got {len(live)}")
+    order = sorted(range(num_players), key=contributions.__getitem__)
+    if num_players and contributions[order[0]] < 0:
+        raise ValueError(f"Contributions cannot be negative: {list(contributions)}")
+    if not any(live):
+        raise ValueError("No live players to award the pot to")
+
+    amounts: List[int] = []
+    eligibles: List[Tuple[int, ...]] = []
+    if uncounted:
+        eligibles.append(tuple(seat for seat in range(num_players) if live[seat]))
+        amounts.append(uncounted)
+    # Whether a live seat dropped out since the top pot was opened
+    dropped = False
+    previous = 0
+    for position, seat in enumerate(order):
+        level = contributions[seat]
+        if level > previous:
+            amount = (level - previous) * (num_players - position)
+            previous = level
+            eligible: Tuple[int, ...] = ()
+            if dropped or not amounts:
+                eligible = tuple(sorted(s for s in order[position:] if live[s]))
+                if not amounts and not eligible:
+                    # Only live seats that put nothing in are left to win it
+                    eligible = tuple(s for s in range(num_players) if live[s])
+            if eligible:
+                eligibles.append(eligible)
+                amounts.append(amount)
+                dropped = False
+            elif amounts:
+                amounts[-1] += amount
+        if live[seat]:
+            dropped = True
+
+    return [Pot(amount, eligible) for amount, eligible in zip(amounts, eligibles)]
+
+
+def rank_standings(
+    ranks: Dict[int, int], order: Sequence[int]
+) -> Tuple[Tuple[int, ...], ...]:
+    """Group ranked seats by equal hands, strongest group first.
+
+    Args:
+        ranks: Hand rank per live seat (higher is better)
+        order: Seats in odd-chip order; groups keep this order
+
+    Returns:
+        Tuples of seats holding equal hands
+    """
+    groups: Dict[int, List[int]] = {}
+    for seat in order:
+        rank = ranks.get(seat)
+        if rank is not None:
+            groups.setdefault(rank, []).append(seat)
+    return tuple(tuple(groups[rank]) for rank in sorted(groups, reverse=True))
+
+
+def award_pots(
+    pots: Sequence[Pot],
+    standings: Sequence[Sequence[int]],
+    num_players: int,
+) -> Tuple[List[int], List[Tuple[int, ...]]]:
+    """Pay every pot to the best eligible hands.
+
+    Each pot walks the standings from the top and stops at the first group
+    with an eligible seat, so no hand is compared twice.
+
+    Args:
+        pots: Pots as returned by ``build_pots``
+        standings: Live seats grouped by equal hands, strongest group first,
+            each group in odd-chip order (see ``rank_standings``)
+        num_players: Number of seats at the table
+
+    Returns:
+        ``(chips awarded per seat, winners of each pot)``
+    """
+    payouts = [0] * num_players
+    pot_winners: List[Tuple[int, ...]] = []
+    for pot in pots:
+        eligible = pot.eligible
+        winners: Tuple[int, ...] = ()
+        for group in standings:
+            winners = tuple(seat for seat in group if seat in eligible)
+            if winners:
+                break
+        share, odd_chips = divmod(pot.amount, len(winners))
+        for position, seat in enumerate(winners):
+            payouts[seat] += share + (1 if position < odd_chips else 0)
+        pot_winners.append(winners)
+    return payouts, pot_winners
+
+
+def resolve_showdown(state: GameState, hole_cards: HoleCards) -> ShowdownResult:
+    """Rank all live players against the board and split the pots.
+
+    Side pots are built from each player's ``committed`` chips; a state
+    that records none (or fewer chips than its pot) has the rest awarded as
+    a main pot to every live player. A lone remaining player wins
+    uncontested without needing hole cards.
+
+    Args:
+        state: Game state with a complete board and the pot to award
+        hole_cards: Two hole cards per seat (None allowed for folded seats)
+
+    Returns:
+        Winners, per-seat payouts, hand ranks, tie groups and pots
+
+    Raises:
+        ValueError: If the board is incomplete, a live seat has no hole cards,
+            any card appears twice, or the players committed more chips than
+            the pot holds
+    """
+    num_players = len(state.players)
+    if len(hole_cards) != num_players:
+        raise ValueError(
+            f"Expected hole cards for {num_players} seats, got {len(hole_cards)}"
+        )
+
+    order = seats_from_button(state.button, num_players)
+    live = [seat for seat in order if state.players[seat].in_hand]
+    if not live:
+        raise ValueError("No live players at showdown")
+
+    contributions = [player.committed for player in state.players]
+    uncounted = state.pot - sum(contributions)
+    if uncounted < 0:
+        raise ValueError(
+            f"Players committed {sum(contributions)} chips but the pot is "
+            f"{state.pot}"
+        )
+
+    if len(live) == 1:
+        seat = live[0]
+        return ShowdownResult(
+            winners=(seat,),
+            payouts=tuple(split_pot(state.pot, live, num_players)),
+            ranks={},
+            standings=((seat,),),
+            pots=(Pot(state.pot, (seat,)),),
+            pot_winners=((seat,),),
+        )
+
+    if len(state.board) != 5:
+        raise ValueError(f"Showdown needs a 5-card board, got {len(state.board)}")
+
+    board = BoardContext.from_cards(state.board)
+    seen = board.mask
+    ranks: Dict[int, int] = {}
+    for seat in live:
+        cards = hole_cards[seat]
+        if cards is None or len(cards) != 2:
+            raise ValueError(f"Seat {seat} needs exactly 2 hole cards")
+        first, second = cards[0].index, cards[1].index
+        hole_mask = (1 << first) | (1 << second)
+        if seen & hole_mask or first == second:
+            raise ValueError(f"Seat {seat} holds a card that is already in play")
+        seen |= hole_mask
+        ranks[seat] = board.rank(first, second)
+
+    standings = rank_standings(ranks, live)
+    pots = build_pots(
+        contributions, [player.in_hand for player in state.players], uncounted
+    )
+    payouts, pot_winners = award_pots(pots, standings, num_players)
+    return ShowdownResult(
+        winners=pot_winners[0] if pot_winners else standings[0],
+        payouts=tuple(payouts),
+        ranks=ranks,
+        standings=standings,
+        pots=tuple(pots),
+        pot_winners=tuple(pot_winners),
+    )
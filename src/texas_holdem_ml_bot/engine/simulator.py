@@ -0,0 +1,457 @@
+"""Step-based hand simulator over ``GameState``.
+
+A hand is played by alternating ``legal_actions`` and ``apply`` on one
+mutable ``GameState``: ``start_hand`` deals hole cards and posts blinds,
+``apply`` moves chips for the player to act, closes betting rounds, deals
+the next street from ``state.deck`` (``rules.get_cards_to_deal``) and runs
+the board out when no more betting is possible. ``state.to_act`` is None
+once the hand is over, and ``settle`` then pays the pot out, in side pots
+built from each player's ``committed`` chips when all-ins were uneven.
+
+Bets and raises give the total the player's bet becomes this street
+("raise to"), not the chips added. A raise must add at least the previous
+bet or raise increment of the round (at least the big blind), except that a
+player may always go all-in. An all-in below a full raise does not reopen
+the betting: a player who already acted this round (``PlayerState.acted``)
+may only call or fold unless the bet has risen by at least a full raise
+(``min_raise``) since their last action, counting several short all-ins
+together. Folding is only offered when facing a bet.
+
+The loop is built for throughput: nothing is copied, the seat to the left
+and the big blind seat come from tables precomputed per table size, and
+``GameState.num_in_hand``, ``num_can_act`` and ``pending`` (players still
+to act this round) are updated per action instead of rescanning
+``players``. Only closing a round touches every seat.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from random import Random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .cards import Action, Card, Deck, PlayerAction
+from .game_state import GameState, PlayerState
+from .lookup import rank_indices
+from .rules import BLIND_STRUCTURE, Street, get_cards_to_deal, next_street
+from .showdown import (
+    award_pots,
+    build_pots,
+    rank_standings,
+    seats_from_button,
+    split_pot,
+)
+
+MAX_PLAYERS = 10
+
+BIG_BLIND = BLIND_STRUCTURE["big_blind"]
+
+# _NEXT_SEAT[n][seat]: seat to the left of ``seat`` at an n-handed table
+_NEXT_SEAT = tuple(
+    tuple((seat + 1) % num_players for seat in range(num_players))
+    for num_players in range(MAX_PLAYERS + 1)
+)
+
+# _BIG_BLIND_SEAT[n][button]: big blind seat (heads-up the button posts SB)
+_BIG_BLIND_SEAT = tuple(
+    tuple(
+        (button + (1 if num_players == 2 else 2)) % max(num_players, 1)
+        for button in range(num_players)
+    )
+    for num_players in range(MAX_PLAYERS + 1)
+)
+
+# _STREET_STEP[street]: (next street, board cards dealt on it)
+_STREET_STEP = {
+    street: (next_street(street), get_cards_to_deal(next_street(street)))
+    for street in Street
+}
+
+_FOLD_CALL = (Action.FOLD, Action.CALL)
+_FOLD_CALL_RAISE = (Action.FOLD, Action.CALL, Action.RAISE)
+_CHECK = (Action.CHECK,)
+_CHECK_BET = (Action.CHECK, Action.BET)
+_CHECK_RAISE = (Action.CHECK, Action.RAISE)
+
+# Shared instances for actions without an amount
+_SIMPLE_ACTIONS = {
+    Action.FOLD: PlayerAction(Action.FOLD),
+    Action.CHECK: PlayerAction(Action.CHECK),
+    Action.CALL: PlayerAction(Action.CALL),
+}
+
+# Shared bet and raise instances by amount, filled on first use
+_SIZED_ACTIONS: Dict[Action, Dict[int, PlayerAction]] = {
+    Action.BET: {},
+    Action.RAISE: {},
+}
+
+
+@dataclass(slots=True)
+class LegalActions:
+    """Actions available to the player to act.
+
+    Built on every step, so it skips the frozen-dataclass construction cost.
+
+    Args:
+        actions: Action types that may be taken
+        to_call: Chips a call puts in (capped by the stack, 0 if checking)
+        min_amount: Smallest bet/raise total, 0 if betting is closed
+        max_amount: Largest bet/raise total (all-in), 0 if betting is closed
+    """
+
+    actions: Tuple[Action, ...]
+    to_call: int = 0
+    min_amount: int = 0
+    max_amount: int = 0
+
+
+def start_hand(state: GameState, deck: Deck) -> List[List[Card]]:
+    """Reset the state for a new hand, deal hole cards and post blinds.
+
+    Stacks, seating and the button are taken from ``state`` as they are;
+    everything else about the previous hand is cleared in place.
+
+    Args:
+        state: Table to play on (every seat needs chips)
+        deck: Deck to shuffle and deal from; kept as ``state.deck``
+
+    Returns:
+        Two hole cards per seat, aligned with ``state.players``
+
+    Raises:
+        ValueError: If the table size is unsupported or a seat has no chips
+    """
+    players = state.players
+    num_players = len(players)
+    if not (2 <= num_players <= MAX_PLAYERS):
+        raise ValueError(
+            f"Simulator supports 2-{MAX_PLAYERS} players, got {num_players}"
+        )
+    for seat, player in enumerate(players):
+        if player.stack <= 0:
+            raise ValueError(f"Seat {seat} has no chips to play a hand")
+        player.in_hand = True
+        player.bet = 0
+        player.committed = 0
+        player.acted = False
+
+    deck.reset()
+    deck.shuffle()
+    dealt = deck.draw(2 * num_players)
+    holes = [dealt[offset : offset + 2] for offset in range(0, len(dealt), 2)]
+    state.deck = deck
+    state.board.clear()
+    state.street = Street.PREFLOP
+    state.pot = 0
+    state.post_blinds()
+    state.min_raise = BIG_BLIND
+    state.num_raises = 0
+    state.num_in_hand = num_players
+    state.num_can_act = sum(1 for player in players if player.stack > 0)
+    _open_round(state, _BIG_BLIND_SEAT[num_players][state.button])
+    return holes
+
+
+def legal_actions(state: GameState) -> LegalActions:
+    """Return what the player to act may do.
+
+    Raises:
+        ValueError: If the hand is over
+    """
+    seat = state.to_act
+    if seat is None:
+        raise ValueError("No player to act: the hand is over")
+    player = state.players[seat]
+    current = state.current_bet
+    all_in = player.bet + player.stack
+    can_raise = (
+        state.num_can_act > 1
+        and all_in > current
+        and (not player.acted or current - player.bet >= state.min_raise)
+    )
+    low = current + state.min_raise
+    if low > all_in:
+        low = all_in
+
+    if player.bet < current:
+        to_call = current - player.bet
+        if to_call > player.stack:
+            to_call = player.stack
+        if can_raise:
+            return LegalActions(_FOLD_CALL_RAISE, to_call, low, all_in)
+        return LegalActions(_FOLD_CALL, to_call)
+    if not can_raise:
+        return LegalActions(_CHECK)
+    return LegalActions(_CHECK_BET if current == 0 else _CHECK_RAISE, 0, low, all_in)
+
+
+def apply(state: GameState, action: PlayerAction) -> None:
+    """Apply the action of the player to act and advance the hand.
+
+    Closes the betting round when nobody is left to act, deals the next
+    street (or the rest of the board if at most one player can still bet)
+    and sets ``state.to_act`` to None when the hand ends.
+
+    Args:
+        state: Hand in progress
+        action: Action of ``state.to_act``; bet and raise amounts are the
+            total bet for the street
+
+    Raises:
+        ValueError: If the hand is over, the action is not legal here, or a
+            street has to be dealt without ``state.deck``
+    """
+    seat = state.to_act
+    if seat is None:
+        raise ValueError("No player to act: the hand is over")
+    player = state.players[seat]
+    kind = action.action
+    current = state.current_bet
+
+    if kind is Action.FOLD:
+        if player.bet >= current:
+            raise ValueError("Cannot fold when checking is free")
+        player.in_hand = False
+        player.acted = True
+        state.num_in_hand -= 1
+        state.num_can_act -= 1
+        state.pending -= 1
+        if state.num_in_hand == 1:
+            state.to_act = None
+            return
+    elif kind is Action.CHECK:
+        if player.bet != current:
+            raise ValueError(f"Cannot check facing a bet of {current - player.bet}")
+        player.acted = True
+        state.pending -= 1
+    elif kind is Action.CALL:
+        if player.bet >= current:
+            raise ValueError("Nothing to call, check instead")
+        chips = current - player.bet
+        if chips > player.stack:
+            chips = player.stack
+        player.stack -= chips
+        player.bet += chips
+        player.committed += chips
+        state.pot += chips
+        if player.stack == 0:
+            state.num_can_act -= 1
+        player.acted = True
+        state.pending -= 1
+    else:
+        _raise(state, player, kind, action.amount)
+
+    if state.pending > 0:
+        state.to_act = _next_actor(state, seat)
+    else:
+        _close_round(state)
+
+
+def _raise(state: GameState, player: PlayerState, kind: Action, amount: int) -> None:
+    """Apply a bet or raise to ``amount`` for ``player``."""
+    current = state.current_bet
+    expected = Action.BET if current == 0 else Action.RAISE
+    if kind is not expected:
+        raise ValueError(f"Cannot {kind.value} here, {expected.value} instead")
+    if state.num_can_act < 2:
+        raise ValueError("Cannot bet: no other player has chips to call")
+    if player.acted and current - player.bet < state.min_raise:
+        raise ValueError(
+            f"Cannot {kind.value}: a short all-in does not reopen the betting"
+        )
+    all_in = player.bet + player.stack
+    if amount > all_in:
+        raise ValueError(f"Cannot {kind.value} to {amount}, all-in is {all_in}")
+    if amount <= current or (amount < current + state.min_raise and amount != all_in):
+        raise ValueError(
+            f"Minimum {kind.value} is to {current + state.min_raise}, got {amount}"
+        )
+
+    chips = amount - player.bet
+    player.stack -= chips
+    player.bet = amount
+    player.committed += chips
+    player.acted = True
+    state.pot += chips
+    state.min_raise = max(state.min_raise, amount - current)
+    state.current_bet = amount
+    state.num_raises += 1
+    if player.stack == 0:
+        state.num_can_act -= 1
+        state.pending = state.num_can_act
+    else:
+        state.pending = state.num_can_act - 1
+
+
+def _next_actor(state: GameState, seat: int) -> int:
+    """Return the first seat left of ``seat`` that is in the hand with chips."""
+    players = state.players
+    left = _NEXT_SEAT[len(players)]
+    seat = left[seat]
+    player = players[seat]
+    while not (player.in_hand and player.stack > 0):
+        seat = left[seat]
+        player = players[seat]
+    return seat
+
+
+def _open_round(state: GameState, after: int) -> None:
+    """Start betting left of ``after``, or skip the round if nobody can bet."""
+    can_act = state.num_can_act
+    if can_act:
+        seat = _next_actor(state, after)
+        # A lone player with chips only acts if still facing a bet
+        if can_act > 1 or state.players[seat].bet < state.current_bet:
+            state.pending = can_act
+            state.to_act = seat
+            return
+    _close_round(state)
+
+
+def _close_round(state: GameState) -> None:
+    """Return any uncalled bet, clear bets and move to the next street."""
+    players = state.players
+    top = second = 0
+    top_player: Optional[PlayerState] = None
+    for player in players:
+        bet = player.bet
+        if bet > top:
+            top, second, top_player = bet, top, player
+        elif bet > second:
+            second = bet
+        player.bet = 0
+        player.acted = False
+    if top_player is not None and top > second:
+        excess = top - second
+        state.pot -= excess
+        if top_player.stack == 0 and top_player.in_hand:
+            state.num_can_act += 1
+        top_player.stack += excess
+        top_player.committed -= excess
+
+    state.current_bet = 0
+    state.min_raise = BIG_BLIND
+    state.num_raises = 0
+    state.pending = 0
+    street, count = _STREET_STEP[state.street]
+    state.street = street
+    if street is Street.SHOWDOWN:
+        state.to_act = None
+        return
+    deck = state.deck
+    if deck is None:
+        raise ValueError(f"GameState has no deck to deal the {street.value} from")
+    state.board.extend(deck.draw(count))
+    _open_round(state, state.button)
+
+
+def settle(state: GameState, hole_cards: Sequence[Sequence[Card]]) -> Tuple[int, ...]:
+    """Pay the pot of a finished hand into the winners' stacks.
+
+    An uncontested pot goes straight to the last player in the hand.
+    Otherwise every live hand is ranked once and the main and side pots
+    (``showdown.build_pots``) are each split between their best eligible
+    hands, odd chips first to the left of the button (as
+    ``showdown.resolve_showdown`` does, minus its validation: the cards
+    come from ``start_hand``).
+
+    Args:
+        state: Finished hand (``state.to_act`` is None)
+        hole_cards: Hole cards per seat, as returned by ``start_hand``
+
+    Returns:
+        Chips awarded per seat
+
+    Raises:
+        ValueError: If the hand is still in progress
+    """
+    if state.to_act is not None:
+        raise ValueError("Cannot settle a hand that is still in progress")
+    players = state.players
+    num_players = len(players)
+    if state.num_in_hand == 1:
+        payouts = tuple(state.pot if player.in_hand else 0 for player in players)
+    else:
+        board = [card.index for card in state.board]
+        ranks: Dict[int, int] = {}
+        for seat, player in enumerate(players):
+            if player.in_hand:
+                first, second = hole_cards[seat]
+                ranks[seat] = rank_indices([first.index, second.index, *board])
+        standings = rank_standings(ranks, seats_from_button(state.button, num_players))
+        contributions = [player.committed for player in players]
+        top = max(contributions)
+        if all(contributions[seat] == top for seat in ranks):
+            # Every live player matched the biggest contribution: one pot
+            payouts = tuple(split_pot(state.pot, standings[0], num_players))
+        else:
+            pots = build_pots(
+                contributions,
+                [player.in_hand for player in players],
+                state.pot - sum(contributions),
+            )
+            payouts = tuple(award_pots(pots, standings, num_players)[0])
+    for player, chips in zip(players, payouts):
+        player.stack += chips
+        player.committed = 0
+    state.pot = 0
+    return payouts
+
+
+def random_action(legal: LegalActions, rng: Random) -> PlayerAction:
+    """Pick a legal action type uniformly, then a uniform bet size.
+
+    Returns shared ``PlayerAction`` instances (they are frozen), so the
+    loop allocates no action objects once every amount has been seen.
+    """
+    actions = legal.actions
+    kind = actions[int(rng.random() * len(actions))]
+    if kind is Action.BET or kind is Action.RAISE:
+        low = legal.min_amount
+        amount = low + int(rng.random() * (legal.max_amount - low + 1))
+        sized = _SIZED_ACTIONS[kind]
+        action = sized.get(amount)
+        if action is None:
+            action = sized[amount] = PlayerAction(kind, amount)
+        return action
+    return _SIMPLE_ACTIONS[kind]
+
+
+def simulate_random_hands(
+    num_hands: int,
+    num_players: int = 2,
+    *,
+    stack: int = 100 * BIG_BLIND,
+    seed: Optional[int] = None,
+) -> Tuple[int, ...]:
+    """Play hands between random agents on one reused table.
+
+    Every hand starts from ``stack`` chips per seat and the button moves
+    one seat per hand.
+
+    Args:
+        num_hands: Hands to play
+        num_players: Seats at the table
+        stack: Starting stack of every seat in every hand
+        seed: Seed for dealing and action choices
+
+    Returns:
+        Net chips won per seat over all hands (sums to zero)
+    """
+    rng = Random(seed)
+    deck = Deck(rng=rng)
+    players = [PlayerState(stack) for _ in range(num_players)]
+    state = GameState(players=players, button=0)
+    totals = [0] * num_players
+    for hand in range(num_hands):
+        state.button = hand % num_players
+        for player in players:
+            player.stack = stack
+        holes = start_hand(state, deck)
+        while state.to_act is not None:
+            apply(state, random_action(legal_actions(state), rng))
+        settle(state, holes)
+        for seat, player in enumerate(players):
+            totals[seat] += player.stack - stack
+    return tuple(totals)
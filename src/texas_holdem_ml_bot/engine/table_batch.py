@@ -0,0 +1,633 @@
+"""Struct-of-arrays simulator for many independent tables.
+
+``TableBatch`` plays one hand at each of N tables with the same number of
+seats, holding every field of ``GameState`` as an ``(N,)`` or ``(N, P)``
+NumPy array. ``step`` applies one action per table in a fixed number of
+array operations, so the per-action cost is shared by all N tables instead
+of paid per ``GameState`` object. Betting follows ``simulator`` exactly
+(raise-to amounts, min-raise tracking, uncalled bets returned, boards run
+out when nobody can bet, short all-ins that do not reopen the betting),
+and a table converted with ``to_game_state``
+deals the same remaining cards through ``simulator.apply``.
+
+Actions are integer codes indexing ``ACTIONS``. Each table's deck is one
+shuffled row of ``decks``: hole cards are its first ``2 * P`` cards (two
+per seat, in seat order) and the board is the next five, revealed street
+by street, which matches the order a ``Deck`` deals them in.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .cards import NUM_CARDS, Action, Card, Deck
+from .game_state import GameState, PlayerState
+from .lookup import evaluate_batch
+from .rules import BLIND_STRUCTURE, Street
+from .simulator import BIG_BLIND, MAX_PLAYERS
+
+# Action codes used by ``step``: ACTIONS[code]
+ACTIONS = (Action.FOLD, Action.CHECK, Action.CALL, Action.BET, Action.RAISE)
+FOLD, CHECK, CALL, BET, RAISE = range(len(ACTIONS))
+
+# Streets by code, and the board cards visible on each
+STREETS = tuple(Street)
+_SHOWDOWN = STREETS.index(Street.SHOWDOWN)
+_BOARD_SIZE = np.array([0, 3, 4, 5, 5])
+
+# ``to_act`` of a table whose hand is over
+_DONE = -1
+
+
+@dataclass(frozen=True, slots=True)
+class BatchLegalActions:
+    """Legal actions at every table.
+
+    Args:
+        mask: ``(N, 5)`` bool, legal action codes per table (none once the
+            table's hand is over)
+        to_call: ``(N,)`` chips a call puts in
+        min_amount: ``(N,)`` smallest bet/raise total, 0 if closed
+        max_amount: ``(N,)`` largest bet/raise total, 0 if closed
+    """
+
+    mask: np.ndarray
+    to_call: np.ndarray
+    min_amount: np.ndarray
+    max_amount: np.ndarray
+
+
+class TableBatch:
+    """N tables of P seats simulated together.
+
+    All arrays are public and may be read freely; writing stacks between
+    hands (e.g. to reset them) is fine, anything else should go through
+    the methods.
+
+    Attributes:
+        stacks, bets: ``(N, P)`` chips behind and bet this street
+        committed: ``(N, P)`` chips put in this hand (side pots are built
+            from these)
+        in_hand: ``(N, P)`` whether each seat has not folded
+        acted: ``(N, P)`` whether each seat has acted this betting round
+        pots: ``(N,)`` chips in the middle
+        decks: ``(N, 52)`` shuffled deck of each table
+        buttons: ``(N,)`` button seat
+        streets: ``(N,)`` street code (index into ``STREETS``)
+        to_act: ``(N,)`` seat to act, -1 once the hand is over
+        current_bet, min_raise, num_raises, pending: ``(N,)`` as on
+            ``GameState``
+        num_in_hand, num_can_act: ``(N,)`` as on ``GameState``
+    """
+
+    def __init__(
+        self,
+        num_tables: int,
+        num_players: int,
+        *,
+        stack: int = 100 * BIG_BLIND,
+        seed: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None,
+    ) -> None:
+        """Allocate the tables; call ``new_hands`` to deal.
+
+        Args:
+            num_tables: Number of tables N
+            num_players: Seats per table P
+            stack: Starting stack of every seat
+            seed: Seed for a private generator
+            rng: Generator to use (takes precedence over seed)
+
+        Raises:
+            ValueError: If the sizes are out of range
+        """
+        if num_tables < 1:
+            raise ValueError(f"num_tables must be positive, got {num_tables}")
+        if not (2 <= num_players <= MAX_PLAYERS):
+            raise ValueError(
+                f"Simulator supports 2-{MAX_PLAYERS} players, got {num_players}"
+            )
+        self.num_tables = num_tables
+        self.num_players = num_players
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+
+        shape = (num_tables, num_players)
+        self.stacks = np.full(shape, stack, dtype=np.int64)
+        self.bets = np.zeros(shape, dtype=np.int64)
+        self.committed = np.zeros(shape, dtype=np.int64)
+        self.in_hand = np.zeros(shape, dtype=bool)
+        self.acted = np.zeros(shape, dtype=bool)
+        self.pots = np.zeros(num_tables, dtype=np.int64)
+        self.decks = np.tile(np.arange(NUM_CARDS, dtype=np.int16), (num_tables, 1))
+        self.buttons = np.zeros(num_tables, dtype=np.int64)
+        self.streets = np.zeros(num_tables, dtype=np.int64)
+        self.to_act = np.full(num_tables, _DONE, dtype=np.int64)
+        self.current_bet = np.zeros(num_tables, dtype=np.int64)
+        self.min_raise = np.zeros(num_tables, dtype=np.int64)
+        self.num_raises = np.zeros(num_tables, dtype=np.int64)
+        self.pending = np.zeros(num_tables, dtype=np.int64)
+        self.num_in_hand = np.zeros(num_tables, dtype=np.int64)
+        self.num_can_act = np.zeros(num_tables, dtype=np.int64)
+        self._rows = np.arange(num_tables)
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    @property
+    def holes(self) -> np.ndarray:
+        """``(N, P, 2)`` hole cards (a view of ``decks``)."""
+        num_players = self.num_players
+        return self.decks[:, : 2 * num_players].reshape(self.num_tables, num_players, 2)
+
+    @property
+    def boards(self) -> np.ndarray:
+        """``(N, 5)`` full runout of each table (a view of ``decks``).
+
+        Only the first ``board_sizes`` cards of a row have been dealt.
+        """
+        start = 2 * self.num_players
+        return self.decks[:, start : start + 5]
+
+    @property
+    def board_sizes(self) -> np.ndarray:
+        """``(N,)`` number of board cards dealt so far."""
+        return _BOARD_SIZE[self.streets]
+
+    @property
+    def done(self) -> np.ndarray:
+        """``(N,)`` whether each table's hand is over."""
+        return self.to_act == _DONE
+
+    # ------------------------------------------------------------------
+    # Dealing
+    # ------------------------------------------------------------------
+
+    def new_hands(self, buttons: Optional[Sequence[int] | np.ndarray] = None) -> None:
+        """Shuffle, deal and post blinds at every table.
+
+        Args:
+            buttons: Button seat per table (default: keep the current ones)
+
+        Raises:
+            ValueError: If a seat has no chips or a button is out of range
+        """
+        if buttons is not None:
+            buttons = np.asarray(buttons, dtype=np.int64)
+            if buttons.shape != (self.num_tables,):
+                raise ValueError(
+                    f"Need one button per table, got shape {buttons.shape}"
+                )
+            if buttons.min() < 0 or buttons.max() >= self.num_players:
+                raise ValueError("Button seats must be in 0..num_players-1")
+            self.buttons[:] = buttons
+        if np.any(self.stacks <= 0):
+            table = int(np.flatnonzero((self.stacks <= 0).any(axis=1))[0])
+            raise ValueError(f"Table {table} has a seat with no chips")
+
+        num_players = self.num_players
+        rows = self._rows
+        self.decks[:] = np.argsort(
+            self.rng.random((self.num_tables, NUM_CARDS)), axis=1
+        )
+        self.bets[:] = 0
+        self.committed[:] = 0
+        self.in_hand[:] = True
+        self.acted[:] = False
+        self.streets[:] = 0
+        self.pots[:] = 0
+
+        offset = 1 if num_players == 2 else 2
+        small = (self.buttons + offset - 1) % num_players
+        big = (self.buttons + offset) % num_players
+        for seats, blind in (
+            (small, BLIND_STRUCTURE["small_blind"]),
+            (big, BLIND_STRUCTURE["big_blind"]),
+        ):
+            chips = np.minimum(self.stacks[rows, seats], blind)
+            self.stacks[rows, seats] -= chips
+            self.bets[rows, seats] += chips
+            self.committed[rows, seats] += chips
+            self.pots += chips
+        self.current_bet[:] = self.bets[rows, big]
+        self.min_raise[:] = BIG_BLIND
+        self.num_raises[:] = 0
+        self.num_in_hand[:] = num_players
+        self.num_can_act[:] = np.count_nonzero(self.stacks > 0, axis=1)
+        self._open_round(rows, big)
+
+    # ------------------------------------------------------------------
+    # Actions
+    # ------------------------------------------------------------------
+
+    def legal_actions(self) -> BatchLegalActions:
+        """Return the legal actions of the player to act at every table."""
+        mask = np.zeros((self.num_tables, len(ACTIONS)), dtype=bool)
+        to_call = np.zeros(self.num_tables, dtype=np.int64)
+        low = np.zeros(self.num_tables, dtype=np.int64)
+        high = np.zeros(self.num_tables, dtype=np.int64)
+
+        rows = np.flatnonzero(self.to_act != _DONE)
+        seats = self.to_act[rows]
+        bet = self.bets[rows, seats]
+        stack = self.stacks[rows, seats]
+        current = self.current_bet[rows]
+        all_in = bet + stack
+        facing = bet < current
+        can_raise = (
+            (self.num_can_act[rows] > 1)
+            & (all_in > current)
+            & (~self.acted[rows, seats] | (current - bet >= self.min_raise[rows]))
+        )
+
+        mask[rows, FOLD] = facing
+        mask[rows, CALL] = facing
+        mask[rows, CHECK] = ~facing
+        mask[rows, RAISE] = can_raise & (current > 0)
+        mask[rows, BET] = can_raise & (current == 0)
+        to_call[rows] = np.where(facing, np.minimum(current - bet, stack), 0)
+        low[rows] = np.where(
+            can_raise, np.minimum(current + self.min_raise[rows], all_in), 0
+        )
+        high[rows] = np.where(can_raise, all_in, 0)
+        return BatchLegalActions(mask, to_call, low, high)
+
+    def step(
+        self, actions: Sequence[int] | np.ndarray, amounts: Sequence[int] | np.ndarray
+    ) -> None:
+        """Apply one action at every table whose hand is still going.
+
+        Entries for finished tables are ignored.
+
+        Args:
+            actions: ``(N,)`` action codes (see ``ACTIONS``)
+            amounts: ``(N,)`` bet/raise totals (ignored for other actions)
+
+        Raises:
+            ValueError: If an action is illegal at its table; nothing is
+                changed in that case
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        amounts = np.asarray(amounts, dtype=np.int64)
+        if actions.shape != (self.num_tables,) or amounts.shape != actions.shape:
+            raise ValueError(
+                f"Need one action and amount per table ({self.num_tables}), got "
+                f"shapes {actions.shape} and {amounts.shape}"
+            )
+
+        legal = self.legal_actions()
+        rows = np.flatnonzero(self.to_act != _DONE)
+        codes = actions[rows]
+        amount = amounts[rows]
+        if codes.size and (codes.min() < 0 or codes.max() >= len(ACTIONS)):
+            raise ValueError(f"Action codes must be in 0-{len(ACTIONS) - 1}")
+        sized = (codes == BET) | (codes == RAISE)
+        ok = legal.mask[rows, codes] & (
+            ~sized
+            | ((amount >= legal.min_amount[rows]) & (amount <= legal.max_amount[rows]))
+        )
+        if not ok.all():
+            table = int(rows[np.argmin(ok)])
+            raise ValueError(
+                f"Illegal {ACTIONS[actions[table]].value} "
+                f"(amount {amounts[table]}) at table {table}"
+            )
+
+        seats = self.to_act[rows]
+        bet = self.bets[rows, seats]
+        current = self.current_bet[rows]
+
+        # Chips moved: calls (capped by the stack) and bets/raises
+        chips = np.where(codes == CALL, current - bet, 0)
+        chips = np.where(sized, amount - bet, chips)
+        chips = np.minimum(chips, self.stacks[rows, seats])
+        self.stacks[rows, seats] -= chips
+        self.bets[rows, seats] += chips
+        self.committed[rows, seats] += chips
+        self.acted[rows, seats] = True
+        self.pots[rows] += chips
+
+        fold = codes == FOLD
+        self.in_hand[rows[fold], seats[fold]] = False
+        self.num_in_hand[rows[fold]] -= 1
+        broke = fold | ((chips > 0) & (self.stacks[rows, seats] == 0))
+        self.num_can_act[rows[broke]] -= 1
+
+        raised = rows[sized]
+        self.min_raise[raised] = np.maximum(
+            self.min_raise[raised], amount[sized] - current[sized]
+        )
+        self.current_bet[raised] = amount[sized]
+        self.num_raises[raised] += 1
+        still = self.stacks[raised, seats[sized]] > 0
+        self.pending[raised] = self.num_can_act[raised] - still
+        self.pending[rows[~sized]] -= 1
+
+        # Folded down to one player: the hand ends where it stands
+        won = rows[fold][self.num_in_hand[rows[fold]] == 1]
+        self.to_act[won] = _DONE
+
+        live = self.to_act[rows] != _DONE
+        rows, seats = rows[live], seats[live]
+        more = self.pending[rows] > 0
+        self.to_act[rows[more]] = self._next_actor(rows[more], seats[more])
+        self._close_round(rows[~more])
+
+    def random_actions(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Pick a uniform legal action type per table, then a uniform size.
+
+        Returns:
+            ``(actions, amounts)`` ready for ``step``
+        """
+        legal = self.legal_actions()
+        actions = np.argmax(
+            self.rng.random(legal.mask.shape) * legal.mask, axis=1
+        ).astype(np.int64)
+        span = legal.max_amount - legal.min_amount + 1
+        amounts = legal.min_amount + (self.rng.random(self.num_tables) * span).astype(
+            np.int64
+        )
+        return actions, amounts
+
+    # ------------------------------------------------------------------
+    # Rounds
+    # ------------------------------------------------------------------
+
+    def _next_actor(self, rows: np.ndarray, seats: np.ndarray) -> np.ndarray:
+        """First seat left of ``seats`` that is in the hand with chips."""
+        num_players = self.num_players
+        order = (seats[:, None] + np.arange(1, num_players + 1)) % num_players
+        table = rows[:, None]
+        ready = self.in_hand[table, order] & (self.stacks[table, order] > 0)
+        return order[np.arange(len(rows)), np.argmax(ready, axis=1)]
+
+    def _open_round(self, rows: np.ndarray, after: np.ndarray) -> None:
+        """Start betting left of ``after``, skipping rounds nobody can bet."""
+        if not len(rows):
+            return
+        can_act = self.num_can_act[rows]
+        seats = self._next_actor(rows, after)
+        # A lone player with chips only acts if still facing a bet
+        facing = self.bets[rows, seats] < self.current_bet[rows]
+        bet = (can_act > 1) | ((can_act == 1) & facing)
+        self.pending[rows[bet]] = can_act[bet]
+        self.to_act[rows[bet]] = seats[bet]
+        self._close_round(rows[~bet])
+
+    def _close_round(self, rows: np.ndarray) -> None:
+        """Return uncalled bets, clear bets and move to the next street."""
+        if not len(rows):
+            return
+        bets = self.bets[rows]
+        ordered = np.sort(bets, axis=1)
+        excess = ordered[:, -1] - ordered[:, -2]
+        top = np.argmax(bets, axis=1)
+        regained = (
+            (excess > 0) & (self.stacks[rows, top] == 0) & self.in_hand[rows, top]
+        )
+        self.num_can_act[rows[regained]] += 1
+        self.stacks[rows, top] += excess
+        self.committed[rows, top] -= excess
+        self.pots[rows] -= excess
+
+        self.bets[rows] = 0
+        self.acted[rows] = False
+        self.current_bet[rows] = 0
+        self.min_raise[rows] = BIG_BLIND
+        self.num_raises[rows] = 0
+        self.pending[rows] = 0
+        self.streets[rows] += 1
+        over = self.streets[rows] == _SHOWDOWN
+        self.to_act[rows[over]] = _DONE
+        rows = rows[~over]
+        self._open_round(rows, self.buttons[rows])
+
+    # ------------------------------------------------------------------
+    # Settlement
+    # ------------------------------------------------------------------
+
+    def settle(self) -> np.ndarray:
+        """Pay every finished table's pot into its winners' stacks.
+
+        Matches ``simulator.settle``: live hands are ranked in one batch,
+        then every table's chips are cut into one layer per contribution
+        level (``showdown.build_pots``) with its eligible live seats as an
+        ``(N, P, P)`` mask, layers with the same eligible seats are merged
+        into one pot, and each pot is split between its best eligible
+        hands, odd chips first to the left of the button. The work is the
+        same however many players are all-in. Pot chips beyond the
+        recorded contributions (a table set from a state without them) go
+        to the main pot.
+
+        Returns:
+            ``(N, P)`` chips awarded (zero for tables still playing)
+        """
+        num_players = self.num_players
+        payouts = np.zeros((self.num_tables, num_players), dtype=np.int64)
+        rows = np.flatnonzero((self.to_act == _DONE) & (self.pots > 0))
+        if not len(rows):
+            return payouts
+
+        live = self.in_hand[rows]
+        ranks = live.astype(np.int32)
+        contested = self.num_in_hand[rows] > 1
+        shown = rows[contested]
+        if len(shown):
+            hands = np.concatenate(
+                [
+                    self.holes[shown],
+                    np.broadcast_to(
+                        self.boards[shown][:, None, :], (len(shown), num_players, 5)
+                    ),
+                ],
+                axis=2,
+            ).reshape(-1, 7)
+            shown_ranks = evaluate_batch(hands).reshape(len(shown), num_players)
+            ranks[contested] = np.where(live[contested], shown_ranks, 0)
+
+        # Layer k holds (level_k - level_k-1) chips from each seat at or above
+        # level_k, and the live seats at or above it may win it
+        committed = self.committed[rows]
+        levels = np.sort(committed, axis=1)
+        layers = np.diff(levels, axis=1, prepend=0) * np.arange(num_players, 0, -1)
+        layers[:, 0] += self.pots[rows] - committed.sum(axis=1)
+        eligible = live[:, None, :] & (committed[:, None, :] >= levels[:, :, None])
+
+        # A layer opens a new pot only if its eligible seats changed and are
+        # not empty; otherwise its chips join the pot below
+        opens = np.ones(layers.shape, dtype=bool)
+        opens[:, 1:] = np.any(eligible[:, 1:] != eligible[:, :-1], axis=2)
+        opens &= eligible.any(axis=2)
+        layer_index = np.arange(num_players)
+        owner = np.maximum.accumulate(np.where(opens, layer_index, 0), axis=1)
+        picked = np.arange(len(rows))[:, None]
+        pots = np.zeros_like(layers)
+        np.add.at(pots, (np.broadcast_to(picked, owner.shape), owner), layers)
+
+        # Best eligible hands per pot, in seat order starting left of the button
+        order = (self.buttons[rows, None] + np.arange(1, num_players + 1)) % (
+            num_players
+        )
+        eligible_ranks = np.where(eligible, ranks[:, None, :], 0)
+        winners = eligible & (
+            eligible_ranks == eligible_ranks.max(axis=2, keepdims=True)
+        )
+        in_order = np.take_along_axis(winners, order[:, None, :], axis=2)
+        counts = np.maximum(np.count_nonzero(winners, axis=2), 1)
+        share, odd = np.divmod(pots, counts)
+        extra = in_order & (np.cumsum(in_order, axis=2) <= odd[:, :, None])
+        paid = np.zeros((len(rows), num_players), dtype=np.int64)
+        paid[picked, order] = (in_order * share[:, :, None] + extra).sum(axis=1)
+        payouts[rows] = paid
+        self.stacks[rows] += paid
+        self.committed[rows] = 0
+        self.pots[rows] = 0
+        return payouts
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    def to_game_state(self, table: int) -> Tuple[GameState, List[List[Card]]]:
+        """Copy one table into a ``GameState`` (for debugging).
+
+        The state's deck holds the table's undealt cards in deal order, so
+        ``simulator.apply`` continues the hand exactly as ``step`` would.
+
+        Returns:
+            ``(state, hole cards per seat)``
+        """
+        row = self._row(table)
+        num_players = self.num_players
+        players = [
+            PlayerState(
+                stack=int(self.stacks[row, seat]),
+                in_hand=bool(self.in_hand[row, seat]),
+                bet=int(self.bets[row, seat]),
+                committed=int(self.committed[row, seat]),
+                acted=bool(self.acted[row, seat]),
+            )
+            for seat in range(num_players)
+        ]
+        deck = [int(index) for index in self.decks[row]]
+        dealt = 2 * num_players + int(_BOARD_SIZE[self.streets[row]])
+        to_act = int(self.to_act[row])
+        state = GameState(
+            players=players,
+            button=int(self.buttons[row]),
+            street=STREETS[self.streets[row]],
+            board=[Card.from_index(index) for index in deck[2 * num_players : dealt]],
+            pot=int(self.pots[row]),
+            to_act=None if to_act == _DONE else to_act,
+            current_bet=int(self.current_bet[row]),
+            min_raise=int(self.min_raise[row]),
+            num_raises=int(self.num_raises[row]),
+            pending=int(self.pending[row]),
+            deck=Deck(cards=[Card.from_index(index) for index in deck[dealt:]]),
+        )
+        holes = [
+            [Card.from_index(deck[2 * seat]), Card.from_index(deck[2 * seat + 1])]
+            for seat in range(num_players)
+        ]
+        return state, holes
+
+    def set_table(
+        self, table: int, state: GameState, hole_cards: Sequence[Sequence[Card]]
+    ) -> None:
+        """Overwrite one table with a ``GameState`` and its hole cards.
+
+        Undealt board cards are drawn at random from the cards not in play.
+
+        Raises:
+            ValueError: If the seat count differs or cards are missing or
+                repeated
+        """
+        row = self._row(table)
+        num_players = self.num_players
+        if len(state.players) != num_players or len(hole_cards) != num_players:
+            raise ValueError(
+                f"Table has {num_players} seats, got {len(state.players)} players "
+                f"and {len(hole_cards)} hole card pairs"
+            )
+        if any(len(hole) != 2 for hole in hole_cards):
+            raise ValueError("Every seat needs exactly 2 hole cards")
+        known = [card.index for hole in hole_cards for card in hole]
+        known += [card.index for card in state.board]
+        if len(set(known)) != len(known):
+            raise ValueError("Hole and board cards must be distinct")
+        street = STREETS.index(state.street)
+        if len(state.board) != _BOARD_SIZE[street]:
+            raise ValueError(
+                f"A {state.street.value} board has {_BOARD_SIZE[street]} cards, "
+                f"got {len(state.board)}"
+            )
+
+        unseen = np.setdiff1d(np.arange(NUM_CARDS), known)
+        self.decks[row] = np.concatenate([known, self.rng.permutation(unseen)])
+        for seat, player in enumerate(state.players):
+            self.stacks[row, seat] = player.stack
+            self.bets[row, seat] = player.bet
+            self.committed[row, seat] = player.committed
+            self.in_hand[row, seat] = player.in_hand
+            self.acted[row, seat] = player.acted
+        self.pots[row] = state.pot
+        self.buttons[row] = state.button
+        self.streets[row] = street
+        self.to_act[row] = _DONE if state.to_act is None else state.to_act
+        self.current_bet[row] = state.current_bet
+        self.min_raise[row] = state.min_raise
+        self.num_raises[row] = state.num_raises
+        self.pending[row] = state.pending
+        self.num_in_hand[row] = np.count_nonzero(self.in_hand[row])
+        self.num_can_act[row] = np.count_nonzero(
+            self.in_hand[row] & (self.stacks[row] > 0)
+        )
+
+    def _row(self, table: int) -> int:
+        """Validate a table index."""
+        if not (0 <= table < self.num_tables):
+            raise ValueError(f"Table {table} out of range (0-{self.num_tables - 1})")
+        return table
+
+
+def simulate_random_batch(
+    num_hands: int,
+    num_players: int = 2,
+    *,
+    num_tables: int = 1024,
+    stack: int = 100 * BIG_BLIND,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """Play hands between random agents on batches of tables.
+
+    Hands are played in waves of up to ``num_tables`` tables. Every hand
+    starts from ``stack`` chips per seat and the button moves one seat per
+    wave (and differs between neighbouring tables).
+
+    Args:
+        num_hands: Hands to play in total
+        num_players: Seats per table
+        num_tables: Tables per wave
+        stack: Starting stack of every seat in every hand
+        seed: Seed for dealing and action choices
+
+    Returns:
+        ``(P,)`` net chips won per seat over all hands (sums to zero)
+    """
+    rng = np.random.default_rng(seed)
+    totals = np.zeros(num_players, dtype=np.int64)
+    wave = 0
+    while num_hands > 0:
+        size = min(num_tables, num_hands)
+        batch = TableBatch(size, num_players, stack=stack, rng=rng)
+        batch.new_hands((np.arange(size) + wave) % num_players)
+        while not batch.done.all():
+            batch.step(*batch.random_actions())
+        batch.settle()
+        totals += (batch.stacks - stack).sum(axis=0)
+        num_hands -= size
+        wave += 1
+    return totals
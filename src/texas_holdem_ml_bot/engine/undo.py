@@ -0,0 +1,185 @@
+"""Make/unmake of simulator actions for tree search.
+
+Search explores many branches from one position. Copying ``players`` and
+``board`` at every node costs far more than the action itself, so
+``UndoLog`` plays actions on a single ``GameState`` with
+``simulator.apply`` and records, per action, only what the action can
+change: the acting player's five fields and the state's scalars. An
+action that closes a betting round also touches every seat's bet and
+``acted`` flag (and the stack and committed chips of a player whose
+uncalled bet comes back) and deals board cards, so those entries
+additionally hold each seat's ``(stack, bet, committed, acted)`` and the
+board length; undoing them puts the dealt cards back with
+``Deck.undraw``.
+
+``unmake`` is O(1) for actions inside a round and O(players) for the
+action that closed one. A branch point is just ``mark()``, the current
+depth, and ``rewind(mark)`` unmakes back to it::
+
+    log = UndoLog(state)
+    root = log.mark()
+    for action in candidates:
+        log.make(action)
+        value = search(log)
+        log.rewind(root)
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from .cards import Action, PlayerAction
+from .game_state import GameState
+from .rules import Street
+from .simulator import apply
+
+# (seat, stack, bet, committed, in_hand, acted, pot, current_bet, min_raise,
+#  num_raises, pending, num_in_hand, num_can_act, street, board length, per-seat
+#  (stack, bet, committed, acted) when the action closes a round)
+UndoEntry = Tuple[
+    int,
+    int,
+    int,
+    int,
+    bool,
+    bool,
+    int,
+    int,
+    int,
+    int,
+    int,
+    int,
+    int,
+    Street,
+    int,
+    Optional[Tuple[Tuple[int, int, int, bool], ...]],
+]
+
+
+class UndoLog:
+    """Stack of undo entries for the actions made on one ``GameState``."""
+
+    __slots__ = ("state", "_entries")
+
+    def __init__(self, state: GameState) -> None:
+        """Start an empty log on ``state`` (a hand in progress)."""
+        self.state = state
+        self._entries: List[UndoEntry] = []
+
+    def __len__(self) -> int:
+        """Number of actions that can be unmade."""
+        return len(self._entries)
+
+    def make(self, action: PlayerAction) -> None:
+        """Apply ``action`` for the player to act and record how to undo it.
+
+        Raises:
+            ValueError: If the action is illegal (nothing is recorded)
+        """
+        state = self.state
+        seat = state.to_act
+        if seat is None:
+            raise ValueError("No player to act: the hand is over")
+        player = state.players[seat]
+        # Only a check, call or fold by the last pending player closes a round
+        closing = state.pending == 1 and not (
+            action.action is Action.BET or action.action is Action.RAISE
+        )
+        seats = (
+            tuple((p.stack, p.bet, p.committed, p.acted) for p in state.players)
+            if closing
+            else None
+        )
+        entry = (
+            seat,
+            player.stack,
+            player.bet,
+            player.committed,
+            player.in_hand,
+            player.acted,
+            state.pot,
+            state.current_bet,
+            state.min_raise,
+            state.num_raises,
+            state.pending,
+            state.num_in_hand,
+            state.num_can_act,
+            state.street,
+            len(state.board),
+            seats,
+        )
+        apply(state, action)
+        self._entries.append(entry)
+
+    def unmake(self) -> None:
+        """Revert the most recent action.
+
+        Raises:
+            ValueError: If there is nothing to undo
+        """
+        if not self._entries:
+            raise ValueError("Nothing to undo")
+        (
+            seat,
+            stack,
+            bet,
+            committed,
+            in_hand,
+            acted,
+            pot,
+            current_bet,
+            min_raise,
+            num_raises,
+            pending,
+            num_in_hand,
+            num_can_act,
+            street,
+            board_size,
+            seats,
+        ) = self._entries.pop()
+        state = self.state
+        if seats is not None:
+            for other, (other_stack, other_bet, other_committed, other_acted) in zip(
+                state.players, seats
+            ):
+                other.stack = other_stack
+                other.bet = other_bet
+                other.committed = other_committed
+                other.acted = other_acted
+            dealt = len(state.board) - board_size
+            if dealt:
+                del state.board[board_size:]
+                if state.deck is not None:
+                    state.deck.undraw(dealt)
+        player = state.players[seat]
+        player.stack = stack
+        player.bet = bet
+        player.committed = committed
+        player.in_hand = in_hand
+        player.acted = acted
+        state.pot = pot
+        state.current_bet = current_bet
+        state.min_raise = min_raise
+        state.num_raises = num_raises
+        state.pending = pending
+        state.num_in_hand = num_in_hand
+        state.num_can_act = num_can_act
+        state.street = street
+        state.to_act = seat
+
+    def mark(self) -> int:
+        """Return a snapshot handle for the current position (O(1))."""
+        return len(self._entries)
+
+    def rewind(self, mark: int) -> None:
+        """Unmake actions until the position at ``mark`` is restored.
+
+        Raises:
+            ValueError: If ``mark`` is deeper than the log or negative
+        """
+        if not (0 <= mark <= len(self._entries)):
+            raise ValueError(
+                f"Mark {mark} is not in the log (depth {len(self._entries)})"
+            )
+        while len(self._entries) > mark:
+            self.unmake()
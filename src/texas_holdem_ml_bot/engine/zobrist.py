@@ -0,0 +1,225 @@
+"""Zobrist hashing of game states.
+
+A position key is the XOR of one random 64-bit key per feature: each
+board card, the street, the seat to act, the pot, and per seat its stack,
+its bet and whether it folded. Chip amounts are hashed by bucket
+(``ChipBuckets``), so positions that differ only within a bucket share a
+key -- the chip abstraction the cache works at. Use ``ChipBuckets.exact``
+to tell every chip count apart.
+
+Because XOR undoes itself, applying an action only re-keys the features it
+changed: ``HashedLog`` keeps ``key`` current on every ``make`` by XOR-ing
+out the acting seat's old keys and XOR-ing in its new ones (every seat,
+the street and the new board cards when the action closes a round), and
+``unmake`` pops the previous key. ``ZobristKeys.hash`` computes a key from
+scratch. Keys are drawn from a fixed seed, so they are stable across
+processes and can index persistent tables.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+from .cards import NUM_CARDS, PlayerAction
+from .game_state import GameState
+from .rules import Street
+from .simulator import BIG_BLIND, MAX_PLAYERS
+from .undo import UndoLog
+
+ZOBRIST_SEED = 0x5EED_2B0B
+
+# Largest chip amount the default buckets resolve (10,000 big blinds)
+DEFAULT_MAX_CHIPS = 10_000 * BIG_BLIND
+
+_STREET_INDEX = {street: index for index, street in enumerate(Street)}
+
+
+@dataclass(frozen=True, slots=True)
+class ChipBuckets:
+    """Mapping of chip amounts to hash buckets.
+
+    Args:
+        edges: Ascending lower bounds of buckets 1, 2, ...; amounts below
+            ``edges[0]`` fall in bucket 0 and amounts from ``edges[-1]`` up
+            in the last bucket
+    """
+
+    edges: Tuple[int, ...]
+
+    def __post_init__(self) -> None:
+        """Validate the edges."""
+        if not self.edges:
+            raise ValueError("Need at least one bucket edge")
+        if any(low >= high for low, high in zip(self.edges, self.edges[1:])):
+            raise ValueError("Bucket edges must be strictly increasing")
+
+    @classmethod
+    def geometric(
+        cls, ratio: float = 1.25, max_chips: int = DEFAULT_MAX_CHIPS
+    ) -> ChipBuckets:
+        """Buckets that grow by ``ratio``: exact for small amounts, coarse later.
+
+        Raises:
+            ValueError: If ratio is not above 1
+        """
+        if ratio <= 1.0:
+            raise ValueError(f"ratio must be above 1, got {ratio}")
+        edges = [1]
+        while edges[-1] < max_chips:
+            edges.append(max(edges[-1] + 1, int(edges[-1] * ratio)))
+        return cls(tuple(edges))
+
+    @classmethod
+    def exact(cls, max_chips: int) -> ChipBuckets:
+        """One bucket per chip amount up to ``max_chips``."""
+        return cls(tuple(range(1, max_chips + 1)))
+
+    @property
+    def num_buckets(self) -> int:
+        """Number of buckets."""
+        return len(self.edges) + 1
+
+    def bucket(self, chips: int) -> int:
+        """Return the bucket of a chip amount."""
+        return bisect_right(self.edges, chips)
+
+
+class ZobristKeys:
+    """Random 64-bit keys for every hashed feature of a ``GameState``."""
+
+    def __init__(
+        self,
+        buckets: ChipBuckets | None = None,
+        *,
+        seed: int = ZOBRIST_SEED,
+        max_players: int = MAX_PLAYERS,
+    ) -> None:
+        """Draw the key tables.
+
+        Args:
+            buckets: Chip abstraction (default ``ChipBuckets.geometric()``)
+            seed: Seed of the key tables
+            max_players: Largest table the keys cover
+        """
+        self.buckets = buckets if buckets is not None else ChipBuckets.geometric()
+        self.max_players = max_players
+        count = self.buckets.num_buckets
+        rng = np.random.default_rng(seed)
+
+        def draw(*shape: int) -> List:
+            return rng.integers(0, 2**64, size=shape, dtype=np.uint64).tolist()
+
+        self.cards: List[int] = draw(NUM_CARDS)
+        self.streets: List[int] = draw(len(_STREET_INDEX))
+        # to_act[seat + 1]; index 0 (no one to act) hashes to nothing
+        self.to_act: List[int] = [0, *draw(max_players)]
+        self.pots: List[int] = draw(count)
+        self.folded: List[int] = draw(max_players)
+        self.stacks: List[List[int]] = draw(max_players, count)
+        self.bets: List[List[int]] = draw(max_players, count)
+
+    def seat(self, seat: int, stack: int, bet: int, in_hand: bool) -> int:
+        """Combined key of one seat's stack, bet and fold status."""
+        bucket = self.buckets.bucket
+        key = self.stacks[seat][bucket(stack)] ^ self.bets[seat][bucket(bet)]
+        return key if in_hand else key ^ self.folded[seat]
+
+    def pot(self, chips: int) -> int:
+        """Key of the pot size."""
+        return self.pots[self.buckets.bucket(chips)]
+
+    def hash(self, state: GameState) -> int:
+        """Compute the key of a state from scratch.
+
+        Raises:
+            ValueError: If the table is larger than ``max_players``
+        """
+        if len(state.players) > self.max_players:
+            raise ValueError(
+                f"Keys cover {self.max_players} players, got {len(state.players)}"
+            )
+        key = self.streets[_STREET_INDEX[state.street]] ^ self.pot(state.pot)
+        key ^= self.to_act[0 if state.to_act is None else state.to_act + 1]
+        for card in state.board:
+            key ^= self.cards[card.index]
+        for seat, player in enumerate(state.players):
+            key ^= self.seat(seat, player.stack, player.bet, player.in_hand)
+        return key
+
+
+_DEFAULT_KEYS: ZobristKeys | None = None
+
+
+def default_keys() -> ZobristKeys:
+    """Return the shared keys with the default chip buckets."""
+    global _DEFAULT_KEYS
+    if _DEFAULT_KEYS is None:
+        _DEFAULT_KEYS = ZobristKeys()
+    return _DEFAULT_KEYS
+
+
+class HashedLog(UndoLog):
+    """``UndoLog`` that keeps the Zobrist key of its state up to date."""
+
+    __slots__ = ("keys", "key", "_history")
+
+    def __init__(self, state: GameState, keys: ZobristKeys | None = None) -> None:
+        """Start an empty log on ``state`` and hash it once.
+
+        Args:
+            state: Hand in progress
+            keys: Key tables (default ``default_keys()``)
+        """
+        super().__init__(state)
+        self.keys = keys if keys is not None else default_keys()
+        self.key = self.keys.hash(state)
+        self._history: List[int] = []
+
+    def make(self, action: PlayerAction) -> None:
+        """Apply ``action`` and update ``key`` incrementally.
+
+        Raises:
+            ValueError: If the action is illegal (nothing is recorded)
+        """
+        super().make(action)
+        state = self.state
+        keys = self.keys
+        entry = self._entries[-1]
+        seat, stack, bet, _, in_hand, _, pot = entry[:7]
+        street, board_size, seats = entry[13:]
+        players = state.players
+        to_act = state.to_act
+
+        key = self.key ^ keys.to_act[seat + 1]
+        key ^= keys.to_act[0 if to_act is None else to_act + 1]
+        key ^= keys.pot(pot) ^ keys.pot(state.pot)
+        if seats is None:
+            player = players[seat]
+            key ^= keys.seat(seat, stack, bet, in_hand)
+            key ^= keys.seat(seat, player.stack, player.bet, player.in_hand)
+        else:
+            for other, ((old_stack, old_bet, _, _), player) in enumerate(
+                zip(seats, players)
+            ):
+                was_in = in_hand if other == seat else player.in_hand
+                key ^= keys.seat(other, old_stack, old_bet, was_in)
+                key ^= keys.seat(other, player.stack, player.bet, player.in_hand)
+            key ^= keys.streets[_STREET_INDEX[street]]
+            key ^= keys.streets[_STREET_INDEX[state.street]]
+            for card in state.board[board_size:]:
+                key ^= keys.cards[card.index]
+        self._history.append(self.key)
+        self.key = key
+
+    def unmake(self) -> None:
+        """Revert the most recent action and restore its key.
+
+        Raises:
+            ValueError: If there is nothing to undo
+        """
+        super().unmake()
+        self.key = self._history.pop()
@@ -0,0 +1,158 @@
+"""Multi-process Monte Carlo equity.
+
+``parallel_equity`` spreads the batches of ``monte_carlo_equity`` over a
+joblib process pool. Work is dispatched in waves of contiguous batch
+ranges, and the main process folds the returned per-batch statistics in
+batch order with the same stopping rule as the single-process loop. Batch
+``i`` draws from the ``i``-th child of ``SeedSequence(seed)`` wherever it
+runs, so for a given seed the result (equity, samples, standard error) is
+identical to ``monte_carlo_equity`` with the same batch size (both default
+to ``DEFAULT_BATCH_SIZE``); batches computed past the stopping point are
+discarded. Only a time budget makes runs differ. Per-task dispatch is
+amortized by handing each worker several batches per wave
+(``batches_per_task``), which leaves the result unchanged.
+
+Workers never receive the lookup tables by pickle: they map the ``.npy``
+files from ``lookup.shared_table_dir()`` read-only, so every process shares
+the same physical pages. Only the spot and a few integers travel to the
+workers and one small ``BatchStats`` per batch travels back.
+"""
+
+from __future__ import annotations
+
+import time
+from math import ceil
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+
+from ..engine import lookup
+from .equity import (
+    DEFAULT_BATCH_SIZE,
+    BatchStats,
+    EquityAccumulator,
+    EquityResult,
+    EquitySpot,
+    Opponents,
+    batch_rng,
+    check_stopping,
+    sample_batch,
+)
+
+
+def _sample_batches(
+    spot: EquitySpot,
+    table_dir: Path,
+    entropy: int | Sequence[int] | None,
+    spawn_key: Tuple[int, ...],
+    batches: range,
+    batch_size: int,
+) -> List[BatchStats]:
+    """Worker task: sample a contiguous range of batches."""
+    lookup.attach_tables(table_dir)
+    seed_sequence = np.random.SeedSequence(entropy, spawn_key=spawn_key)
+    return [
+        BatchStats.from_shares(
+            sample_batch(spot, batch_rng(seed_sequence, batch), batch_size)
+        )
+        for batch in batches
+    ]
+
+
+def split_batches(start: int, count: int, parts: int) -> List[range]:
+    """Split ``count`` batch indices from ``start`` into contiguous ranges.
+
+    Sizes differ by at most one; empty ranges are dropped.
+    """
+    share, extra = divmod(count, parts)
+    ranges = []
+    for part in range(parts):
+        size = share + (1 if part < extra else 0)
+        if size:
+            ranges.append(range(start, start + size))
+            start += size
+    return ranges
+
+
+def parallel_equity(
+    hero: Sequence[int],
+    board: Sequence[int] = (),
+    opponents: Opponents = 1,
+    *,
+    dead: Sequence[int] = (),
+    n_jobs: int = -1,
+    tolerance: float = 0.005,
+    max_samples: int = 100_000,
+    min_samples: int = DEFAULT_BATCH_SIZE,
+    time_budget: Optional[float] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    batches_per_task: int = 8,
+    seed: Optional[int] = None,
+) -> EquityResult:
+    """Estimate hero's equity with sampling spread over worker processes.
+
+    Takes the same spot and stopping-rule arguments as
+    ``monte_carlo_equity``, with the same defaults, and returns the same
+    result for the same seed.
+
+    Args:
+        hero: Hero's two hole cards
+        board: Known board cards (0-5)
+        opponents: Number of random opponents, or one entry per opponent
+            (None for a random hand, else a range of combos)
+        dead: Other cards known to be out of play
+        n_jobs: Worker processes (joblib convention: -1 uses every core)
+        tolerance: Stop once the standard error of equity is at most this
+        max_samples: Hard cap on runouts (rounded up to whole batches)
+        min_samples: Runouts to score before the tolerance is checked
+        time_budget: Stop after the first wave finishing past this many
+            seconds, if given
+        batch_size: Runouts dealt per vectorized batch
+        batches_per_task: Batches each worker samples per wave; larger
+            values amortize dispatch without changing the result
+        seed: Seed for reproducible results
+
+    Returns:
+        Equity, outright-win and tie probabilities, runouts used and the
+        standard error
+
+    Raises:
+        ValueError: If the spot, the stopping rule or the pool size is
+            invalid
+    """
+    check_stopping(tolerance, max_samples, min_samples, batch_size)
+    if batches_per_task <= 0:
+        raise ValueError(f"batches_per_task must be positive, got {batches_per_task}")
+    spot = EquitySpot.build(hero, board, opponents, dead)
+    seed_sequence = np.random.SeedSequence(seed)
+    workers = effective_n_jobs(n_jobs)
+    table_dir = lookup.shared_table_dir()
+
+    start = time.perf_counter()
+    stats = EquityAccumulator()
+    next_batch = 0
+    total_batches = ceil(max_samples / batch_size)
+    with Parallel(n_jobs=workers) as parallel:
+        while next_batch < total_batches:
+            wave = min(workers * batches_per_task, total_batches - next_batch)
+            tasks = parallel(
+                delayed(_sample_batches)(
+                    spot,
+                    table_dir,
+                    seed_sequence.entropy,
+                    seed_sequence.spawn_key,
+                    batches,
+                    batch_size,
+                )
+                for batches in split_batches(next_batch, wave, workers)
+            )
+            next_batch += wave
+            for batch in (batch for task in tasks for batch in task):
+                stats.add(batch)
+                if stats.converged(tolerance, min_samples):
+                    return stats.result(time.perf_counter() - start)
+            if time_budget is not None and time.perf_counter() - start >= time_budget:
+                break
+    return stats.result(time.perf_counter() - start)
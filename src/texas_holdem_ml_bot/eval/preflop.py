@@ -0,0 +1,414 @@
+"""Precomputed preflop all-in equities over the 169 starting-hand classes.
+
+Two float32 tables live under ``data/models/preflop_equity_v1``:
+
+    heads_up.npy   (169, 169)  equity of the row class against the column
+                               class, averaged over every card-disjoint
+                               combo pair (rows + transpose == 1)
+    vs_random.npy  (169, 8)    equity of a class against 1..8 random hands
+
+Class indices follow ``canonical.preflop_class``. Lookups are plain array
+reads on memory-mapped files, loaded lazily on first use. Loading never
+builds missing tables: generation is an explicit step (see below).
+
+Generation:
+    The heads-up matrix depends only on the ~47k suit-isomorphic matchups
+    between two concrete hands. Each sampled board is ranked once for all
+    1,326 combos, then every matchup is scored on it with one vectorized
+    comparison, so every board serves all 14,196 class pairs at once.
+    Matchups are weighted by their multiplicity within each class pair.
+    The multiway column samples runouts with ``monte_carlo_equity`` (a
+    class's equity against random hands is the same for all its combos).
+
+    Run ``python -m texas_holdem_ml_bot.eval.preflop`` to (re)build the
+    tables; the defaults take a few minutes and give standard errors of
+    roughly 0.2-0.4%.
+
+``approximate_multiway_equity`` combines heads-up entries into a quick
+estimate for several known classes, treating each opponent as independent.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..engine.canonical import NUM_PREFLOP_CLASSES, preflop_class, preflop_class_combos
+from ..engine.cards import NUM_CARDS
+from ..engine.evaluator import rank_boards
+from ..utils.paths import MODELS_DIR
+from ..utils.storage import save_npy_atomic
+from .equity import COMBO_INDEX, COMBOS, NUM_COMBOS, combo_conflicts, monte_carlo_equity
+
+TABLE_VERSION = 1
+DEFAULT_TABLE_DIR = MODELS_DIR / f"preflop_equity_v{TABLE_VERSION}"
+
+MAX_OPPONENTS = 8
+
+DEFAULT_NUM_BOARDS = 100_000
+DEFAULT_MULTIWAY_SAMPLES = 20_000
+
+# Boards ranked per vectorized chunk during generation
+_BOARD_CHUNK = 256
+
+_TABLE_FILES = ("heads_up", "vs_random")
+
+
+@dataclass(frozen=True, slots=True)
+class PreflopTables:
+    """Loaded preflop equity tables.
+
+    Args:
+        heads_up: ``(169, 169)`` class-vs-class equity
+        vs_random: ``(169, 8)`` equity against 1..8 random hands
+        directory: Directory the tables are mapped from (None if in memory)
+    """
+
+    heads_up: np.ndarray
+    vs_random: np.ndarray
+    directory: Path | None = None
+
+
+_TABLES: PreflopTables | None = None
+
+
+# ---------------------------------------------------------------------------
+# Generation
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class _Matchups:
+    """Suit-isomorphic heads-up matchups grouped by class pair.
+
+    Args:
+        hero: Combo id of each matchup's representative first hand
+        villain: Combo id of each matchup's representative second hand
+        weight: Number of concrete combo pairs each matchup stands for
+        pair: Class-pair index (row of ``pairs``) of each matchup
+        pairs: ``(P, 2)`` class pairs ``(i, j)`` with ``i < j``
+    """
+
+    hero: np.ndarray
+    villain: np.ndarray
+    weight: np.ndarray
+    pair: np.ndarray
+    pairs: np.ndarray
+
+
+def _enumerate_matchups() -> _Matchups:
+    """Group every card-disjoint combo pair of each class pair by isomorphism.
+
+    Two combo pairs are isomorphic when their per-suit ``(hero ranks,
+    villain ranks)`` masks match after sorting suits, as in
+    ``canonical.canonical_key``; the masks are packed into one integer per
+    suit so the grouping is a single ``np.unique`` over all pairs.
+    """
+    class_ids = [
+        np.array([COMBO_INDEX[combo] for combo in preflop_class_combos(c)])
+        for c in range(NUM_PREFLOP_CLASSES)
+    ]
+    conflicts = combo_conflicts()
+    heroes, villains, pair_ids = [], [], []
+    pairs: List[Tuple[int, int]] = []
+    for i in range(NUM_PREFLOP_CLASSES):
+        for j in range(i + 1, NUM_PREFLOP_CLASSES):
+            hero, villain = np.meshgrid(class_ids[i], class_ids[j], indexing="ij")
+            disjoint = ~conflicts[hero, villain]
+            heroes.append(hero[disjoint])
+            villains.append(villain[disjoint])
+            pair_ids.append(np.full(np.count_nonzero(disjoint), len(pairs)))
+            pairs.append((i, j))
+    hero = np.concatenate(heroes)
+    villain = np.concatenate(villains)
+    pair = np.concatenate(pair_ids)
+
+    # Per suit: hero rank mask in the high 13 bits, villain's in the low 13
+    patterns = np.zeros((len(hero), 4), dtype=np.int64)
+    rows = np.arange(len(hero))
+    for combo, shift in ((hero, 13), (villain, 0)):
+        for card in COMBOS[combo].T:
+            patterns[rows, card & 3] |= 1 << ((card >> 2) + shift)
+    patterns.sort(axis=1)
+    keys = np.column_stack([pair, patterns])
+    _, first, counts = np.unique(keys, axis=0, return_index=True, return_counts=True)
+    return _Matchups(
+        hero=hero[first],
+        villain=villain[first],
+        weight=counts.astype(np.float64),
+        pair=pair[first],
+        pairs=np.array(pairs, dtype=np.intp),
+    )
+
+
+def _random_boards(rng: np.random.Generator, count: int) -> np.ndarray:
+    """Draw ``count`` uniformly random five-card boards."""
+    keys = rng.random((count, NUM_CARDS))
+    return np.argpartition(keys, 4, axis=1)[:, :5]
+
+
+def generate_heads_up(
+    num_boards: int = DEFAULT_NUM_BOARDS, seed: Optional[int] = 0
+) -> np.ndarray:
+    """Estimate the 169x169 class-vs-class equity matrix.
+
+    Args:
+        num_boards: Random boards to score every matchup on
+        seed: Seed for reproducible tables
+
+    Returns:
+        ``(169, 169)`` float32 matrix with ``m + m.T == 1``
+    """
+    matchups = _enumerate_matchups()
+    rng = np.random.default_rng(seed)
+    num_matchups = len(matchups.hero)
+    share_sums = np.zeros(num_matchups)
+    deal_counts = np.zeros(num_matchups)
+
+    done = 0
+    while done < num_boards:
+        count = min(_BOARD_CHUNK, num_boards - done)
+        boards = _random_boards(rng, count)
+        rows = np.repeat(np.arange(count), NUM_COMBOS)
+        ranks = rank_boards(boards, np.tile(COMBOS, (count, 1)), rows)
+        ranks = ranks.reshape(count, NUM_COMBOS).astype(np.int16)
+
+        # Combos sharing a card with the board cannot be dealt on it
+        taken = np.zeros((count, NUM_CARDS), dtype=bool)
+        np.put_along_axis(taken, boards, True, axis=1)
+        ranks[taken[:, COMBOS[:, 0]] | taken[:, COMBOS[:, 1]]] = -1
+
+        hero = ranks[:, matchups.hero]
+        villain = ranks[:, matchups.villain]
+        live = (hero >= 0) & (villain >= 0)
+        shares = (hero > villain) + 0.5 * (hero == villain)
+        share_sums += np.where(live, shares, 0.0).sum(axis=0)
+        deal_counts += live.sum(axis=0)
+        done += count
+
+    equity = share_sums / np.maximum(deal_counts, 1)
+    num_pairs = len(matchups.pairs)
+    weighted = np.bincount(matchups.pair, matchups.weight * equity, num_pairs)
+    totals = np.bincount(matchups.pair, matchups.weight, num_pairs)
+
+    table = np.full((NUM_PREFLOP_CLASSES, NUM_PREFLOP_CLASSES), 0.5)
+    rows, cols = matchups.pairs[:, 0], matchups.pairs[:, 1]
+    table[rows, cols] = weighted / totals
+    table[cols, rows] = 1.0 - table[rows, cols]
+    return table.astype(np.float32)
+
+
+def generate_vs_random(
+    samples: int = DEFAULT_MULTIWAY_SAMPLES, seed: Optional[int] = 0
+) -> np.ndarray:
+    """Estimate each class's equity against 1..8 random hands.
+
+    Args:
+        samples: Runouts per (class, opponent count) entry
+        seed: Seed for reproducible tables
+
+    Returns:
+        ``(169, 8)`` float32 matrix; column ``k - 1`` is ``k`` opponents
+    """
+    seeds = np.random.SeedSequence(seed).generate_state(
+        NUM_PREFLOP_CLASSES * MAX_OPPONENTS
+    )
+    table = np.zeros((NUM_PREFLOP_CLASSES, MAX_OPPONENTS), dtype=np.float32)
+    for index in range(NUM_PREFLOP_CLASSES):
+        hero = preflop_class_combos(index)[0]
+        for opponents in range(1, MAX_OPPONENTS + 1):
+            result = monte_carlo_equity(
+                hero,
+                opponents=opponents,
+                tolerance=0.0,
+                max_samples=samples,
+                min_samples=min(samples, 1000),
+                batch_size=min(samples, 1000),
+                seed=int(seeds[index * MAX_OPPONENTS + opponents - 1]),
+            )
+            table[index, opponents - 1] = result.equity
+    return table
+
+
+def write_preflop_tables(
+    directory: Path | str = DEFAULT_TABLE_DIR,
+    *,
+    num_boards: int = DEFAULT_NUM_BOARDS,
+    multiway_samples: int = DEFAULT_MULTIWAY_SAMPLES,
+    seed: Optional[int] = 0,
+) -> Path:
+    """Generate the preflop tables and write them as float32 ``.npy`` files.
+
+    Args:
+        directory: Destination directory (created if missing)
+        num_boards: Boards sampled for the heads-up matrix
+        multiway_samples: Runouts per entry of the multiway table
+        seed: Seed for reproducible tables
+
+    Returns:
+        The directory the tables were written to
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    save_npy_atomic(directory / "heads_up.npy", generate_heads_up(num_boards, seed))
+    save_npy_atomic(
+        directory / "vs_random.npy", generate_vs_random(multiway_samples, seed)
+    )
+    return directory
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+
+def load_preflop_tables(
+    directory: Path | str = DEFAULT_TABLE_DIR, *, generate: bool = False
+) -> PreflopTables:
+    """Memory-map the preflop tables.
+
+    Args:
+        directory: Directory holding the ``.npy`` table files
+        generate: Write the tables (with default settings, which takes
+            minutes) if missing
+
+    Returns:
+        Loaded tables backed by read-only memory maps
+
+    Raises:
+        FileNotFoundError: If tables are missing and ``generate`` is False
+    """
+    directory = Path(directory)
+    paths = {name: directory / f"{name}.npy" for name in _TABLE_FILES}
+    if not all(path.exists() for path in paths.values()):
+        if not generate:
+            raise FileNotFoundError(
+                f"Preflop tables not found in {directory}; build them with "
+                f"'python -m texas_holdem_ml_bot.eval.preflop --directory {directory}'"
+            )
+        write_preflop_tables(directory)
+    return PreflopTables(
+        heads_up=np.load(paths["heads_up"], mmap_mode="r"),
+        vs_random=np.load(paths["vs_random"], mmap_mode="r"),
+        directory=directory.resolve(),
+    )
+
+
+def get_preflop_tables() -> PreflopTables:
+    """Return the process-wide tables, loading them on first use.
+
+    Raises:
+        FileNotFoundError: If the tables in ``DEFAULT_TABLE_DIR`` have not
+            been generated
+    """
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = load_preflop_tables(DEFAULT_TABLE_DIR, generate=False)
+    return _TABLES
+
+
+def use_preflop_tables(tables: PreflopTables | None) -> None:
+    """Install ``tables`` as the process-wide tables (None to reload lazily)."""
+    global _TABLES
+    _TABLES = tables
+
+
+# ---------------------------------------------------------------------------
+# Lookups
+# ---------------------------------------------------------------------------
+
+
+def _check_class(index: int) -> None:
+    """Reject indices outside 0..168."""
+    if not (0 <= index < NUM_PREFLOP_CLASSES):
+        raise ValueError(f"Invalid preflop class: {index} (must be 0-168)")
+
+
+def preflop_equity(hero_class: int, villain_class: int) -> float:
+    """Return a class's all-in equity against another class.
+
+    Raises:
+        ValueError: If a class index is outside 0..168
+    """
+    _check_class(hero_class)
+    _check_class(villain_class)
+    return float((_TABLES or get_preflop_tables()).heads_up[hero_class, villain_class])
+
+
+def preflop_equity_vs_random(hero_class: int, num_opponents: int = 1) -> float:
+    """Return a class's all-in equity against random hands.
+
+    Raises:
+        ValueError: If the class is invalid or ``num_opponents`` is not 1-8
+    """
+    _check_class(hero_class)
+    if not (1 <= num_opponents <= MAX_OPPONENTS):
+        raise ValueError(
+            f"num_opponents must be 1-{MAX_OPPONENTS}, got {num_opponents}"
+        )
+    tables = _TABLES or get_preflop_tables()
+    return float(tables.vs_random[hero_class, num_opponents - 1])
+
+
+def preflop_hand_equity(hero: Sequence[int], villain: Sequence[int]) -> float:
+    """Return the class-level equity of two concrete hole-card pairs.
+
+    Suit interactions between the two hands (e.g. shared suits) are
+    averaged out; use ``eval.equity`` when they matter.
+    """
+    return preflop_equity(preflop_class(*hero), preflop_class(*villain))
+
+
+def approximate_multiway_equity(classes: Sequence[int]) -> np.ndarray:
+    """Estimate each player's equity in a multiway all-in from heads-up entries.
+
+    Each player's strength is the product of its heads-up equities against
+    every other player, normalized so the equities sum to 1. This ignores
+    card removal and correlation between opponents; use ``eval.equity``
+    for exact spots.
+
+    Args:
+        classes: Starting-hand class of every player (at least 2)
+
+    Returns:
+        ``(len(classes),)`` float array of approximate equities
+
+    Raises:
+        ValueError: If fewer than two classes are given or one is invalid
+    """
+    if len(classes) < 2:
+        raise ValueError(f"Need at least 2 players, got {len(classes)}")
+    for index in classes:
+        _check_class(index)
+    heads_up = np.asarray((_TABLES or get_preflop_tables()).heads_up, np.float64)
+    matrix = heads_up[np.ix_(classes, classes)]
+    np.fill_diagonal(matrix, 1.0)
+    strength = matrix.prod(axis=1)
+    return strength / strength.sum()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command-line entry point: build the tables."""
+    parser = argparse.ArgumentParser(description="Build preflop equity tables.")
+    parser.add_argument("--directory", default=str(DEFAULT_TABLE_DIR))
+    parser.add_argument("--boards", type=int, default=DEFAULT_NUM_BOARDS)
+    parser.add_argument(
+        "--multiway-samples", type=int, default=DEFAULT_MULTIWAY_SAMPLES
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    directory = write_preflop_tables(
+        args.directory,
+        num_boards=args.boards,
+        multiway_samples=args.multiway_samples,
+        seed=args.seed,
+    )
+    print(f"Wrote preflop tables to {directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""Range-vs-range equity over weighted combo vectors.
+
+A range is a ``(1326,)`` vector of non-negative relative weights indexed
+like ``equity.COMBOS`` (0 = never held). Building one from combos, preflop
+classes or a single hand is a cheap array fill, and card removal against
+the board or dead cards is plain masking.
+
+``range_equity`` ranks all 1,326 combos once per board completion with
+``rank_boards`` and accumulates the villain weight at each hand rank, so
+every hero combo's wins and ties come from a prefix sum instead of a loop
+over villain combos. Blockers between the two ranges are subtracted with
+the precomputed ``CARD_COMBOS`` table: a hero combo conflicts with exactly
+the 101 villain combos holding one of its two cards. A river board is a
+single pass (~20 ms for two full ranges); turns and flops enumerate the
+remaining cards (up to 48 and 1,081 completions, ~0.1 s and ~2 s).
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ..engine.canonical import preflop_class_combos
+from ..engine.cards import NUM_CARDS
+from ..engine.evaluator import rank_boards
+from ..engine.lookup import NUM_HAND_CLASSES
+from .equity import COMBO_INDEX, COMBOS, NUM_COMBOS, HandRange
+
+# The 51 combos holding each card; combo i conflicts with exactly the union
+# of the rows of its two cards (a compact form of ``combo_conflicts``)
+CARD_COMBOS = np.array(
+    [np.flatnonzero((COMBOS == card).any(axis=1)) for card in range(NUM_CARDS)],
+    dtype=np.intp,
+)
+
+# (board completion, hero combo, blocking combo) cells per vectorized chunk
+_CHUNK_CELLS = 4_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class RangeEquity:
+    """Hero range's share of the pot against a villain range.
+
+    Args:
+        equity: Expected pot share over all compatible deals
+        win: Probability of winning outright
+        tie: Probability of splitting the pot
+        combo_equity: ``(1326,)`` equity of each hero combo against the
+            villain range (NaN where hero has no weight or no deal exists)
+        runouts: Board completions enumerated
+        elapsed: Wall-clock seconds spent
+    """
+
+    equity: float
+    win: float
+    tie: float
+    combo_equity: np.ndarray
+    runouts: int
+    elapsed: float
+
+
+# ---------------------------------------------------------------------------
+# Range vectors
+# ---------------------------------------------------------------------------
+
+
+def range_vector(
+    combos: HandRange, weights: Optional[Sequence[float]] = None
+) -> np.ndarray:
+    """Build a weight vector from hole-card combos.
+
+    Args:
+        combos: ``(first, second)`` card-index pairs in either order
+        weights: Weight per combo (default 1.0 each); a combo listed twice
+            gets the sum of its weights
+
+    Returns:
+        ``(1326,)`` float64 weight vector
+
+    Raises:
+        ValueError: If a card index is invalid, a combo repeats a card, or
+            weights do not match the combos
+    """
+    pairs = np.asarray(combos, dtype=np.intp).reshape(-1, 2)
+    if pairs.size and (pairs.min() < 0 or pairs.max() >= NUM_CARDS):
+        raise ValueError("Range has invalid card indices (must be 0-51)")
+    if np.any(pairs[:, 0] == pairs[:, 1]):
+        raise ValueError("Range combos need two different cards")
+    if weights is None:
+        values = np.ones(len(pairs))
+    else:
+        values = np.asarray(weights, dtype=np.float64)
+        if values.shape != (len(pairs),):
+            raise ValueError(
+                f"Expected {len(pairs)} weights, got {np.shape(weights)[0]}"
+            )
+    vector = np.zeros(NUM_COMBOS)
+    np.add.at(vector, COMBO_INDEX[pairs[:, 0], pairs[:, 1]], values)
+    return check_weights(vector)
+
+
+def full_range() -> np.ndarray:
+    """Return the range holding every combo with equal weight."""
+    return np.ones(NUM_COMBOS)
+
+
+def class_range(
+    classes: Sequence[int], weights: Optional[Sequence[float]] = None
+) -> np.ndarray:
+    """Build a weight vector from preflop classes (see ``preflop_class``).
+
+    Args:
+        classes: Starting-hand classes (0-168) in the range
+        weights: Weight per class, applied to each of its combos
+
+    Returns:
+        ``(1326,)`` float64 weight vector
+    """
+    if weights is None:
+        weights = [1.0] * len(classes)
+    if len(weights) != len(classes):
+        raise ValueError(f"Expected {len(classes)} weights, got {len(weights)}")
+    combos = []
+    combo_weights = []
+    for index, weight in zip(classes, weights):
+        members = preflop_class_combos(index)
+        combos += members
+        combo_weights += [weight] * len(members)
+    return range_vector(combos, combo_weights)
+
+
+def check_weights(weights: np.ndarray | Sequence[float]) -> np.ndarray:
+    """Validate a weight vector and return it as a float64 array.
+
+    Raises:
+        ValueError: If it is not ``(1326,)`` or has negative or non-finite
+            entries
+    """
+    vector = np.asarray(weights, dtype=np.float64)
+    if vector.shape != (NUM_COMBOS,):
+        raise ValueError(f"Range weights must have shape (1326,), got {vector.shape}")
+    if not np.all(np.isfinite(vector)) or np.any(vector < 0):
+        raise ValueError("Range weights must be finite and non-negative")
+    return vector
+
+
+def remove_cards(weights: np.ndarray, cards: Sequence[int]) -> np.ndarray:
+    """Return a copy of ``weights`` with combos touching ``cards`` zeroed."""
+    blocked = np.zeros(NUM_CARDS, dtype=bool)
+    blocked[list(cards)] = True
+    return np.where(blocked[COMBOS[:, 0]] | blocked[COMBOS[:, 1]], 0.0, weights)
+
+
+# ---------------------------------------------------------------------------
+# Equity
+# ---------------------------------------------------------------------------
+
+
+def _check_board(board: Sequence[int], dead: Sequence[int]) -> None:
+    """Validate board and dead cards."""
+    if not (3 <= len(board) <= 5):
+        raise ValueError(f"Board must have 3-5 cards, got {len(board)}")
+    known = [*board, *dead]
+    for index in known:
+        if not (0 <= index < NUM_CARDS):
+            raise ValueError(f"Invalid card index: {index} (must be 0-51)")
+    if len(set(known)) != len(known):
+        raise ValueError("Board and dead cards must be distinct")
+
+
+def range_equity(
+    hero_range: np.ndarray | Sequence[float],
+    villain_range: np.ndarray | Sequence[float],
+    board: Sequence[int],
+    *,
+    dead: Sequence[int] = (),
+) -> RangeEquity:
+    """Compute a hero range's all-in equity against a villain range.
+
+    Every deal -- a hero combo, a villain combo and a board completion that
+    share no card -- counts with the product of the two combos' weights.
+
+    Args:
+        hero_range: ``(1326,)`` hero weight vector
+        villain_range: ``(1326,)`` villain weight vector
+        board: Known board cards (3-5)
+        dead: Other cards known to be out of play
+
+    Returns:
+        Overall and per-combo equity
+
+    Raises:
+        ValueError: If the board or weights are invalid, a range has no
+            combos left after card removal, or no deal is possible
+    """
+    _check_board(board, dead)
+    start = time.perf_counter()
+    known = [*board, *dead]
+    hero_weights = remove_cards(check_weights(hero_range), known)
+    villain_weights = remove_cards(check_weights(villain_range), known)
+    hero = np.flatnonzero(hero_weights)
+    villain = np.flatnonzero(villain_weights)
+    if not len(hero):
+        raise ValueError("Hero range has no combos left after card removal")
+    if not len(villain):
+        raise ValueError("Villain range has no combos left after card removal")
+
+    hero_first, hero_second = COMBOS[hero, 0], COMBOS[hero, 1]
+
+    # Board completions, one row each
+    unknown = np.ones(NUM_CARDS, dtype=bool)
+    unknown[known] = False
+    missing = 5 - len(board)
+    runout_cards = list(combinations(np.flatnonzero(unknown).tolist(), missing))
+    completions = np.array(runout_cards, dtype=np.intp).reshape(
+        len(runout_cards), missing
+    )
+
+    wins = np.zeros(len(hero))
+    ties = np.zeros(len(hero))
+    deals = np.zeros(len(hero))
+    chunk = max(1, _CHUNK_CELLS // (len(hero) * CARD_COMBOS.shape[1]))
+    for offset in range(0, len(completions), chunk):
+        block = completions[offset : offset + chunk]
+        count = len(block)
+        boards = np.column_stack(
+            [
+                np.broadcast_to(np.array(board, dtype=np.intp), (count, 5 - missing)),
+                block,
+            ]
+        )
+        ranks = rank_boards(
+            boards,
+            np.tile(COMBOS, (count, 1)),
+            np.repeat(np.arange(count), NUM_COMBOS),
+        ).reshape(count, NUM_COMBOS)
+
+        # Combos holding a card of the completion cannot be dealt with it
+        taken = np.zeros((count, NUM_CARDS), dtype=bool)
+        np.put_along_axis(taken, block, True, axis=1)
+        ranks[taken[:, COMBOS[:, 0]] | taken[:, COMBOS[:, 1]]] = 0
+        mass = np.where(ranks > 0, villain_weights, 0.0)
+
+        # Villain weight at each rank, and strictly below it, per board
+        rows = np.arange(count)[:, None]
+        at_rank = np.zeros((count, NUM_HAND_CLASSES + 1))
+        np.add.at(at_rank, (rows, ranks), mass)
+        below = np.cumsum(at_rank, axis=1) - at_rank
+        hero_ranks = ranks[:, hero]
+        hero_live = hero_ranks > 0
+        beaten = np.take_along_axis(below, hero_ranks, axis=1)
+        tied = np.take_along_axis(at_rank, hero_ranks, axis=1)
+        dealt = mass.sum(axis=1, keepdims=True) + mass[:, hero]
+        tied += mass[:, hero]
+
+        # Remove villain combos sharing a card with each hero combo
+        card_ranks = ranks[:, CARD_COMBOS]
+        card_mass = mass[:, CARD_COMBOS]
+        for cards in (hero_first, hero_second):
+            blocked_ranks = card_ranks[:, cards]
+            blocked_mass = card_mass[:, cards]
+            reference = hero_ranks[:, :, None]
+            beaten -= (blocked_mass * (blocked_ranks < reference)).sum(axis=2)
+            tied -= (blocked_mass * (blocked_ranks == reference)).sum(axis=2)
+            dealt -= blocked_mass.sum(axis=2)
+
+        wins += np.where(hero_live, beaten, 0.0).sum(axis=0)
+        ties += np.where(hero_live, tied, 0.0).sum(axis=0)
+        deals += np.where(hero_live, dealt, 0.0).sum(axis=0)
+
+    hero_mass = hero_weights[hero]
+    total = float(hero_mass @ deals)
+    if total == 0.0:
+        raise ValueError("Ranges leave no possible deal")
+    combo_equity = np.full(NUM_COMBOS, np.nan)
+    dealt = deals > 0
+    combo_equity[hero[dealt]] = (wins[dealt] + 0.5 * ties[dealt]) / deals[dealt]
+    win = float(hero_mass @ wins) / total
+    tie = float(hero_mass @ ties) / total
+    return RangeEquity(
+        equity=win + 0.5 * tie,
+        win=win,
+        tie=tie,
+        combo_equity=combo_equity,
+        runouts=len(completions),
+        elapsed=time.perf_counter() - start,
+    )
+
+
+def hand_vs_range_equity(
+    hero: Sequence[int],
+    villain_range: np.ndarray | Sequence[float],
+    board: Sequence[int],
+    *,
+    dead: Sequence[int] = (),
+) -> RangeEquity:
+    """Compute a known hand's all-in equity against a villain range.
+
+    Args:
+        hero: Hero's two hole cards
+        villain_range: ``(1326,)`` villain weight vector
+        board: Known board cards (3-5)
+        dead: Other cards known to be out of play
+
+    Returns:
+        Equity against the range (``combo_equity`` holds hero's entry only)
+
+    Raises:
+        ValueError: If the cards are invalid or repeat, or the villain
+            range has no combos left after card removal
+    """
+    if len(hero) != 2:
+        raise ValueError(f"Hero needs exactly 2 hole cards, got {len(hero)}")
+    _check_board(board, dead)
+    for index in hero:
+        if not (0 <= index < NUM_CARDS):
+            raise ValueError(f"Invalid card index: {index} (must be 0-51)")
+    known = [*hero, *board, *dead]
+    if len(set(known)) != len(known):
+        raise ValueError("Hero, board and dead cards must be distinct")
+    return range_equity(
+        range_vector([(hero[0], hero[1])]), villain_range, board, dead=dead
+    )
@@ -0,0 +1,240 @@
+"""Per-board ranking of every hole-card combo on a complete river.
+
+On a five-card board each of the 1,081 live combos has a fixed hand rank.
+``RiverRanking`` scores them all with one ``rank_boards`` call, sorts them
+from weakest to strongest and records the tie groups, so river questions
+become array reads:
+
+* showdowns compare ``rank_of`` lookups,
+* the number of combos a hand beats or ties is a binary search,
+* equity against a weighted range is a prefix sum over the sorted order,
+  with blockers removed through the 51 combos holding each hero card
+  (``ranges.CARD_COMBOS``),
+* percentile hand strength is equity against the uniform range, computed
+  for all combos once per ranking.
+
+``river_ranking`` memoizes rankings per board (card order does not
+matter) in an ``LRUCache`` exposed as ``river_ranking.cache``; one entry
+takes about 14 KB.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..engine.cards import NUM_CARDS
+from ..engine.evaluator import rank_boards
+from ..utils.cache import lru_cached
+from .equity import COMBO_INDEX, COMBOS, NUM_COMBOS
+from .ranges import CARD_COMBOS, check_weights
+
+# Boards kept by ``river_ranking``
+RIVER_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class RiverRanking:
+    """All live combos of one river board, sorted by showdown strength.
+
+    Args:
+        board: The five board cards, sorted
+        combos: ``(L,)`` combo ids (see ``equity.COMBOS``), weakest first
+        ranks: ``(L,)`` hand-class ranks aligned with ``combos``
+        group_starts: ``(G + 1,)`` offsets into ``combos`` where each tie
+            group starts, plus ``L`` at the end
+        rank_of: ``(1326,)`` rank of every combo (0 if it uses a board card)
+        group_of: ``(1326,)`` tie group of every combo (-1 if blocked)
+    """
+
+    board: Tuple[int, ...]
+    combos: np.ndarray
+    ranks: np.ndarray
+    group_starts: np.ndarray
+    rank_of: np.ndarray
+    group_of: np.ndarray
+    _strengths: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def build(cls, board: Sequence[int]) -> RiverRanking:
+        """Score and sort every combo that avoids the board.
+
+        Raises:
+            ValueError: If the board is not five distinct valid cards
+        """
+        if len(board) != 5:
+            raise ValueError(f"River board needs 5 cards, got {len(board)}")
+        for index in board:
+            if not (0 <= index < NUM_CARDS):
+                raise ValueError(f"Invalid card index: {index} (must be 0-51)")
+        if len(set(board)) != 5:
+            raise ValueError("Board cards must be distinct")
+
+        on_board = np.zeros(NUM_CARDS, dtype=bool)
+        on_board[list(board)] = True
+        live = np.flatnonzero(~(on_board[COMBOS[:, 0]] | on_board[COMBOS[:, 1]]))
+        live_ranks = rank_boards(
+            np.array([board], dtype=np.intp), COMBOS[live], np.zeros(len(live), np.intp)
+        )
+        order = np.argsort(live_ranks, kind="stable")
+        combos = live[order].astype(np.int16)
+        ranks = live_ranks[order].astype(np.int16)
+
+        new_group = np.flatnonzero(np.diff(ranks)) + 1
+        group_starts = np.concatenate([[0], new_group, [len(ranks)]]).astype(np.int32)
+        groups = np.repeat(
+            np.arange(len(group_starts) - 1, dtype=np.int16), np.diff(group_starts)
+        )
+        rank_of = np.zeros(NUM_COMBOS, dtype=np.int16)
+        rank_of[combos] = ranks
+        group_of = np.full(NUM_COMBOS, -1, dtype=np.int16)
+        group_of[combos] = groups
+        combos.setflags(write=False)
+        ranks.setflags(write=False)
+        group_starts.setflags(write=False)
+        rank_of.setflags(write=False)
+        group_of.setflags(write=False)
+        return cls(
+            board=tuple(sorted(board)),
+            combos=combos,
+            ranks=ranks,
+            group_starts=group_starts,
+            rank_of=rank_of,
+            group_of=group_of,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of live combos (1,081)."""
+        return len(self.combos)
+
+    @property
+    def num_groups(self) -> int:
+        """Number of distinct hand strengths on the board."""
+        return len(self.group_starts) - 1
+
+    def tie_group(self, group: int) -> np.ndarray:
+        """Return the combo ids of one tie group (0 = weakest)."""
+        return self.combos[self.group_starts[group] : self.group_starts[group + 1]]
+
+    def combo_id(self, first: int, second: int) -> int:
+        """Return the id of a live hole-card pair.
+
+        Raises:
+            ValueError: If the cards are invalid, equal or on the board
+        """
+        if not (0 <= first < NUM_CARDS and 0 <= second < NUM_CARDS):
+            raise ValueError("Invalid hole card index (must be 0-51)")
+        combo = int(COMBO_INDEX[first, second])
+        if combo < 0 or self.rank_of[combo] == 0:
+            raise ValueError(
+                f"Hole cards ({first}, {second}) are not live on this board"
+            )
+        return combo
+
+    def rank(self, first: int, second: int) -> int:
+        """Return the hand-class rank (1..7462) of a hole-card pair."""
+        return int(self.rank_of[self.combo_id(first, second)])
+
+    def count_below(self, rank: int) -> int:
+        """Number of live combos strictly weaker than ``rank``."""
+        return int(np.searchsorted(self.ranks, rank, side="left"))
+
+    def count_at_or_below(self, rank: int) -> int:
+        """Number of live combos no stronger than ``rank``."""
+        return int(np.searchsorted(self.ranks, rank, side="right"))
+
+    def equity_vs_range(self, weights: np.ndarray | Sequence[float]) -> np.ndarray:
+        """Return every combo's showdown equity against a weighted range.
+
+        Villain combos that share a card with the hero combo are excluded,
+        so each entry is exact for that hero hand.
+
+        Args:
+            weights: ``(1326,)`` villain weight vector (board combos ignored)
+
+        Returns:
+            ``(1326,)`` float array; NaN for combos using a board card or
+            with no villain combo left to face
+        """
+        mass = np.where(self.rank_of > 0, check_weights(weights), 0.0)
+        sorted_mass = mass[self.combos]
+        before = np.concatenate([[0.0], np.cumsum(sorted_mass)])
+        starts, ends = self.group_starts[:-1], self.group_starts[1:]
+
+        hero = self.combos
+        group = self.group_of[hero]
+        beaten = before[starts[group]]
+        tied = before[ends[group]] - beaten + mass[hero]
+        deals = before[-1] + mass[hero]
+
+        # Drop villain combos holding either hero card
+        hero_ranks = self.ranks[:, None]
+        for cards in (COMBOS[hero, 0], COMBOS[hero, 1]):
+            blocked = CARD_COMBOS[cards]
+            blocked_ranks = self.rank_of[blocked]
+            blocked_mass = mass[blocked]
+            beaten -= (blocked_mass * (blocked_ranks < hero_ranks)).sum(axis=1)
+            tied -= (blocked_mass * (blocked_ranks == hero_ranks)).sum(axis=1)
+            deals -= blocked_mass.sum(axis=1)
+
+        equity = np.full(NUM_COMBOS, np.nan)
+        dealt = deals > 0
+        equity[hero[dealt]] = (beaten[dealt] + 0.5 * tied[dealt]) / deals[dealt]
+        return equity
+
+    def hand_equity(
+        self, first: int, second: int, weights: np.ndarray | Sequence[float]
+    ) -> float:
+        """Return one hand's showdown equity against a weighted range.
+
+        Same value as the hand's ``equity_vs_range`` entry, summing the
+        villain mass below and within the hand's tie group and removing the
+        combos holding a hero card, without building the full vector.
+        """
+        combo = self.combo_id(first, second)
+        mass = np.where(self.rank_of > 0, check_weights(weights), 0.0)
+        group = self.group_of[combo]
+        start, end = self.group_starts[group], self.group_starts[group + 1]
+        sorted_mass = mass[self.combos]
+        beaten = sorted_mass[:start].sum()
+        tied = sorted_mass[start:end].sum() + mass[combo]
+        deals = sorted_mass.sum() + mass[combo]
+
+        rank = self.rank_of[combo]
+        blocked = CARD_COMBOS[[first, second]].ravel()
+        blocked_ranks = self.rank_of[blocked]
+        blocked_mass = mass[blocked]
+        beaten -= blocked_mass[blocked_ranks < rank].sum()
+        tied -= blocked_mass[blocked_ranks == rank].sum()
+        deals -= blocked_mass.sum()
+        if deals <= 0:
+            return float("nan")
+        return float((beaten + 0.5 * tied) / deals)
+
+    def strengths(self) -> np.ndarray:
+        """Return every combo's percentile strength against a random hand.
+
+        Strength is the fraction of the opponent's possible hands that are
+        beaten, counting ties as half (blocker-aware); NaN for board combos.
+        Computed on first use and kept (read-only) on the ranking.
+        """
+        strengths = self._strengths
+        if strengths is None:
+            strengths = self.equity_vs_range(np.ones(NUM_COMBOS))
+            strengths.setflags(write=False)
+            object.__setattr__(self, "_strengths", strengths)
+        return strengths
+
+    def strength(self, first: int, second: int) -> float:
+        """Return one hand's percentile strength against a random hand."""
+        return float(self.strengths()[self.combo_id(first, second)])
+
+
+@lru_cached(RIVER_CACHE_SIZE, key=lambda board: tuple(sorted(board)))
+def river_ranking(board: Sequence[int]) -> RiverRanking:
+    """Return the (memoized) ranking of a five-card board."""
+    return RiverRanking.build(board)
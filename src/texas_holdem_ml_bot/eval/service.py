@@ -0,0 +1,464 @@
+"""Micro-batching equity service on asyncio.
+
+Many simulated tables asking for equity at once would each pay the Python
+overhead of a separate evaluator call. ``EquityService`` lets them share
+it: callers ``await service.equity(...)`` from any coroutine on the loop,
+requests wait in an ``asyncio.Queue``, and one worker task takes the
+oldest request and keeps collecting until ``max_batch_size`` requests are
+in or ``max_delay`` seconds have passed since that request arrived. The
+batch is dealt and ranked together -- unseeded requests against random
+opponents share vectorized draws and ``evaluate_batch`` calls per
+(board size, opponent count) -- and then every caller's future is
+resolved. Batching pays off most for many small requests, where per-call
+overhead dominates.
+
+The batch runs on a worker thread by default so the loop keeps accepting
+requests meanwhile (NumPy releases the GIL for most of the work); pass
+``offload=False`` to compute on the loop itself.
+
+``stop`` refuses new requests at once, answers everything queued before it
+was called, then fails any request still unanswered with ``RuntimeError``
+(including those of a cancelled worker), so no caller waits forever.
+
+Each request scores a fixed number of runouts, so results carry the usual
+``std_error``. ``stats()`` reports queue depth, batch sizes and request
+latency percentiles (enqueue to result): a longer ``max_delay`` gives
+bigger, cheaper batches at the cost of latency.
+
+Usage::
+
+    async with EquityService(max_delay=0.002) as service:
+        result = await service.equity(hero, board, opponents=2)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..engine.evaluator import evaluate_batch
+from .equity import (
+    BatchStats,
+    EquityAccumulator,
+    EquityResult,
+    EquitySpot,
+    Opponents,
+    deal_batch,
+    score_showdowns,
+)
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_DELAY = 0.002
+DEFAULT_SAMPLES = 2000
+
+# Runouts dealt per shared vectorized draw
+_SHARED_ROWS = 8192
+
+# Latencies kept for percentile reporting
+LATENCY_WINDOW = 10_000
+
+# (spot, runouts, seed) of one request
+SpotRequest = Tuple[EquitySpot, int, Optional[int]]
+
+
+def _deal_shared(
+    spots: Sequence[EquitySpot], sizes: Sequence[int], rng: np.random.Generator
+) -> np.ndarray:
+    """Deal spots with random opponents, equal board size and opponent count.
+
+    All rows are drawn in one vectorized pass with a shared generator.
+
+    Returns:
+        ``((K + 1) * N, 7)`` hands laid out like ``deal_batch``, where ``N``
+        is the total of ``sizes`` and rows follow the order of ``spots``
+    """
+    rows = np.repeat(np.arange(len(spots)), sizes)
+    known = np.stack([spot.known_mask() for spot in spots])[rows]
+    num_known = len(spots[0].board)
+    num_board = 5 - num_known
+    num_random = 2 * spots[0].num_opponents + num_board
+
+    keys = rng.random(known.shape)
+    keys[known] = 2.0
+    drawn = np.argpartition(keys, num_random - 1, axis=1)[:, :num_random]
+    order = np.argsort(np.take_along_axis(keys, drawn, axis=1), axis=1)
+    drawn = np.take_along_axis(drawn, order, axis=1)
+
+    board = np.empty((len(rows), 5), dtype=np.intp)
+    if num_known:
+        board[:, :num_known] = np.array([spot.board for spot in spots])[rows]
+    board[:, num_known:] = drawn[:, :num_board]
+    holes = [np.array([spot.hero for spot in spots], dtype=np.intp)[rows]]
+    for first in range(num_board, num_random, 2):
+        holes.append(drawn[:, first : first + 2])
+    return np.concatenate(
+        [np.concatenate([hole, board], axis=1) for hole in holes], axis=0
+    )
+
+
+def _run_batch(
+    requests: Sequence[SpotRequest], rng: Optional[np.random.Generator] = None
+) -> List[EquityResult | Exception]:
+    """Deal and rank every request of a batch.
+
+    Unseeded requests against random opponents are grouped by board size
+    and opponent count and dealt together from ``rng`` in draws of up to
+    ``_SHARED_ROWS`` runouts, each ranked with one ``evaluate_batch`` call;
+    seeded or range-based requests are dealt on their own so seeds stay
+    reproducible. A request whose deal fails gets its exception in place
+    of a result; the others are unaffected.
+    """
+    start = time.perf_counter()
+    rng = np.random.default_rng() if rng is None else rng
+    outcomes: List[EquityResult | Exception | None] = [None] * len(requests)
+
+    shared: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    alone: List[int] = []
+    for position, (spot, _, seed) in enumerate(requests):
+        if seed is None and all(combos is None for combos in spot.ranges):
+            shared[(len(spot.board), spot.num_opponents)].append(position)
+        else:
+            alone.append(position)
+
+    # Units of hands scored together: (hands, players, member positions)
+    units: List[Tuple[np.ndarray, int, List[int]]] = []
+    for group in shared.values():
+        # Keep each draw small enough to stay in cache
+        chunks: List[List[int]] = [[]]
+        rows = 0
+        for position in group:
+            if chunks[-1] and rows + requests[position][1] > _SHARED_ROWS:
+                chunks.append([])
+                rows = 0
+            chunks[-1].append(position)
+            rows += requests[position][1]
+        for members in chunks:
+            spots = [requests[position][0] for position in members]
+            sizes = [requests[position][1] for position in members]
+            hands = _deal_shared(spots, sizes, rng)
+            units.append((hands, spots[0].num_opponents + 1, members))
+    for position in alone:
+        spot, samples, seed = requests[position]
+        try:
+            hands = deal_batch(spot, np.random.default_rng(seed), samples)
+        except ValueError as error:
+            outcomes[position] = error
+        else:
+            units.append((hands, spot.num_opponents + 1, [position]))
+
+    scored: List[Tuple[int, EquityAccumulator]] = []
+    for hands, players, members in units:
+        ranks = evaluate_batch(hands).reshape(players, -1)
+        shares = score_showdowns(ranks[0], ranks[1:])
+        row = 0
+        for position in members:
+            samples = requests[position][1]
+            stats = EquityAccumulator()
+            stats.add(BatchStats.from_shares(shares[row : row + samples]))
+            scored.append((position, stats))
+            row += samples
+
+    elapsed = time.perf_counter() - start
+    for position, stats in scored:
+        outcomes[position] = stats.result(elapsed)
+    return [outcome for outcome in outcomes if outcome is not None]
+
+
+def batch_equity(requests: Sequence[SpotRequest]) -> List[EquityResult]:
+    """Estimate equity for many spots with shared vectorized calls.
+
+    Args:
+        requests: ``(spot, runouts, seed)`` per spot
+
+    Returns:
+        One fixed-sample result per spot, in order
+
+    Raises:
+        ValueError: If any spot cannot be dealt
+    """
+    results = []
+    for outcome in _run_batch(requests):
+        if isinstance(outcome, Exception):
+            raise outcome
+        results.append(outcome)
+    return results
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceStats:
+    """Snapshot of service counters.
+
+    Args:
+        requests: Requests answered (results and errors)
+        batches: Batches run
+        queue_depth: Requests waiting for the next batch
+        mean_batch_size: Average requests per batch
+        max_batch_size: Largest batch run so far
+        latency_p50: Median seconds from enqueue to result
+        latency_p90: 90th-percentile latency in seconds
+        latency_p99: 99th-percentile latency in seconds
+    """
+
+    requests: int
+    batches: int
+    queue_depth: int
+    mean_batch_size: float
+    max_batch_size: int
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+
+
+@dataclass(slots=True)
+class _Pending:
+    """A queued request and the future its caller awaits."""
+
+    request: SpotRequest
+    future: asyncio.Future[EquityResult]
+    enqueued: float
+
+
+def _fail_all(batch: Sequence[_Pending]) -> None:
+    """Fail every unanswered request of ``batch``."""
+    for pending in batch:
+        if not pending.future.done():
+            pending.future.set_exception(
+                RuntimeError("Equity service stopped before answering the request")
+            )
+
+
+def _fail_queued(queue: asyncio.Queue[Optional[_Pending]]) -> None:
+    """Empty ``queue``, failing the requests left in it."""
+    while not queue.empty():
+        pending = queue.get_nowait()
+        if pending is not None:
+            _fail_all([pending])
+
+
+class EquityService:
+    """Batches concurrent equity requests into shared evaluator calls."""
+
+    def __init__(
+        self,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        samples: int = DEFAULT_SAMPLES,
+        offload: bool = True,
+    ) -> None:
+        """Configure the service (call ``start`` or use ``async with``).
+
+        Args:
+            max_batch_size: Most requests combined into one batch
+            max_delay: Longest a request waits for others to join its batch
+            samples: Default runouts per request
+            offload: Run batches on a worker thread instead of the loop
+
+        Raises:
+            ValueError: If a limit is not positive or the delay is negative
+        """
+        if max_batch_size <= 0:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+        if max_delay < 0:
+            raise ValueError(f"max_delay cannot be negative, got {max_delay}")
+        if samples <= 0:
+            raise ValueError(f"samples must be positive, got {samples}")
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.samples = samples
+        self.offload = offload
+        self._queue: Optional[asyncio.Queue[Optional[_Pending]]] = None
+        self._worker: Optional[asyncio.Task[None]] = None
+        self._stopping = False
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._requests = 0
+        self._batches = 0
+        self._batched = 0
+        self._largest = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker task is accepting requests."""
+        return (
+            self._worker is not None and not self._worker.done() and not self._stopping
+        )
+
+    async def start(self) -> None:
+        """Start the batching worker on the running event loop."""
+        if self._worker is not None and not self._worker.done():
+            return
+        self._stopping = False
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Answer every queued request, then stop the worker.
+
+        New requests are refused from the moment ``stop`` is called.
+        Requests the worker did not answer (because it was cancelled or
+        failed) get a ``RuntimeError``.
+        """
+        queue, worker = self._queue, self._worker
+        if queue is None or worker is None:
+            return
+        self._stopping = True
+        queue.put_nowait(None)
+        try:
+            # Also returns if the worker was cancelled or raised
+            await asyncio.wait({worker})
+        finally:
+            _fail_queued(queue)
+            self._worker = None
+            self._queue = None
+
+    async def __aenter__(self) -> EquityService:
+        """Start the service for an ``async with`` block."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Drain and stop the service."""
+        await self.stop()
+
+    async def equity(
+        self,
+        hero: Sequence[int],
+        board: Sequence[int] = (),
+        opponents: Opponents = 1,
+        *,
+        dead: Sequence[int] = (),
+        samples: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> EquityResult:
+        """Estimate hero's equity as part of the next batch.
+
+        Args:
+            hero: Hero's two hole cards
+            board: Known board cards (0-5)
+            opponents: Number of random opponents, or one entry per opponent
+                (None for a random hand, else a range of combos)
+            dead: Other cards known to be out of play
+            samples: Runouts to score (default: the service's ``samples``)
+            seed: Seed for a reproducible result
+
+        Returns:
+            Fixed-sample equity estimate
+
+        Raises:
+            RuntimeError: If the service is not running (or stopping), or
+                stopped before answering
+            ValueError: If the spot is invalid
+        """
+        if self._queue is None or not self.running:
+            raise RuntimeError("Equity service is not running")
+        spot = EquitySpot.build(hero, board, opponents, dead)
+        runouts = self.samples if samples is None else samples
+        if runouts <= 0:
+            raise ValueError(f"samples must be positive, got {runouts}")
+        future: asyncio.Future[EquityResult] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._queue.put_nowait(
+            _Pending((spot, runouts, seed), future, time.perf_counter())
+        )
+        return await future
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for the next batch."""
+        return 0 if self._queue is None else self._queue.qsize()
+
+    def stats(self) -> ServiceStats:
+        """Return a snapshot of the counters (latencies 0.0 before any)."""
+        if self._latencies:
+            p50, p90, p99 = np.percentile(list(self._latencies), (50, 90, 99))
+        else:
+            p50 = p90 = p99 = 0.0
+        return ServiceStats(
+            requests=self._requests,
+            batches=self._batches,
+            queue_depth=self.queue_depth,
+            mean_batch_size=self._batched / self._batches if self._batches else 0.0,
+            max_batch_size=self._largest,
+            latency_p50=float(p50),
+            latency_p90=float(p90),
+            latency_p99=float(p99),
+        )
+
+    async def _collect(
+        self, queue: asyncio.Queue[Optional[_Pending]], batch: List[_Pending]
+    ) -> bool:
+        """Add requests to ``batch`` (holding its first); return whether to stop."""
+        deadline = batch[0].enqueued + self.max_delay
+        while len(batch) < self.max_batch_size:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            if item is None:
+                return True
+            batch.append(item)
+        return False
+
+    async def _run(self) -> None:
+        """Worker loop: collect a batch, score it, resolve its futures.
+
+        However the loop ends (stop sentinel, cancellation or error), the
+        batch in flight and every request still queued are failed rather
+        than left pending.
+        """
+        queue = self._queue
+        assert queue is not None
+        loop = asyncio.get_running_loop()
+        batch: List[_Pending] = []
+        try:
+            while True:
+                first = await queue.get()
+                if first is None:
+                    return
+                batch = [first]
+                stopping = await self._collect(queue, batch)
+                requests = [pending.request for pending in batch]
+                try:
+                    if self.offload:
+                        outcomes = await loop.run_in_executor(
+                            None, _run_batch, requests
+                        )
+                    else:
+                        outcomes = _run_batch(requests)
+                except Exception as error:  # Reported to every caller in the batch
+                    outcomes = [error] * len(batch)
+                self._resolve(batch, outcomes)
+                if stopping:
+                    return
+        finally:
+            _fail_all(batch)
+            _fail_queued(queue)
+
+    def _resolve(
+        self, batch: List[_Pending], outcomes: List[EquityResult | Exception]
+    ) -> None:
+        """Hand each caller its outcome and update the counters."""
+        now = time.perf_counter()
+        for pending, outcome in zip(batch, outcomes):
+            if not pending.future.done():
+                if isinstance(outcome, Exception):
+                    pending.future.set_exception(outcome)
+                else:
+                    pending.future.set_result(outcome)
+            self._latencies.append(now - pending.enqueued)
+        self._requests += len(batch)
+        self._batches += 1
+        self._batched += len(batch)
+        self._largest = max(self._largest, len(batch))
@@ -0,0 +1,283 @@
+"""Hand strength and hand potential features.
+
+For a hero hand on a 3-5 card board, against one uniformly random opponent
+hand (blocker-aware):
+
+    hs     Hand strength: share of opponent hands beaten now, ties half
+    hs2    Expected squared river hand strength over all runouts (E[HS^2]);
+           rewards hands whose strength varies, unlike plain equity
+    ppot   Positive potential: chance of ending ahead when behind now
+    npot   Negative potential: chance of ending behind when ahead now
+    ehs    Effective hand strength: hs * (1 - npot) + (1 - hs) * ppot
+
+Potentials look ahead to the river (two cards on the flop, one on the
+turn) and count ties as half, as in Billings et al.; on the river both are
+0 and ``hs2 == hs ** 2``.
+
+Everything except the hero's own cards depends only on the board, so the
+board's work -- every combo ranked now and after every runout -- lives in
+a ``BoardOutlook`` memoized per canonical board (suits relabelled with
+``canonical.canonicalize``). Training rows that share a board texture reuse
+one outlook; ``hand_strength_batch`` groups rows by canonical board and
+scores each group's heroes together with NumPy. A flop outlook takes about
+3 MB, so the cache holds ``BOARD_CACHE_SIZE`` boards.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..engine.canonical import suit_permutation
+from ..engine.cards import NUM_CARDS
+from ..engine.evaluator import rank_boards
+from ..eval.equity import COMBO_INDEX, COMBOS, NUM_COMBOS, combo_conflicts
+from ..utils.cache import lru_cached
+
+FEATURE_NAMES = ("hs", "hs2", "ppot", "npot", "ehs")
+
+# Canonical boards kept by ``board_outlook`` (a flop outlook is ~3 MB)
+BOARD_CACHE_SIZE = 32
+
+# (hero, runout, opponent) cells compared per vectorized chunk
+_CHUNK_CELLS = 4_000_000
+
+# Relation of hero to an opponent hand
+_BEHIND, _TIED, _AHEAD = 0, 1, 2
+
+
+@dataclass(frozen=True, slots=True)
+class HandStrength:
+    """Strength and potential of one hand.
+
+    Args:
+        hs: Current hand strength against a random hand
+        hs2: Expected squared river hand strength
+        ppot: Chance of getting ahead when behind now
+        npot: Chance of falling behind when ahead now
+    """
+
+    hs: float
+    hs2: float
+    ppot: float
+    npot: float
+
+    @property
+    def ehs(self) -> float:
+        """Effective hand strength, ``hs * (1 - npot) + (1 - hs) * ppot``."""
+        return self.hs * (1.0 - self.npot) + (1.0 - self.hs) * self.ppot
+
+    def as_tuple(self) -> Tuple[float, ...]:
+        """Return the values in ``FEATURE_NAMES`` order."""
+        return (self.hs, self.hs2, self.ppot, self.npot, self.ehs)
+
+
+@dataclass(frozen=True, slots=True)
+class BoardOutlook:
+    """Hand ranks of every combo on a board and after each runout.
+
+    Args:
+        board: Canonical board cards
+        current: ``(1326,)`` rank of each combo on the board as dealt
+            (0 if the combo uses a board card)
+        river: ``(R, 1326)`` rank of each combo on every river the board can
+            run out to (0 if the combo uses a board or runout card); the
+            single row on a river board equals ``current``
+    """
+
+    board: Tuple[int, ...]
+    current: np.ndarray
+    river: np.ndarray
+
+
+def _rank_all(boards: np.ndarray) -> np.ndarray:
+    """Rank all combos on each board, 0 where a combo uses a board card."""
+    count = len(boards)
+    ranks = rank_boards(
+        boards,
+        np.tile(COMBOS, (count, 1)),
+        np.repeat(np.arange(count), NUM_COMBOS),
+    ).reshape(count, NUM_COMBOS)
+    taken = np.zeros((count, NUM_CARDS), dtype=bool)
+    np.put_along_axis(taken, boards, True, axis=1)
+    ranks[taken[:, COMBOS[:, 0]] | taken[:, COMBOS[:, 1]]] = 0
+    return ranks.astype(np.int16)
+
+
+@lru_cached(BOARD_CACHE_SIZE)
+def board_outlook(board: Tuple[int, ...]) -> BoardOutlook:
+    """Return the (memoized) outlook of a canonical board.
+
+    Pass boards through ``canonical_row`` (or ``canonical.canonicalize``)
+    first so suit-isomorphic boards share one cache entry.
+    """
+    cards = np.array(board, dtype=np.intp)
+    current = _rank_all(cards[None, :])[0]
+    unknown = np.ones(NUM_CARDS, dtype=bool)
+    unknown[cards] = False
+    missing = 5 - len(board)
+    runouts = list(combinations(np.flatnonzero(unknown).tolist(), missing))
+    completions = np.array(runouts, dtype=np.intp).reshape(len(runouts), missing)
+    rivers = np.column_stack(
+        [np.broadcast_to(cards, (len(completions), len(board))), completions]
+    )
+    river = current[None, :] if missing == 0 else _rank_all(rivers)
+    current.setflags(write=False)
+    river.setflags(write=False)
+    return BoardOutlook(board=board, current=current, river=river)
+
+
+def canonical_row(
+    hole: Sequence[int], board: Sequence[int]
+) -> Tuple[Tuple[int, ...], int]:
+    """Relabel suits so the board is canonical.
+
+    Args:
+        hole: Hero's two hole cards
+        board: Board cards (3-5)
+
+    Returns:
+        ``(canonical board, hero combo id)`` with the hero's cards relabelled
+        by the same suit permutation
+
+    Raises:
+        ValueError: If the board size is wrong or cards are invalid or repeat
+    """
+    if len(hole) != 2:
+        raise ValueError(f"Hero needs exactly 2 hole cards, got {len(hole)}")
+    if not (3 <= len(board) <= 5):
+        raise ValueError(f"Board must have 3-5 cards, got {len(board)}")
+    known = [*hole, *board]
+    for index in known:
+        if not (0 <= index < NUM_CARDS):
+            raise ValueError(f"Invalid card index: {index} (must be 0-51)")
+    if len(set(known)) != len(known):
+        raise ValueError("Hero and board cards must be distinct")
+
+    mapping = suit_permutation((), board)
+    relabel = [(index & ~3) | mapping[index & 3] for index in known]
+    canonical_board = tuple(sorted(relabel[2:], reverse=True))
+    return canonical_board, int(COMBO_INDEX[relabel[0], relabel[1]])
+
+
+def _score_heroes(outlook: BoardOutlook, heroes: np.ndarray) -> np.ndarray:
+    """Compute ``(hs, hs2, ppot, npot, ehs)`` for hero combo ids on a board.
+
+    Returns:
+        ``(len(heroes), 5)`` float array
+    """
+    current, river = outlook.current, outlook.river
+    num_runouts = len(river)
+    out = np.zeros((len(heroes), len(FEATURE_NAMES)))
+    chunk = max(1, _CHUNK_CELLS // (num_runouts * NUM_COMBOS))
+    conflicts = combo_conflicts()
+
+    for offset in range(0, len(heroes), chunk):
+        hero = heroes[offset : offset + chunk]
+        count = len(hero)
+        opponents = (current > 0)[None, :] & ~conflicts[hero]
+        now = np.sign(current[hero][:, None] - current[None, :]) + 1
+        hs = (
+            np.count_nonzero(opponents & (now == _AHEAD), axis=1)
+            + 0.5 * np.count_nonzero(opponents & (now == _TIED), axis=1)
+        ) / np.count_nonzero(opponents, axis=1)
+
+        # Relation after every runout; runouts using a hero card do not count
+        hero_river = river[:, hero].T
+        later = np.sign(hero_river[:, :, None] - river[None, :, :]) + 1
+        valid = (
+            opponents[:, None, :]
+            & (river > 0)[None, :, :]
+            & (hero_river > 0)[:, :, None]
+        )
+
+        # Per (hero, runout) river strength, then E[HS^2] over live runouts
+        ahead = np.count_nonzero(valid & (later == _AHEAD), axis=2)
+        tied = np.count_nonzero(valid & (later == _TIED), axis=2)
+        dealt = np.count_nonzero(valid, axis=2)
+        live = dealt > 0
+        strength = np.where(live, (ahead + 0.5 * tied) / np.maximum(dealt, 1), 0.0)
+        hs2 = (strength**2).sum(axis=1) / live.sum(axis=1)
+
+        # Transition counts hp[now][later] over (runout, opponent) deals
+        codes = np.where(valid, now[:, None, :] * 3 + later, 9)
+        codes += 10 * np.arange(count)[:, None, None]
+        counts = np.bincount(codes.ravel(), minlength=10 * count)
+        hp = counts.reshape(count, 10)[:, :9].reshape(count, 3, 3).astype(np.float64)
+        totals = hp.sum(axis=2)
+        ppot_num = (
+            hp[:, _BEHIND, _AHEAD]
+            + 0.5 * hp[:, _BEHIND, _TIED]
+            + 0.5 * hp[:, _TIED, _AHEAD]
+        )
+        npot_num = (
+            hp[:, _AHEAD, _BEHIND]
+            + 0.5 * hp[:, _AHEAD, _TIED]
+            + 0.5 * hp[:, _TIED, _BEHIND]
+        )
+        ppot_den = totals[:, _BEHIND] + 0.5 * totals[:, _TIED]
+        npot_den = totals[:, _AHEAD] + 0.5 * totals[:, _TIED]
+        ppot = np.divide(ppot_num, ppot_den, out=np.zeros(count), where=ppot_den > 0)
+        npot = np.divide(npot_num, npot_den, out=np.zeros(count), where=npot_den > 0)
+        rows = slice(offset, offset + count)
+        out[rows, 0] = hs
+        out[rows, 1] = hs2
+        out[rows, 2] = ppot
+        out[rows, 3] = npot
+        out[rows, 4] = hs * (1.0 - npot) + (1.0 - hs) * ppot
+    return out
+
+
+def hand_strength(hole: Sequence[int], board: Sequence[int]) -> HandStrength:
+    """Compute the strength and potential features of one hand.
+
+    Args:
+        hole: Hero's two hole cards
+        board: Board cards (3-5)
+
+    Raises:
+        ValueError: If the board size is wrong or cards are invalid or repeat
+    """
+    key, combo = canonical_row(hole, board)
+    hs, hs2, ppot, npot, _ = _score_heroes(board_outlook(key), np.array([combo]))[0]
+    return HandStrength(
+        hs=float(hs), hs2=float(hs2), ppot=float(ppot), npot=float(npot)
+    )
+
+
+def hand_strength_batch(
+    holes: Sequence[Sequence[int]], boards: Sequence[Sequence[int]]
+) -> np.ndarray:
+    """Compute features for many rows, sharing work between equal boards.
+
+    Rows are grouped by canonical board; each group's outlook is built (or
+    fetched from the cache) once and all of its heroes are scored together.
+
+    Args:
+        holes: Two hole cards per row
+        boards: Board cards (3-5) per row
+
+    Returns:
+        ``(N, 5)`` float array with columns ``FEATURE_NAMES``
+
+    Raises:
+        ValueError: If the inputs differ in length or a row is invalid
+    """
+    if len(holes) != len(boards):
+        raise ValueError(f"Got {len(holes)} hole pairs but {len(boards)} boards")
+    groups: Dict[Tuple[int, ...], List[Tuple[int, int]]] = defaultdict(list)
+    for row, (hole, board) in enumerate(zip(holes, boards)):
+        key, combo = canonical_row(hole, board)
+        groups[key].append((row, combo))
+
+    out = np.zeros((len(holes), len(FEATURE_NAMES)))
+    for key, members in groups.items():
+        rows, combos = (np.array(column) for column in zip(*members))
+        # Score each distinct hero once; duplicates copy the result
+        unique, inverse = np.unique(combos, return_inverse=True)
+        out[rows] = _score_heroes(board_outlook(key), unique)[inverse]
+    return out
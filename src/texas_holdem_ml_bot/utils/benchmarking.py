@@ -0,0 +1,334 @@
+"""Microbenchmark harness with JSON history and regression checks.
+
+A ``Benchmark`` separates input preparation from the timed work: its
+``setup(ops)`` builds inputs outside the clock and returns a zero-argument
+callable that performs ``ops`` operations. ``run_benchmark`` calls it for a
+few untimed warmup rounds, then times ``repeats`` rounds with
+``time.perf_counter`` and the garbage collector paused, and summarizes the
+per-operation times as percentiles.
+
+Runs are appended to a JSON history file (a list of records, oldest first).
+``compare_results`` checks a run against a baseline record and flags every
+benchmark whose median throughput dropped by more than a threshold.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# setup(ops) -> callable performing ``ops`` operations per call
+BenchmarkSetup = Callable[[int], Callable[[], object]]
+
+HISTORY_VERSION = 1
+
+PERCENTILES = (50, 90, 99)
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    """A named, self-contained microbenchmark.
+
+    Args:
+        name: Unique identifier used in reports and history
+        setup: Builds untimed inputs for ``ops`` operations and returns the
+            callable to time
+        ops: Operations per timed round
+        description: One-line summary for reports
+    """
+
+    name: str
+    setup: BenchmarkSetup
+    ops: int
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """Timings of one benchmark.
+
+    Args:
+        name: Benchmark name
+        ops: Operations per timed round
+        timings: Wall-clock seconds of each timed round
+    """
+
+    name: str
+    ops: int
+    timings: Tuple[float, ...]
+
+    def percentile(self, q: float) -> float:
+        """Return the q-th percentile (0-100) of seconds per operation.
+
+        Uses linear interpolation between the closest ranks.
+        """
+        if not (0 <= q <= 100):
+            raise ValueError(f"Percentile must be in 0-100, got {q}")
+        ordered = sorted(self.timings)
+        position = (len(ordered) - 1) * q / 100
+        low = int(position)
+        high = min(low + 1, len(ordered) - 1)
+        value = ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+        return value / self.ops
+
+    @property
+    def median(self) -> float:
+        """Median seconds per operation."""
+        return self.percentile(50)
+
+    @property
+    def ops_per_sec(self) -> float:
+        """Throughput at the median round."""
+        median = self.median
+        return 1.0 / median if median > 0 else float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the JSON history (percentiles in microseconds)."""
+        return {
+            "ops": self.ops,
+            "timings": list(self.timings),
+            "ops_per_sec": self.ops_per_sec,
+            **{f"p{q}_us": self.percentile(q) * 1e6 for q in PERCENTILES},
+        }
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> BenchmarkResult:
+        """Rebuild a result from its ``to_dict`` form."""
+        return cls(name=name, ops=data["ops"], timings=tuple(data["timings"]))
+
+
+def run_benchmark(
+    benchmark: Benchmark,
+    *,
+    warmup: int = 2,
+    repeats: int = 7,
+    scale: float = 1.0,
+) -> BenchmarkResult:
+    """Time a benchmark.
+
+    Args:
+        benchmark: Benchmark to run
+        warmup: Untimed rounds run first (fill caches, load tables)
+        repeats: Timed rounds
+        scale: Multiplier on ``benchmark.ops`` (e.g. 0.01 for smoke runs)
+
+    Returns:
+        Per-round timings
+
+    Raises:
+        ValueError: If repeats is not positive
+    """
+    if repeats <= 0:
+        raise ValueError(f"repeats must be positive, got {repeats}")
+    ops = max(1, int(benchmark.ops * scale))
+    fn = benchmark.setup(ops)
+    for _ in range(warmup):
+        fn()
+
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return BenchmarkResult(name=benchmark.name, ops=ops, timings=tuple(timings))
+
+
+def run_suite(
+    benchmarks: Iterable[Benchmark],
+    *,
+    warmup: int = 2,
+    repeats: int = 7,
+    scale: float = 1.0,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> List[BenchmarkResult]:
+    """Run benchmarks one after another.
+
+    Args:
+        benchmarks: Benchmarks to run
+        warmup: Untimed rounds per benchmark
+        repeats: Timed rounds per benchmark
+        scale: Multiplier on every benchmark's operation count
+        progress: Called with each result as soon as it is available
+    """
+    results = []
+    for benchmark in benchmarks:
+        result = run_benchmark(benchmark, warmup=warmup, repeats=repeats, scale=scale)
+        if progress is not None:
+            progress(result)
+        results.append(result)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# History
+# ---------------------------------------------------------------------------
+
+
+def make_record(
+    results: Sequence[BenchmarkResult], label: Optional[str] = None, **metadata: Any
+) -> Dict[str, Any]:
+    """Wrap results with the metadata needed to interpret them later.
+
+    Args:
+        results: Results of one run
+        label: Free-form tag (e.g. a commit or branch name)
+        **metadata: Extra JSON-serializable fields (e.g. evaluator backend)
+    """
+    return {
+        "version": HISTORY_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "label": label,
+        "python": platform.python_version(),
+        "implementation": sys.implementation.name,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        **metadata,
+        "results": {result.name: result.to_dict() for result in results},
+    }
+
+
+def load_history(path: Path | str) -> List[Dict[str, Any]]:
+    """Read a history file (an empty list if it does not exist yet).
+
+    Raises:
+        ValueError: If the file does not hold a list of records
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+    history = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(history, list):
+        raise ValueError(f"Benchmark history must be a JSON list: {path}")
+    return history
+
+
+def append_history(path: Path | str, record: Dict[str, Any]) -> None:
+    """Append a record to a history file, writing atomically."""
+    path = Path(path)
+    history = load_history(path)
+    history.append(record)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(history, handle, indent=2)
+            handle.write("\n")
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def record_results(record: Dict[str, Any]) -> Dict[str, BenchmarkResult]:
+    """Rebuild the results stored in a history record, keyed by name."""
+    return {
+        name: BenchmarkResult.from_dict(name, data)
+        for name, data in record["results"].items()
+    }
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """Throughput change of one benchmark against a baseline.
+
+    Args:
+        name: Benchmark name
+        baseline_ops_per_sec: Median throughput of the baseline
+        current_ops_per_sec: Median throughput of the current run
+        threshold: Largest tolerated relative slowdown (0.1 = 10%)
+    """
+
+    name: str
+    baseline_ops_per_sec: float
+    current_ops_per_sec: float
+    threshold: float
+
+    @property
+    def change(self) -> float:
+        """Relative throughput change (-0.2 means 20% slower)."""
+        return self.current_ops_per_sec / self.baseline_ops_per_sec - 1.0
+
+    @property
+    def regressed(self) -> bool:
+        """Whether throughput dropped by more than the threshold."""
+        return self.change < -self.threshold
+
+
+def compare_results(
+    baseline: Dict[str, BenchmarkResult],
+    current: Iterable[BenchmarkResult],
+    threshold: float = 0.1,
+) -> List[Comparison]:
+    """Compare current results with a baseline by median throughput.
+
+    Benchmarks missing from the baseline are skipped.
+
+    Args:
+        baseline: Baseline results keyed by name (see ``record_results``)
+        current: Results of the run under test
+        threshold: Largest tolerated relative slowdown (0.1 = 10%)
+
+    Raises:
+        ValueError: If threshold is negative
+    """
+    if threshold < 0:
+        raise ValueError(f"threshold cannot be negative, got {threshold}")
+    comparisons = []
+    for result in current:
+        reference = baseline.get(result.name)
+        if reference is None:
+            continue
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                baseline_ops_per_sec=reference.ops_per_sec,
+                current_ops_per_sec=result.ops_per_sec,
+                threshold=threshold,
+            )
+        )
+    return comparisons
+
+
+def format_results(
+    results: Sequence[BenchmarkResult],
+    comparisons: Sequence[Comparison] = (),
+) -> str:
+    """Render results (and optional comparisons) as a plain-text table."""
+    changes = {comparison.name: comparison for comparison in comparisons}
+    width = max([len(result.name) for result in results] + [9])
+    header = f"{'benchmark':<{width}}  {'ops/s':>12}  " + "  ".join(
+        f"{f'p{q} us':>9}" for q in PERCENTILES
+    )
+    if changes:
+        header += f"  {'change':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        line = f"{result.name:<{width}}  {result.ops_per_sec:>12,.0f}  " + "  ".join(
+            f"{result.percentile(q) * 1e6:>9.3f}" for q in PERCENTILES
+        )
+        comparison = changes.get(result.name)
+        if comparison is not None:
+            flag = " !" if comparison.regressed else ""
+            line += f"  {comparison.change:>+8.1%}{flag}"
+        lines.append(line)
+    return "\n".join(lines)
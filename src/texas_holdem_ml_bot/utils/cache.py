@@ -0,0 +1,299 @@
+"""Bounded memoization with hit/miss accounting.
+
+``LRUCache`` keeps at most ``maxsize`` entries. Policy:
+
+* Eviction: inserting into a full cache drops the least recently used entry
+  (reads and writes both count as use).
+* Invalidation: ``invalidate(key)`` drops one entry and ``clear()`` drops all
+  of them; callers must clear a cache whose wrapped computation changed
+  (e.g. after swapping lookup tables or evaluator backends).
+* Budget: size the cache from a memory budget with ``maxsize = budget //
+  bytes_per_entry``; ``resize`` shrinks a live cache by evicting LRU entries.
+
+``TranspositionTable`` is the fixed-size counterpart for search results
+keyed by 64-bit position hashes (see ``engine.zobrist``): no per-entry
+bookkeeping beyond four parallel lists, and a replacement policy instead
+of recency.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Generic, Hashable, List, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Snapshot of cache counters.
+
+    Args:
+        hits: Lookups answered from the cache
+        misses: Lookups that had to compute a value
+        evictions: Entries dropped to respect ``maxsize``
+        size: Entries currently stored
+        maxsize: Entry limit
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 if none yet)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """Least-recently-used cache with a fixed entry limit."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries (must be positive)
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """Return the cached value for key (counting a hit or a miss)."""
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        data = self._data
+        if key in data:
+            data.move_to_end(key)
+        data[key] = value
+        if len(data) > self._maxsize:
+            data.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, key: K, compute: Callable[[], V]) -> V:
+        """Return the cached value for key, computing and storing it on a miss."""
+        value = self._data.get(key, _MISSING)
+        if value is not _MISSING:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value  # type: ignore[return-value]
+        self.misses += 1
+        result = compute()
+        self.put(key, result)
+        return result
+
+    def invalidate(self, key: K) -> bool:
+        """Drop one entry; return whether it was present."""
+        return self._data.pop(key, _MISSING) is not _MISSING
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def resize(self, maxsize: int) -> None:
+        """Change the entry limit, evicting LRU entries if now over it."""
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self._maxsize = maxsize
+        while len(self._data) > maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of entries."""
+        return self._maxsize
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the counters."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._data),
+            maxsize=self._maxsize,
+        )
+
+    def __contains__(self, key: object) -> bool:
+        """Membership test that does not touch recency or counters."""
+        return key in self._data
+
+    def __len__(self) -> int:
+        """Return number of stored entries."""
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        """Developer-friendly representation."""
+        return f"LRUCache({len(self)}/{self._maxsize} entries)"
+
+
+class TranspositionTable(Generic[V]):
+    """Fixed-size table of values keyed by 64-bit integer hashes.
+
+    A key may live in either slot of its two-slot bucket (``key & mask``
+    and its neighbour). Storing a key that is already present overwrites
+    it; otherwise an empty slot is used, and in a full bucket the victim is
+    the entry from an older search generation (see ``new_generation``) or,
+    between entries of the same age, the one searched to a lower depth.
+    Deep, current results therefore survive the flood of shallow ones.
+
+    Only the full key is compared, so two positions share an entry only if
+    their 64-bit hashes collide.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Allocate an empty table.
+
+        Args:
+            capacity: Number of slots, a power of two (at least 2)
+        """
+        if capacity < 2 or capacity & (capacity - 1):
+            raise ValueError(f"capacity must be a power of two >= 2, got {capacity}")
+        self._mask = capacity - 2
+        self._keys: List[Optional[int]] = [None] * capacity
+        self._values: List[Any] = [None] * capacity
+        self._depths = [0] * capacity
+        self._ages = [0] * capacity
+        self.generation = 0
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: int, default: Any = None, *, min_depth: int = 0) -> Any:
+        """Return the value stored for key if searched to at least min_depth."""
+        keys = self._keys
+        slot = key & self._mask
+        if keys[slot] != key:
+            slot += 1
+            if keys[slot] != key:
+                self.misses += 1
+                return default
+        if self._depths[slot] < min_depth:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return self._values[slot]
+
+    def put(self, key: int, value: V, depth: int = 0) -> None:
+        """Store a value for key, replacing per the class policy."""
+        keys = self._keys
+        first = key & self._mask
+        second = first + 1
+        if keys[first] == key:
+            slot = first
+        elif keys[second] == key:
+            slot = second
+        elif keys[first] is None:
+            slot = first
+            self.size += 1
+        elif keys[second] is None:
+            slot = second
+            self.size += 1
+        else:
+            generation = self.generation
+            ages, depths = self._ages, self._depths
+            first_rank = (ages[first] == generation, depths[first])
+            second_rank = (ages[second] == generation, depths[second])
+            slot = first if first_rank <= second_rank else second
+            self.evictions += 1
+        keys[slot] = key
+        self._values[slot] = value
+        self._depths[slot] = depth
+        self._ages[slot] = self.generation
+
+    def new_generation(self) -> None:
+        """Mark stored entries as older than those of the next search."""
+        self.generation += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        capacity = len(self._keys)
+        self._keys = [None] * capacity
+        self._values = [None] * capacity
+        self.size = self.hits = self.misses = self.evictions = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of slots."""
+        return len(self._keys)
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the counters (evictions are replacements)."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=self.size,
+            maxsize=len(self._keys),
+        )
+
+    def __contains__(self, key: object) -> bool:
+        """Membership test that does not touch the counters."""
+        if not isinstance(key, int):
+            return False
+        slot = key & self._mask
+        return self._keys[slot] == key or self._keys[slot + 1] == key
+
+    def __len__(self) -> int:
+        """Return number of stored entries."""
+        return self.size
+
+    def __repr__(self) -> str:
+        """Developer-friendly representation."""
+        return f"TranspositionTable({self.size}/{len(self._keys)} entries)"
+
+
+def lru_cached(
+    maxsize: int, key: Callable[..., Hashable] | None = None
+) -> Callable[[Callable[..., V]], Callable[..., V]]:
+    """Memoize a function in an ``LRUCache`` exposed as ``wrapper.cache``.
+
+    Args:
+        maxsize: Entry limit of the cache
+        key: Maps the call arguments to a cache key; defaults to the
+            positional arguments tuple (keyword arguments are not allowed)
+
+    Returns:
+        Decorator producing the memoized function
+    """
+
+    def decorator(fn: Callable[..., V]) -> Callable[..., V]:
+        cache: LRUCache[Hashable, V] = LRUCache(maxsize)
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> V:
+            if key is None:
+                if kwargs:
+                    raise TypeError("Keyword arguments need an explicit cache key")
+                cache_key: Hashable = args
+            else:
+                cache_key = key(*args, **kwargs)
+            return cache.get_or_compute(cache_key, lambda: fn(*args, **kwargs))
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -0,0 +1,60 @@
+"""Filesystem locations for data artifacts.
+
+Generated artifacts (lookup tables, precomputed equities, game trees) live
+under ``data/models`` at the project root when running from a source
+checkout or editable install. An installed package has no project root (the
+module sits inside the interpreter's ``site-packages``), so it falls back to
+the per-user data directory: ``$XDG_DATA_HOME/texas_holdem_ml_bot`` (default
+``~/.local/share/texas_holdem_ml_bot``), or ``%LOCALAPPDATA%`` on Windows.
+Set ``TEXAS_HOLDEM_DATA_DIR`` to relocate the whole data tree, e.g. to a
+shared volume for worker processes.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import Mapping, Optional
+
+# src/texas_holdem_ml_bot/utils/paths.py -> project root is three levels up
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+DATA_DIR_ENV = "TEXAS_HOLDEM_DATA_DIR"
+APP_NAME = "texas_holdem_ml_bot"
+
+
+def user_data_dir(environ: Optional[Mapping[str, str]] = None) -> Path:
+    """Return the per-user data directory of the package."""
+    environ = os.environ if environ is None else environ
+    if sys.platform == "win32" and environ.get("LOCALAPPDATA"):
+        return Path(environ["LOCALAPPDATA"]) / APP_NAME
+    base = environ.get("XDG_DATA_HOME") or str(Path.home() / ".local" / "share")
+    return Path(base) / APP_NAME
+
+
+def resolve_data_dir(
+    environ: Optional[Mapping[str, str]] = None, project_root: Path = PROJECT_ROOT
+) -> Path:
+    """Pick the data directory: the override, the checkout, else the user's.
+
+    Args:
+        environ: Environment to read (default ``os.environ``)
+        project_root: Candidate project root; used only if it holds a
+            ``pyproject.toml``
+
+    Returns:
+        Root of the data tree
+    """
+    environ = os.environ if environ is None else environ
+    override = environ.get(DATA_DIR_ENV)
+    if override:
+        return Path(override)
+    if (project_root / "pyproject.toml").is_file():
+        return project_root / "data"
+    return user_data_dir(environ)
+
+
+DATA_DIR = resolve_data_dir()
+MODELS_DIR = DATA_DIR / "models"
+BENCHMARKS_DIR = DATA_DIR / "benchmarks"
@@ -0,0 +1,34 @@
+"""Crash-safe writes for generated artifacts."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+
+def save_npy_atomic(path: Path | str, array: np.ndarray) -> Path:
+    """Write ``array`` to ``path`` as ``.npy`` via a temporary file and rename.
+
+    Readers (including concurrent worker processes) see either the old file
+    or the complete new one, never a partial write.
+
+    Args:
+        path: Destination file; its directory must exist
+        array: Array to store
+
+    Returns:
+        The destination path
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            np.save(fh, array)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return path
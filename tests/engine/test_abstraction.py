@@ -0,0 +1,218 @@
+"""Tests for the bet-size abstraction and action translation."""
+
+from random import Random
+
+import pytest
+
+from texas_holdem_ml_bot.engine.abstraction import (
+    ActionAbstraction,
+    BetSizing,
+    pseudo_harmonic,
+)
+from texas_holdem_ml_bot.engine.cards import Action, Deck, PlayerAction
+from texas_holdem_ml_bot.engine.game_state import GameState, PlayerState
+from texas_holdem_ml_bot.engine.rules import Street
+from texas_holdem_ml_bot.engine.simulator import apply, settle, start_hand
+
+FOLD = PlayerAction(Action.FOLD)
+CHECK = PlayerAction(Action.CHECK)
+CALL = PlayerAction(Action.CALL)
+
+
+def table(*stacks, seed=1):
+    """Start a hand at a table with the given stacks, button on seat 0."""
+    state = GameState(players=[PlayerState(stack) for stack in stacks], button=0)
+    holes = start_hand(state, Deck(seed=seed))
+    return state, holes
+
+
+def raise_to(amount):
+    """Raise to a total of ``amount``."""
+    return PlayerAction(Action.RAISE, amount)
+
+
+def bet(amount):
+    """Bet ``amount``."""
+    return PlayerAction(Action.BET, amount)
+
+
+class TestBetSizing:
+    """Test sizing configuration."""
+
+    def test_sizes_by_depth(self):
+        """Test depths past the configured ones have no sizes."""
+        sizing = BetSizing({Street.FLOP: ((0.5, 1.0), (1.0,))})
+        assert sizing.sizes(Street.FLOP, 0) == (0.5, 1.0)
+        assert sizing.sizes(Street.FLOP, 1) == (1.0,)
+        assert sizing.sizes(Street.FLOP, 2) == ()
+        assert sizing.sizes(Street.TURN, 0) == ()
+
+    @pytest.mark.parametrize(
+        "fractions, match",
+        [
+            ({Street.SHOWDOWN: ((1.0,),)}, "No betting on the showdown"),
+            ({Street.FLOP: ((0.0, 1.0),)}, "must be positive"),
+            ({Street.RIVER: ((1.0, 0.5),)}, "strictly increasing"),
+        ],
+    )
+    def test_invalid(self, fractions, match):
+        """Test malformed fractions are rejected."""
+        with pytest.raises(ValueError, match=match):
+            BetSizing(fractions)
+
+
+class TestActions:
+    """Test abstract actions per betting state."""
+
+    def test_preflop_open(self):
+        """Test pot fractions are taken of the pot after calling."""
+        state, _ = table(100, 100)
+        # Pot 3, small blind calls 1 first: half pot raises to 2 + 2
+        assert ActionAbstraction().actions(state) == (
+            FOLD,
+            CALL,
+            raise_to(4),
+            raise_to(6),
+            raise_to(100),
+        )
+
+    def test_postflop_bets(self):
+        """Test bets on a later street and the check option."""
+        state, _ = table(100, 100)
+        apply(state, CALL)
+        apply(state, CHECK)
+        sizing = BetSizing({Street.FLOP: ((0.5, 1.0),)})
+        assert ActionAbstraction(sizing).actions(state) == (
+            CHECK,
+            bet(2),
+            bet(4),
+            bet(98),
+        )
+
+    def test_sizes_clamped_and_deduplicated(self):
+        """Test sizes below the minimum raise or above all-in collapse."""
+        state, _ = table(100, 5)
+        sizing = BetSizing({Street.PREFLOP: ((0.1, 0.2, 30.0),)}, all_in=False)
+        # Both small sizes become the minimum raise, the big one all-in
+        assert ActionAbstraction(sizing).actions(state) == (
+            FOLD,
+            CALL,
+            raise_to(4),
+            raise_to(100),
+        )
+
+    def test_depth_limits_raises(self):
+        """Test only all-in is left once the configured depths run out."""
+        state, _ = table(100, 100)
+        abstraction = ActionAbstraction(BetSizing({Street.PREFLOP: ((1.0,),)}))
+        apply(state, raise_to(6))
+        assert state.num_raises == 1
+        assert abstraction.actions(state) == (FOLD, CALL, raise_to(100))
+        no_all_in = ActionAbstraction(
+            BetSizing({Street.PREFLOP: ((1.0,),)}, all_in=False)
+        )
+        assert no_all_in.actions(state) == (FOLD, CALL)
+
+    def test_no_raise_possible(self):
+        """Test a player facing a covering all-in only folds or calls."""
+        state, _ = table(100, 40)
+        apply(state, raise_to(100))
+        assert ActionAbstraction().actions(state) == (FOLD, CALL)
+
+    def test_states_are_memoized(self):
+        """Test equal betting states share one precomputed entry."""
+        abstraction = ActionAbstraction()
+        first, _ = table(100, 100, seed=1)
+        second, _ = table(100, 100, seed=2)
+        assert abstraction.lookup(first) is abstraction.lookup(second)
+        assert len(abstraction) == 1
+
+    def test_table_is_bounded(self):
+        """Test the table is cleared once it holds max_states entries."""
+        abstraction = ActionAbstraction(max_states=2)
+        for stack in (100, 110, 120):
+            state, _ = table(stack, stack)
+            abstraction.actions(state)
+        assert len(abstraction) == 1
+
+    def test_hand_over(self):
+        """Test finished hands have no actions."""
+        state, _ = table(100, 100)
+        apply(state, FOLD)
+        with pytest.raises(ValueError, match="hand is over"):
+            ActionAbstraction().actions(state)
+
+    @pytest.mark.parametrize("num_players", [2, 6])
+    def test_abstract_play_is_legal(self, num_players):
+        """Test random hands using only abstract actions stay legal."""
+        rng = Random(num_players)
+        abstraction = ActionAbstraction()
+        for seed in range(100):
+            state, holes = table(*[200] * num_players, seed=seed)
+            while state.to_act is not None:
+                actions = abstraction.actions(state)
+                apply(state, actions[int(rng.random() * len(actions))])
+            assert sum(settle(state, holes)) > 0
+            assert sum(p.stack for p in state.players) == 200 * num_players
+
+
+class TestTranslate:
+    """Test pseudo-harmonic translation of arbitrary bets."""
+
+    def test_mapping_values(self):
+        """Test the mapping at its end points and in between."""
+        assert pseudo_harmonic(0.5, 1.0, 0.5) == 1.0
+        assert pseudo_harmonic(0.5, 1.0, 1.0) == 0.0
+        assert pseudo_harmonic(0.5, 1.0, 0.75) == pytest.approx(0.375 / 0.875)
+        # Half pot between a check and a pot bet maps to the check a third of the time
+        assert pseudo_harmonic(0.0, 1.0, 0.5) == pytest.approx(1 / 3)
+
+    def flop(self):
+        """A heads-up flop where a pot is 4 chips."""
+        state, _ = table(100, 100)
+        apply(state, CALL)
+        apply(state, CHECK)
+        sizing = BetSizing({Street.FLOP: ((0.5, 1.0),)})
+        return state, ActionAbstraction(sizing)
+
+    def test_exact_and_passive_actions(self):
+        """Test on-grid bets and non-bets map to themselves."""
+        state, abstraction = self.flop()
+        assert abstraction.translate(state, bet(4)) == bet(4)
+        assert abstraction.translate(state, CHECK) == CHECK
+
+    def test_deterministic(self):
+        """Test off-grid bets go to the more likely neighbour."""
+        state, abstraction = self.flop()
+        # 3 chips is 0.75 pot, which maps down only 3/7 of the time
+        assert abstraction.translate(state, bet(3)) == bet(4)
+        assert abstraction.translate(state, bet(50)) == bet(98)
+
+    def test_sampled(self):
+        """Test sampled translation follows the mapping's probability."""
+        state, abstraction = self.flop()
+        rng = Random(0)
+        trials = 20_000
+        down = sum(
+            abstraction.translate(state, bet(3), rng) == bet(2) for _ in range(trials)
+        )
+        assert down / trials == pytest.approx(pseudo_harmonic(0.5, 1.0, 0.75), abs=0.02)
+
+    def test_small_bet_can_map_to_check(self):
+        """Test bets below the smallest size may translate to a check."""
+        state, _ = table(1000, 1000)
+        apply(state, CALL)
+        apply(state, CHECK)
+        abstraction = ActionAbstraction(BetSizing({Street.FLOP: ((1.0,),)}))
+        # Min bet 2 into 4 is half pot: down to check with probability 1/3
+        assert abstraction.translate(state, bet(2)) == bet(4)
+        rng = Random(1)
+        seen = {abstraction.translate(state, bet(2), rng) for _ in range(200)}
+        assert seen == {CHECK, bet(4)}
+
+    def test_no_sizes_maps_to_call(self):
+        """Test a raise with no abstract raise available becomes a call."""
+        state, _ = table(100, 100)
+        abstraction = ActionAbstraction(BetSizing({}, all_in=False))
+        assert abstraction.actions(state) == (FOLD, CALL)
+        assert abstraction.translate(state, raise_to(10)) == CALL
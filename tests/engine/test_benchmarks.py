@@ -0,0 +1,94 @@
+"""Tests for the engine benchmark suite."""
+
+from texas_holdem_ml_bot.engine.benchmarks import (
+    default_benchmarks,
+    main,
+    select_benchmarks,
+)
+from texas_holdem_ml_bot.engine.evaluator import get_evaluator_backend
+from texas_holdem_ml_bot.utils.benchmarking import (
+    append_history,
+    load_history,
+    make_record,
+    run_benchmark,
+)
+
+FAST = ["--scale", "0.001", "--warmup", "0", "--repeats", "1"]
+
+
+class TestSuite:
+    """Test the benchmark definitions."""
+
+    def test_covers_engine_hot_paths(self):
+        """Test each component has its own benchmark."""
+        names = {bench.name for bench in default_benchmarks()}
+        for expected in [
+            "card_construct",
+            "deck_deal_7",
+            "evaluate_hand_5",
+            "evaluate_hand_6",
+            "evaluate_hand_7",
+            "showdown_9",
+            "post_blinds_9",
+        ]:
+            assert expected in names
+        assert len(names) == len(default_benchmarks())
+
+    def test_every_benchmark_runs(self):
+        """Test a tiny run of every benchmark succeeds."""
+        for bench in default_benchmarks():
+            outcome = run_benchmark(bench, warmup=0, repeats=1, scale=0.001)
+            assert outcome.ops >= 1
+
+    def test_select_by_pattern(self):
+        """Test -k style filtering by name substring."""
+        chosen = select_benchmarks(default_benchmarks(), ["showdown", "card_"])
+        assert {b.name for b in chosen} == {
+            "card_construct",
+            "card_from_index",
+            "showdown_2",
+            "showdown_9",
+        }
+
+
+class TestCommandLine:
+    """Test recording and comparison from the command line."""
+
+    def test_records_history(self, tmp_path, capsys):
+        """Test a run is appended with its backend and label."""
+        history = tmp_path / "history.json"
+        args = [*FAST, "-k", "card_", "--history", str(history), "--label", "x"]
+        assert main(args) == 0
+
+        (record,) = load_history(history)
+        assert record["label"] == "x"
+        assert record["evaluator_backend"] == get_evaluator_backend()
+        assert set(record["results"]) == {"card_construct", "card_from_index"}
+        assert "card_construct" in capsys.readouterr().out
+
+    def test_compare_fails_on_regression(self, tmp_path):
+        """Test comparison exits 1 when throughput drops past the threshold."""
+        history = tmp_path / "history.json"
+        assert main([*FAST, "-k", "post_blinds_2", "--history", str(history)]) == 0
+
+        # Pretend the recorded baseline was a thousand times faster
+        (record,) = load_history(history)
+        entry = record["results"]["post_blinds_2"]
+        entry["timings"] = [t / 1000 for t in entry["timings"]]
+        append_history(history, {**record, "label": "fast"})
+
+        args = [*FAST, "-k", "post_blinds_2", "--history", str(history), "--compare"]
+        assert main([*args, "--no-save"]) == 1
+        assert main([*args, "--no-save", "--threshold", "1000"]) == 0
+        assert len(load_history(history)) == 2
+
+    def test_compare_needs_baseline(self, tmp_path):
+        """Test comparing without recorded runs is a usage error."""
+        history = tmp_path / "history.json"
+        append_history(history, make_record([], label="other"))
+        args = [*FAST, "--history", str(history), "--compare"]
+        assert main([*args, "--baseline-label", "missing"]) == 2
+
+    def test_unknown_pattern(self, tmp_path):
+        """Test a filter matching nothing is a usage error."""
+        assert main([*FAST, "-k", "nope", "--history", str(tmp_path / "h.json")]) == 2
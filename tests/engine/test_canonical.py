@@ -0,0 +1,145 @@
+"""Tests for suit-isomorphic canonicalization."""
+
+import random
+from itertools import combinations
+
+import pytest
+
+from texas_holdem_ml_bot.engine.canonical import (
+    NUM_FLOP_CLASSES,
+    NUM_PREFLOP_CLASSES,
+    cached_hand_rank,
+    canonical_flops,
+    canonical_key,
+    canonicalize,
+    flop_class,
+    isomorphic_cache,
+    preflop_class,
+    preflop_class_combos,
+    preflop_class_name,
+    suit_permutation,
+)
+from texas_holdem_ml_bot.engine.cards import Card, card_to_index
+from texas_holdem_ml_bot.engine.evaluator import evaluate_rank_indices
+
+
+def permute_suits(indices, mapping):
+    """Relabel the suits of card indices."""
+    return [(i & ~3) | mapping[i & 3] for i in indices]
+
+
+class TestCanonicalKey:
+    """Test canonical keys and representatives."""
+
+    def test_key_invariant_under_suit_permutation(self):
+        """Test every suit relabelling of a hand shares one key."""
+        rng = random.Random(1)
+        for _ in range(200):
+            cards = rng.sample(range(52), 7)
+            hole, board = cards[:2], cards[2:]
+            mapping = rng.sample(range(4), 4)
+            permuted = permute_suits(hole, mapping), permute_suits(board, mapping)
+            assert canonical_key(hole, board) == canonical_key(*permuted)
+            assert canonicalize(hole, board) == canonicalize(*permuted)
+
+    def test_hole_and_board_are_distinguished(self):
+        """Test a suited hole pair differs from a suited pair on board."""
+        ace_s, king_s = card_to_index(Card(14, "♠")), card_to_index(Card(13, "♠"))
+        ace_h, king_h = card_to_index(Card(14, "♥")), card_to_index(Card(13, "♥"))
+        assert canonical_key([ace_s, king_s], [ace_h]) != canonical_key(
+            [ace_s, king_h], [king_s]
+        )
+
+    def test_canonicalize_preserves_strength(self):
+        """Test the canonical representative evaluates identically."""
+        rng = random.Random(2)
+        for _ in range(200):
+            cards = rng.sample(range(52), 7)
+            hole, board = canonicalize(cards[:2], cards[2:])
+            assert evaluate_rank_indices(list(hole + board)) == (
+                evaluate_rank_indices(cards)
+            )
+
+    def test_suit_permutation_is_bijection(self):
+        """Test the suit mapping relabels all four suits."""
+        assert sorted(suit_permutation([0, 5], [10, 15, 51])) == [0, 1, 2, 3]
+
+
+class TestPreflopClasses:
+    """Test the 169 starting-hand classes."""
+
+    def test_all_combos_cover_169_classes(self):
+        """Test the 1,326 combos fall into 169 classes."""
+        classes = {preflop_class(a, b) for a, b in combinations(range(52), 2)}
+        assert classes == set(range(NUM_PREFLOP_CLASSES))
+
+    def test_class_names(self):
+        """Test conventional class names."""
+        ace_s, king_s = card_to_index(Card(14, "♠")), card_to_index(Card(13, "♠"))
+        king_h = card_to_index(Card(13, "♥"))
+        assert preflop_class_name(preflop_class(ace_s, king_s)) == "AKs"
+        assert preflop_class_name(preflop_class(king_h, ace_s)) == "AKo"
+        assert preflop_class_name(preflop_class(king_s, king_h)) == "KK"
+
+    def test_class_combos(self):
+        """Test combos per class and round trips through preflop_class."""
+        total = 0
+        for index in range(NUM_PREFLOP_CLASSES):
+            combos = preflop_class_combos(index)
+            assert len(combos) in (4, 6, 12)
+            assert all(preflop_class(a, b) == index for a, b in combos)
+            total += len(combos)
+        assert total == 1326
+
+    def test_invalid_class(self):
+        """Test out-of-range classes are rejected."""
+        with pytest.raises(ValueError, match="Invalid preflop class"):
+            preflop_class_name(169)
+        with pytest.raises(ValueError, match="Invalid preflop class"):
+            preflop_class_combos(-1)
+
+
+class TestFlopClasses:
+    """Test the 1,755 flop classes."""
+
+    def test_flop_class_count(self):
+        """Test all 22,100 flops map onto 1,755 dense classes."""
+        classes = {flop_class(flop) for flop in combinations(range(52), 3)}
+        assert classes == set(range(NUM_FLOP_CLASSES))
+        assert len(canonical_flops()) == NUM_FLOP_CLASSES
+
+    def test_representatives_round_trip(self):
+        """Test each representative maps back to its own class."""
+        for index, flop in enumerate(canonical_flops()[:100]):
+            assert flop_class(flop) == index
+
+    def test_flop_size_validation(self):
+        """Test flops must have three cards."""
+        with pytest.raises(ValueError, match="Flop must have 3 cards"):
+            flop_class([0, 1])
+
+
+class TestIsomorphicCache:
+    """Test memoization per canonical class."""
+
+    def test_permuted_hands_hit_cache(self):
+        """Test suit permutations share one cache entry."""
+        calls = []
+
+        @isomorphic_cache(maxsize=16)
+        def count_cards(hole, board):
+            calls.append(1)
+            return len(hole) + len(board)
+
+        count_cards([0, 4], [8, 12, 16])
+        count_cards([1, 5], [9, 13, 17])  # Same hand in another suit
+        assert len(calls) == 1
+        assert count_cards.cache.stats().hits == 1
+
+    def test_cached_hand_rank(self):
+        """Test the cached evaluator agrees with direct evaluation."""
+        cached_hand_rank.cache.clear()
+        hole, board = [51, 47], [43, 39, 35, 2, 6]
+        assert cached_hand_rank(hole, board) == evaluate_rank_indices(hole + board)
+        cached_hand_rank([50, 46], [42, 38, 34, 1, 5])
+        assert cached_hand_rank.cache.stats().hits == 1
@@ -1,14 +1,26 @@
 """Tests for cards module."""
 
+import os
+import pickle
+from random import Random
+
 import pytest
 
 from texas_holdem_ml_bot.engine.cards import (
+    NUM_CARDS,
     RANKS,
     SUITS,
     Action,
     Card,
     Deck,
     PlayerAction,
+    card_to_index,
+    cards_to_indices,
+    cards_to_mask,
+    index_to_card,
+    indices_to_mask,
+    mask_to_cards,
+    mask_to_indices,
 )
 
 
@@ -65,6 +77,113 @@ class TestCard:
         assert len(card_set) == 2  # Duplicate removed
 
 
+class TestInternedCards:
+    """Test interned card flyweights."""
+
+    def test_from_index_is_interned(self):
+        """Test from_index returns the same instance every time."""
+        assert Card.from_index(51) is Card.from_index(51)
+        assert Card.from_index(51) == Card(14, "♠")
+        assert Card.from_index(0).index == 0
+
+    def test_parse_spellings(self):
+        """Test letter and symbol suits, T/10 and case-insensitivity."""
+        ace = Card.from_index(51)
+        assert Card.parse("As") is ace
+        assert Card.parse("a♠") is ace
+        assert Card.parse(" AS ") is ace
+        assert Card.parse("Th") is Card.parse("10♥")
+        assert Card.parse("2c") == Card(2, "♣")
+
+    def test_parse_invalid(self):
+        """Test unknown text raises ValueError."""
+        for text in ["1s", "Ax", "", "AAs"]:
+            with pytest.raises(ValueError, match="Cannot parse card"):
+                Card.parse(text)
+
+    def test_from_index_invalid(self):
+        """Test out-of-range indices raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid card index"):
+            Card.from_index(52)
+
+    def test_public_construction_stays_strict(self):
+        """Test direct construction still validates and equals the flyweight."""
+        card = Card(12, "♦")
+        assert card is not Card.parse("Qd")
+        assert card == Card.parse("Qd")
+        assert hash(card) == hash(Card.parse("Qd"))
+        assert card.index == Card.parse("Qd").index
+        with pytest.raises(ValueError, match="Invalid rank"):
+            Card(1, "♦")
+
+    def test_precomputed_strings(self):
+        """Test every interned card prints like a constructed one."""
+        for index in range(NUM_CARDS):
+            card = Card.from_index(index)
+            assert str(card) == str(Card(card.rank, card.suit))
+        assert str(Card.parse("Td")) == "10♦"
+
+    def test_pickle_round_trip_is_interned(self):
+        """Test unpickling returns the interned instance."""
+        card = Card(13, "♥")
+        assert pickle.loads(pickle.dumps(card)) is Card.parse("Kh")
+
+    def test_deck_draws_interned_cards(self):
+        """Test decks deal the shared instances."""
+        assert Deck().draw()[0] is Card.from_index(0)
+
+
+class TestCardEncoding:
+    """Test integer and bitmask card encodings."""
+
+    def test_index_layout(self):
+        """Test indices are rank-major with suits in SUITS order."""
+        assert card_to_index(Card(2, "♣")) == 0
+        assert card_to_index(Card(2, "♠")) == 3
+        assert card_to_index(Card(3, "♣")) == 4
+        assert card_to_index(Card(14, "♠")) == 51
+
+    def test_index_round_trip(self):
+        """Test every card survives index encoding losslessly."""
+        cards = [Card(rank, suit) for rank in RANKS for suit in SUITS]
+        indices = cards_to_indices(cards)
+        assert sorted(indices) == list(range(NUM_CARDS))
+        assert [index_to_card(i) for i in indices] == cards
+
+    def test_index_rank_and_suit_bits(self):
+        """Test rank and suit can be read from the index with bit ops."""
+        index = card_to_index(Card(12, "♥"))
+        assert (index >> 2) + 2 == 12
+        assert SUITS[index & 3] == "♥"
+
+    def test_invalid_index(self):
+        """Test out-of-range indices raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid card index"):
+            index_to_card(52)
+        with pytest.raises(ValueError, match="Invalid card index"):
+            index_to_card(-1)
+
+    def test_mask_round_trip(self):
+        """Test hand masks convert to and from cards losslessly."""
+        cards = [Card(14, "♠"), Card(2, "♣"), Card(10, "♥")]
+        mask = cards_to_mask(cards)
+        assert mask.bit_count() == 3
+        assert mask_to_cards(mask) == sorted(cards, key=card_to_index)
+
+    def test_mask_indices(self):
+        """Test masks and index lists are interchangeable."""
+        assert indices_to_mask([0, 5, 51]) == (1 << 0) | (1 << 5) | (1 << 51)
+        assert mask_to_indices(indices_to_mask([51, 0, 5])) == [0, 5, 51]
+        assert mask_to_indices(0) == []
+
+    def test_invalid_mask(self):
+        """Test masks wider than 52 bits or negative raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid hand mask"):
+            mask_to_cards(1 << 52)
+        with pytest.raises(ValueError, match="Invalid hand mask"):
+            mask_to_indices(-1)
+
+
 class TestDeck:
     """Test Deck class."""
 
@@ -140,6 +259,103 @@ class TestDeck:
         deck = Deck()
         assert "52" in repr(deck)
 
+    def test_draw_indices(self):
+        """Test drawing integer indices from an unshuffled deck."""
+        deck = Deck()
+        assert deck.draw_indices(3) == [0, 1, 2]
+        assert deck.draw() == [index_to_card(3)]
+        assert len(deck) == 48
+
+    def test_shuffled_deck_deals_every_card_once(self):
+        """Test lazy shuffling still deals a permutation of the deck."""
+        deck = Deck(seed=1)
+        deck.shuffle()
+        dealt = deck.draw_indices(52)
+        assert sorted(dealt) == list(range(NUM_CARDS))
+        assert dealt != list(range(NUM_CARDS))
+        with pytest.raises(ValueError, match="Cannot draw"):
+            deck.draw()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+    def test_forked_processes_deal_differently(self):
+        """Test unseeded decks in forked children do not repeat each other."""
+
+        def deal_in_child():
+            read_end, write_end = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(read_end)
+                deck = Deck()
+                deck.shuffle()
+                os.write(write_end, bytes(deck.draw_indices(5)))
+                os._exit(0)
+            os.close(write_end)
+            dealt = os.read(read_end, 5)
+            os.close(read_end)
+            os.waitpid(pid, 0)
+            return tuple(dealt)
+
+        first, second = deal_in_child(), deal_in_child()
+        assert len(first) == len(second) == 5
+        assert first != second
+
+    def test_reset(self):
+        """Test reset returns dealt cards and keeps the deck shuffled."""
+        deck = Deck(seed=2)
+        deck.shuffle()
+        first = deck.draw_indices(7)
+        deck.reset()
+
+        assert len(deck) == 52
+        second = deck.draw_indices(7)
+        assert second != first
+        assert len(set(deck.draw_indices(45)) | set(second)) == 52
+
+    def test_undraw(self):
+        """Test undrawn cards return to the deck and deal again in order."""
+        deck = Deck()
+        deck.draw_indices(5)
+        deck.undraw(2)
+
+        assert len(deck) == 49
+        assert deck.draw_indices(2) == [3, 4]
+        with pytest.raises(ValueError, match="Cannot undraw 6 cards"):
+            deck.undraw(6)
+
+    def test_seeded_decks_are_reproducible(self):
+        """Test equal seeds deal equal cards and decks are independent."""
+        deck_a, deck_b = Deck(seed=42), Deck(seed=42)
+        deck_a.shuffle()
+        deck_b.shuffle()
+        other = Deck(seed=43)
+        other.shuffle()
+
+        hands_a = [deck_a.draw_indices(7) for _ in range(3)]
+        other.draw_indices(20)  # Does not disturb the seeded decks
+        hands_b = [deck_b.draw_indices(7) for _ in range(3)]
+        assert hands_a == hands_b
+
+    def test_injected_rng(self):
+        """Test a caller-supplied generator drives the shuffle."""
+        rng = Random(5)
+        deck = Deck(rng=rng)
+        assert deck.rng is rng
+        deck.shuffle()
+        expected = Deck(seed=5)
+        expected.shuffle()
+        assert deck.draw_indices(10) == expected.draw_indices(10)
+
+    def test_draw_is_roughly_uniform(self):
+        """Test partial shuffles pick every card with similar frequency."""
+        deck = Deck(seed=3)
+        deck.shuffle()
+        counts = [0] * NUM_CARDS
+        for _ in range(5200):
+            deck.reset()
+            for index in deck.draw_indices(2):
+                counts[index] += 1
+        assert min(counts) > 130 and max(counts) < 270  # Expected 200 each
+
 
 class TestPlayerAction:
     """Test PlayerAction class."""
@@ -0,0 +1,127 @@
+"""Tests for the array-encoded heads-up game tree."""
+
+from random import Random
+
+import numpy as np
+import pytest
+
+from texas_holdem_ml_bot.engine.abstraction import ActionAbstraction, BetSizing
+from texas_holdem_ml_bot.engine.cards import Deck
+from texas_holdem_ml_bot.engine.game_state import GameState, PlayerState
+from texas_holdem_ml_bot.engine.game_tree import (
+    FOLD_TERMINAL,
+    NOT_TERMINAL,
+    SHOWDOWN_TERMINAL,
+    STREETS,
+    build_tree,
+    load_tree,
+    save_tree,
+)
+from texas_holdem_ml_bot.engine.rules import Street
+from texas_holdem_ml_bot.engine.simulator import apply, start_hand
+
+
+@pytest.fixture(scope="module")
+def tree():
+    """A small tree: pot-sized bets and all-in, 40-chip stacks."""
+    sizing = BetSizing({street: ((1.0,), (1.0,)) for street in STREETS[:4]})
+    return build_tree(ActionAbstraction(sizing), stack=40)
+
+
+def replay(stack, history):
+    """Play ``history`` from the start of a heads-up hand."""
+    state = GameState(players=[PlayerState(stack), PlayerState(stack)], button=0)
+    start_hand(state, Deck(seed=0))
+    for action in history:
+        apply(state, action)
+    return state
+
+
+class TestStructure:
+    """Test the shape of the tree."""
+
+    def test_root(self, tree):
+        """Test the button acts first preflop with the blinds in."""
+        assert tree.parent[0] == -1
+        assert tree.actor[0] == 0
+        assert tree.pot[0] == 3
+        assert tree.committed[0].tolist() == [1, 2]
+        assert STREETS[tree.street[0]] is Street.PREFLOP
+
+    def test_children_are_consecutive(self, tree):
+        """Test every non-root node is the child of exactly its parent."""
+        seen = np.zeros(tree.num_nodes, dtype=np.int64)
+        for node in range(tree.num_nodes):
+            children = tree.children(node)
+            assert np.all(tree.parent[children.start : children.stop] == node)
+            seen[children.start : children.stop] += 1
+        assert seen[0] == 0
+        assert np.all(seen[1:] == 1)
+
+    def test_terminals(self, tree):
+        """Test terminals are leaves and decision nodes are not."""
+        leaves = tree.num_children == 0
+        assert np.array_equal(leaves, tree.terminal != NOT_TERMINAL)
+        assert np.all(tree.actor[leaves] == -1)
+        assert np.all(tree.first_child[leaves] == -1)
+        folded = tree.terminal == FOLD_TERMINAL
+        shown = tree.terminal == SHOWDOWN_TERMINAL
+        assert folded.any() and shown.any()
+        # Showdowns are reached with equal contributions, folds never
+        committed = tree.committed
+        assert np.all(committed[shown, 0] == committed[shown, 1])
+        assert np.all(committed[folded, 0] != committed[folded, 1])
+
+    def test_infosets_are_contiguous(self, tree):
+        """Test decision nodes are numbered 0..num_infosets-1 in node order."""
+        nodes = tree.infoset_nodes
+        assert np.array_equal(tree.infoset[nodes], np.arange(tree.num_infosets))
+        assert np.all(tree.infoset[tree.terminal != NOT_TERMINAL] == -1)
+        offsets = tree.action_offsets
+        assert offsets[0] == 0
+        assert offsets[-1] == tree.num_nodes - 1
+        assert np.array_equal(np.diff(offsets), tree.num_children[nodes])
+
+    def test_nodes_match_simulator(self, tree):
+        """Test replaying a node's history reproduces its stored fields."""
+        rng = Random(0)
+        for node in rng.sample(range(tree.num_nodes), 300):
+            state = replay(tree.stack, tree.history(node))
+            expected_actor = -1 if state.to_act is None else state.to_act
+            assert tree.actor[node] == expected_actor
+            assert STREETS[tree.street[node]] is state.street
+            assert tree.pot[node] == state.pot
+            assert tree.committed[node].tolist() == [p.committed for p in state.players]
+
+    def test_node_limit(self):
+        """Test building stops once the tree outgrows max_nodes."""
+        with pytest.raises(ValueError, match="exceeds max_nodes=100"):
+            build_tree(stack=200, max_nodes=100)
+
+
+class TestStorage:
+    """Test saving and memory-mapping trees."""
+
+    def test_round_trip(self, tree, tmp_path):
+        """Test a saved tree loads back memory-mapped and equal."""
+        save_tree(tree, tmp_path / "tree")
+        loaded = load_tree(tmp_path / "tree")
+        assert isinstance(loaded.parent, np.memmap)
+        assert loaded.stack == tree.stack
+        for name in ("parent", "first_child", "num_children", "committed", "infoset"):
+            stored = getattr(loaded, name)
+            assert stored.dtype == getattr(tree, name).dtype
+            assert np.array_equal(stored, getattr(tree, name))
+        assert loaded.history(tree.num_nodes - 1) == tree.history(tree.num_nodes - 1)
+
+    def test_load_into_memory(self, tree, tmp_path):
+        """Test mmap=False reads plain arrays."""
+        save_tree(tree, tmp_path)
+        loaded = load_tree(tmp_path, mmap=False)
+        assert not isinstance(loaded.pot, np.memmap)
+        assert np.array_equal(loaded.pot, tree.pot)
+
+    def test_missing_files(self, tmp_path):
+        """Test an incomplete directory is reported."""
+        with pytest.raises(FileNotFoundError, match="missing parent"):
+            load_tree(tmp_path)
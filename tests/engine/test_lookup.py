@@ -0,0 +1,396 @@
+"""Tests for the lookup-table evaluator backend."""
+
+import random
+
+import numpy as np
+import pytest
+
+from texas_holdem_ml_bot.engine import evaluator, lookup
+from texas_holdem_ml_bot.engine.cards import (
+    Card,
+    Deck,
+    cards_to_indices,
+    cards_to_mask,
+    index_to_card,
+)
+from texas_holdem_ml_bot.engine.evaluator import (
+    FLUSH,
+    ROYAL_FLUSH,
+    STRAIGHT,
+    STRAIGHT_FLUSH,
+    BoardContext,
+    decode_rank,
+    evaluate_batch,
+    evaluate_hand,
+    evaluate_indices,
+    evaluate_mask,
+    evaluate_rank,
+    evaluate_rank_indices,
+    evaluate_rank_mask,
+    get_evaluator_backend,
+    rank_boards,
+    set_evaluator_backend,
+)
+
+
+@pytest.fixture(scope="module")
+def tables(tmp_path_factory):
+    """Generate tables once into a temporary directory and install them."""
+    directory = lookup.write_tables(tmp_path_factory.mktemp("tables"))
+    loaded = lookup.load_tables(directory, generate=False)
+    lookup.use_tables(loaded)
+    yield loaded
+    lookup.use_tables(None)
+
+
+@pytest.fixture
+def lookup_backend(tables):
+    """Switch evaluate_hand to the lookup backend for one test."""
+    set_evaluator_backend("lookup")
+    yield
+    set_evaluator_backend("python")
+
+
+class TestTableGeneration:
+    """Test generated table contents and files."""
+
+    def test_hand_class_count(self, tables):
+        """Test there are 7462 distinct hand classes plus a placeholder."""
+        assert len(tables.hand_classes) == lookup.NUM_HAND_CLASSES + 1
+
+    def test_hand_classes_sorted(self, tables):
+        """Test classes run from 7-5-4-3-2 high to a royal flush."""
+        classes = tables.hand_classes[1:]
+        assert list(classes) == sorted(classes)
+        assert classes[0] == (-1, (7, 5, 4, 3, 2))
+        assert classes[-1] == (ROYAL_FLUSH, (14,))
+
+    def test_tables_are_memory_mapped(self, tables, tmp_path):
+        """Test tables load as read-only memory maps."""
+        directory = lookup.write_tables(tmp_path)
+        array = np.load(directory / "rank_next.npy", mmap_mode="r")
+        assert isinstance(array, np.memmap)
+        assert not array.flags.writeable
+
+    def test_missing_tables_without_generate(self, tmp_path):
+        """Test loading a missing table fails when generation is disabled."""
+        with pytest.raises(FileNotFoundError, match="Lookup tables not found"):
+            lookup.load_tables(tmp_path, generate=False)
+
+    def test_shared_table_dir_and_attach(self, tables):
+        """Test workers can map the active tables by directory."""
+        directory = lookup.shared_table_dir()
+        assert directory == tables.directory
+        lookup.attach_tables(directory)
+        assert lookup.get_tables() is tables
+
+    def test_attach_missing_tables(self, tables, tmp_path):
+        """Test attaching an empty directory fails without generating."""
+        with pytest.raises(FileNotFoundError, match="Lookup tables not found"):
+            lookup.attach_tables(tmp_path)
+        assert lookup.get_tables() is tables
+
+
+class TestLookupEvaluation:
+    """Test lookup evaluation against the reference evaluator."""
+
+    def test_matches_reference_on_random_hands(self, tables):
+        """Test 5, 6 and 7 card hands agree with the Python backend."""
+        rng = random.Random(7)
+        for _ in range(5000):
+            deck = Deck(rng=rng)
+            deck.shuffle()
+            cards = deck.draw(rng.choice([5, 6, 7]))
+            assert lookup.evaluate_lookup(cards) == evaluate_hand(cards)
+
+    def test_flush_beats_board_straight(self, tables):
+        """Test flush detection with a straight on board."""
+        cards = [
+            Card(9, "♥"),
+            Card(8, "♠"),
+            Card(7, "♥"),
+            Card(6, "♥"),
+            Card(5, "♣"),
+            Card(2, "♥"),
+            Card(14, "♥"),
+        ]
+        assert lookup.evaluate_lookup(cards) == (FLUSH, (14, 9, 7, 6, 2))
+
+    def test_wheel(self, tables):
+        """Test the wheel is found from the rank state machine."""
+        cards = [
+            Card(14, "♠"),
+            Card(5, "♥"),
+            Card(4, "♦"),
+            Card(3, "♣"),
+            Card(2, "♠"),
+            Card(13, "♥"),
+        ]
+        assert lookup.evaluate_lookup(cards) == (STRAIGHT, (5,))
+
+
+class TestIntegerEvaluation:
+    """Test evaluation entry points for indices and hand masks."""
+
+    def test_indices_and_mask_match_reference(self, tables):
+        """Test integer entry points agree with evaluate_hand."""
+        rng = random.Random(11)
+        for _ in range(3000):
+            deck = Deck(rng=rng)
+            deck.shuffle()
+            cards = deck.draw(rng.choice([5, 6, 7]))
+            expected = evaluate_hand(cards)
+            assert evaluate_indices(cards_to_indices(cards)) == expected
+            assert evaluate_mask(cards_to_mask(cards)) == expected
+
+    def test_straight_flush_from_mask(self, tables):
+        """Test flush-suit extraction from a hand mask."""
+        cards = [Card(r, "♦") for r in [9, 8, 7, 6, 5]] + [Card(9, "♠")]
+        assert evaluate_mask(cards_to_mask(cards)) == (STRAIGHT_FLUSH, (9,))
+
+    def test_indices_size_validation(self, tables):
+        """Test index lists must hold 5-7 cards."""
+        with pytest.raises(ValueError, match="Must evaluate 5-7 cards"):
+            evaluate_indices([0, 1, 2, 3])
+
+    def test_indices_value_validation(self, tables):
+        """Test out-of-range or repeated indices raise ValueError."""
+        with pytest.raises(ValueError, match="Card indices must be 0-51"):
+            evaluate_indices([-1, 0, 4, 8, 12])
+        with pytest.raises(ValueError, match="Card indices must be 0-51"):
+            evaluate_indices([52, 0, 4, 8, 12])
+        with pytest.raises(ValueError, match="form no valid hand"):
+            evaluate_indices([0, 0, 0, 0, 0])
+
+    def test_mask_size_validation(self, tables):
+        """Test masks must hold 5-7 cards."""
+        with pytest.raises(ValueError, match="Must evaluate 5-7 cards"):
+            evaluate_mask((1 << 8) - 1)
+
+    def test_mask_bit_validation(self, tables):
+        """Test masks with bits outside the deck are rejected."""
+        for mask in ((1 << 52) | 0x1F, -0x1F):
+            with pytest.raises(ValueError, match="Hand mask must only use bits"):
+                evaluate_mask(mask)
+
+
+class TestBatchEvaluation:
+    """Test vectorized evaluation of card arrays."""
+
+    @pytest.mark.parametrize("num_cards", [5, 6, 7])
+    def test_batch_matches_evaluate_hand(self, tables, num_cards):
+        """Test every row decodes to the evaluate_hand result."""
+        rng = np.random.default_rng(3)
+        batch = np.argsort(rng.random((2000, 52)), axis=1)[:, :num_cards]
+        scores = evaluate_batch(batch)
+
+        assert scores.shape == (2000,)
+        assert scores.dtype == np.int32
+        for row, score in zip(batch.tolist(), scores.tolist()):
+            cards = [index_to_card(i) for i in row]
+            assert tables.hand_classes[score] == evaluate_hand(cards)
+
+    def test_batch_scores_order_hands(self, tables):
+        """Test batch scores compare like HandScore tuples."""
+        royal = cards_to_indices([Card(r, "♠") for r in [14, 13, 12, 11, 10]])
+        flush = cards_to_indices([Card(r, "♠") for r in [14, 13, 12, 11, 9]])
+        straight = cards_to_indices(
+            [Card(14, "♥"), Card(13, "♠"), Card(12, "♠"), Card(11, "♠")]
+            + [Card(10, "♠")]
+        )
+        scores = evaluate_batch(np.array([royal, flush, straight], dtype=np.int8))
+        assert scores[0] > scores[1] > scores[2]
+
+    def test_batch_accepts_empty_array(self, tables):
+        """Test an empty batch returns an empty result."""
+        assert evaluate_batch(np.empty((0, 7), dtype=np.int64)).shape == (0,)
+
+    def test_batch_shape_validation(self, tables):
+        """Test rows must hold 5-7 cards."""
+        with pytest.raises(ValueError, match="Must evaluate an"):
+            evaluate_batch(np.zeros((3, 4), dtype=np.int64))
+        with pytest.raises(ValueError, match="Must evaluate an"):
+            evaluate_batch(np.zeros(7, dtype=np.int64))
+
+    def test_batch_index_validation(self, tables):
+        """Test out-of-range card indices are rejected."""
+        with pytest.raises(ValueError, match="Card indices must be in 0-51"):
+            evaluate_batch(np.array([[0, 1, 2, 3, 52]]))
+
+
+class TestHandRank:
+    """Test single-integer hand ranks and their decoder."""
+
+    def test_rank_extremes(self, tables):
+        """Test the weakest and strongest hands map to 1 and 7462."""
+        worst = [Card(7, "♠"), Card(5, "♥"), Card(4, "♦"), Card(3, "♣")]
+        worst.append(Card(2, "♠"))
+        royal = [Card(r, "♣") for r in [14, 13, 12, 11, 10]]
+        assert evaluate_rank(worst) == 1
+        assert evaluate_rank(royal) == lookup.NUM_HAND_CLASSES
+
+    def test_decode_round_trip(self, tables):
+        """Test decoding gives evaluate_hand tuples in strictly rising order."""
+        decoded = [decode_rank(r) for r in range(1, lookup.NUM_HAND_CLASSES + 1)]
+        assert all(a < b for a, b in zip(decoded, decoded[1:]))
+
+    def test_rank_order_matches_hand_score(self, tables):
+        """Test int comparisons agree with HandScore comparisons."""
+        rng = random.Random(5)
+        for _ in range(2000):
+            deck = Deck(rng=rng)
+            deck.shuffle()
+            hand_a, hand_b = deck.draw(7), deck.draw(7)
+            rank_a, rank_b = evaluate_rank(hand_a), evaluate_rank(hand_b)
+            score_a, score_b = evaluate_hand(hand_a), evaluate_hand(hand_b)
+            assert decode_rank(rank_a) == score_a
+            assert (rank_a > rank_b) == (score_a > score_b)
+            assert (rank_a == rank_b) == (score_a == score_b)
+
+    def test_integer_rank_entry_points(self, tables):
+        """Test index and mask rank functions match evaluate_rank."""
+        cards = [Card(10, "♠"), Card(10, "♥"), Card(3, "♦"), Card(3, "♣")]
+        cards += [Card(8, "♠"), Card(2, "♥")]
+        expected = evaluate_rank(cards)
+        assert evaluate_rank_indices(cards_to_indices(cards)) == expected
+        assert evaluate_rank_mask(cards_to_mask(cards)) == expected
+
+    def test_ranks_fit_int32_columns(self, tables):
+        """Test ranks sort in an int32 array the same as HandScore tuples."""
+        hands = [[Card(r, "♠") for r in [14, 13, 12, 11, 9]]]
+        hands.append(
+            [Card(9, s) for s in ["♠", "♥", "♦"]] + [Card(4, "♣"), Card(4, "♦")]
+        )
+        hands.append([Card(r, "♥") for r in [6, 5, 4, 3, 2]])
+        ranks = np.array([evaluate_rank(h) for h in hands], dtype=np.int32)
+        by_rank = [hands[i] for i in np.argsort(ranks)]
+        assert by_rank == sorted(hands, key=evaluate_hand)
+
+    def test_invalid_rank(self, tables):
+        """Test ranks outside 1..7462 cannot be decoded."""
+        with pytest.raises(ValueError, match="Invalid hand rank"):
+            decode_rank(0)
+        with pytest.raises(ValueError, match="Invalid hand rank"):
+            decode_rank(lookup.NUM_HAND_CLASSES + 1)
+
+    def test_rank_size_validation(self):
+        """Test evaluate_rank requires 5-7 cards."""
+        with pytest.raises(ValueError, match="Must evaluate 5-7 cards"):
+            evaluate_rank([Card(14, "♠")])
+
+
+class TestBoardContext:
+    """Test board-conditioned evaluation of hole-card pairs."""
+
+    def test_rank_matches_full_evaluation(self, tables):
+        """Test flop, turn and river contexts agree with evaluate_rank."""
+        rng = random.Random(21)
+        for _ in range(2000):
+            cards = rng.sample(range(52), 7)
+            board, hole = cards[: rng.choice([3, 4, 5])], cards[5:]
+            context = BoardContext.from_indices(board)
+            assert context.rank(*hole) == evaluate_rank_indices(board + hole)
+
+    def test_deal_is_incremental(self, tables):
+        """Test dealing turn and river matches building from scratch."""
+        flop = BoardContext.from_indices([0, 17, 34])
+        turn = flop.deal(51)
+        river = turn.deal(8)
+
+        assert flop.cards == (0, 17, 34)
+        assert river == BoardContext.from_indices([0, 17, 34, 51, 8])
+        assert river.mask == cards_to_mask([index_to_card(i) for i in river.cards])
+
+    def test_flush_completed_by_hole_cards(self, tables):
+        """Test suit masks combine board and hole cards."""
+        board = [Card(14, "♥"), Card(9, "♥"), Card(4, "♥"), Card(13, "♠")]
+        context = BoardContext.from_cards(board)
+        first, second = cards_to_indices([Card(2, "♥"), Card(6, "♥")])
+        assert context.evaluate(first, second) == (FLUSH, (14, 9, 6, 4, 2))
+
+    def test_rank_many_matches_rank(self, tables):
+        """Test the vectorized path on every live pair of a two-tone board."""
+        context = BoardContext.from_indices([0, 4, 8, 16, 51])
+        holes = np.array(
+            [
+                (a, b)
+                for a in range(52)
+                for b in range(a + 1, 52)
+                if not (context.mask >> a & 1 or context.mask >> b & 1)
+            ]
+        )
+        scores = context.rank_many(holes)
+        assert len(holes) == 1081
+        assert scores.tolist() == [context.rank(a, b) for a, b in holes.tolist()]
+
+    def test_deal_validation(self, tables):
+        """Test duplicate, invalid and sixth board cards are rejected."""
+        context = BoardContext.from_indices([1, 2, 3, 4, 5])
+        with pytest.raises(ValueError, match="already on the board"):
+            BoardContext.from_indices([1, 1])
+        with pytest.raises(ValueError, match="Invalid card index"):
+            BoardContext().deal(52)
+        with pytest.raises(ValueError, match="more than 5 cards"):
+            context.deal(6)
+
+    def test_rank_many_needs_flop(self, tables):
+        """Test vectorized scoring requires at least a flop."""
+        with pytest.raises(ValueError, match="at least 3 board cards"):
+            BoardContext.from_indices([0, 1]).rank_many(np.array([[2, 3]]))
+
+
+class TestRankBoards:
+    """Test scoring pairs against many boards at once."""
+
+    @pytest.mark.parametrize("board_size", [3, 4, 5])
+    def test_matches_board_context(self, tables, board_size):
+        """Test every pair agrees with a per-board BoardContext."""
+        rng = random.Random(board_size)
+        boards, holes, rows = [], [], []
+        for row in range(300):
+            cards = rng.sample(range(52), board_size + 4)
+            boards.append(cards[:board_size])
+            holes += [cards[board_size : board_size + 2], cards[board_size + 2 :]]
+            rows += [row, row]
+        scores = rank_boards(np.array(boards), np.array(holes), np.array(rows))
+
+        expected = [
+            BoardContext.from_indices(boards[row]).rank(*hole)
+            for hole, row in zip(holes, rows)
+        ]
+        assert scores.tolist() == expected
+
+    def test_shape_validation(self, tables):
+        """Test malformed boards, pairs and row indices are rejected."""
+        board = np.array([[0, 1, 2]])
+        with pytest.raises(ValueError, match="Boards must have shape"):
+            rank_boards(np.array([[0, 1]]), np.array([[3, 4]]), np.array([0]))
+        with pytest.raises(ValueError, match="Hole cards must have shape"):
+            rank_boards(board, np.array([3, 4]), np.array([0]))
+        with pytest.raises(ValueError, match="one board row per pair"):
+            rank_boards(board, np.array([[3, 4]]), np.array([0, 0]))
+
+
+class TestBackendSelection:
+    """Test switching evaluate_hand between backends."""
+
+    def test_default_backend(self):
+        """Test the Python backend is active by default."""
+        assert get_evaluator_backend() == "python"
+
+    def test_lookup_backend_used_by_evaluate_hand(self, lookup_backend):
+        """Test evaluate_hand dispatches to the lookup backend."""
+        assert get_evaluator_backend() == "lookup"
+        assert evaluator._backend_fn is lookup.evaluate_lookup
+        royal = [Card(r, "♦") for r in [14, 13, 12, 11, 10]]
+        assert evaluate_hand(royal) == (ROYAL_FLUSH, (14,))
+
+    def test_lookup_backend_validates_size(self, lookup_backend):
+        """Test the size check still applies with the lookup backend."""
+        with pytest.raises(ValueError, match="Must evaluate 5-7 cards"):
+            evaluate_hand([Card(14, "♠")] * 4)
+
+    def test_unknown_backend(self):
+        """Test unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unknown evaluator backend"):
+            set_evaluator_backend("cython")
@@ -0,0 +1,307 @@
+"""Tests for showdown resolution."""
+
+import random
+
+import pytest
+
+from texas_holdem_ml_bot.engine.cards import Card, Deck
+from texas_holdem_ml_bot.engine.evaluator import (
+    FLUSH,
+    FULL_HOUSE,
+    STRAIGHT,
+    evaluate_hand,
+)
+from texas_holdem_ml_bot.engine.game_state import GameState, PlayerState
+from texas_holdem_ml_bot.engine.rules import Street
+from texas_holdem_ml_bot.engine.showdown import (
+    Pot,
+    build_pots,
+    resolve_showdown,
+    seats_from_button,
+    split_pot,
+)
+
+
+def make_state(num_players, board, pot=100, button=0, folded=()):
+    """Build a river state with the given board and folded seats."""
+    players = [PlayerState(1000, in_hand=i not in folded) for i in range(num_players)]
+    return GameState(
+        players=players, button=button, street=Street.RIVER, board=board, pot=pot
+    )
+
+
+def all_in_state(committed, board, button=0, folded=()):
+    """Build a river state where each seat put ``committed[seat]`` chips in."""
+    players = [
+        PlayerState(0, in_hand=seat not in folded, committed=chips)
+        for seat, chips in enumerate(committed)
+    ]
+    return GameState(
+        players=players,
+        button=button,
+        street=Street.RIVER,
+        board=board,
+        pot=sum(committed),
+    )
+
+
+def reference_payouts(state, holes):
+    """Pay side pots the slow way: evaluate every eligible hand per layer."""
+    num_players = len(state.players)
+    committed = [p.committed for p in state.players]
+    live = [seat for seat, p in enumerate(state.players) if p.in_hand]
+    # Chips per eligible set; nested sets, so equal sets are adjacent layers
+    pots = {}
+    previous = 0
+    for level in sorted(set(committed)):
+        chips = sum(min(c, level) - min(c, previous) for c in committed)
+        eligible = frozenset(seat for seat in live if committed[seat] >= level)
+        key = eligible if eligible else list(pots)[-1]
+        pots[key] = pots.get(key, 0) + chips
+        previous = level
+    payouts = [0] * num_players
+    for eligible, chips in pots.items():
+        scores = {seat: evaluate_hand(holes[seat] + state.board) for seat in eligible}
+        best = max(scores.values())
+        winners = [
+            seat
+            for seat in seats_from_button(state.button, num_players)
+            if scores.get(seat) == best
+        ]
+        for seat, won in enumerate(split_pot(chips, winners, num_players)):
+            payouts[seat] += won
+    return tuple(payouts)
+
+
+BOARD = [Card(14, "♠"), Card(13, "♦"), Card(9, "♥"), Card(5, "♣"), Card(2, "♠")]
+
+
+class TestResolveShowdown:
+    """Test ranking live players and awarding the pot."""
+
+    def test_single_winner(self):
+        """Test the best hand takes the whole pot."""
+        state = make_state(3, BOARD, pot=90)
+        holes = [
+            [Card(14, "♥"), Card(14, "♦")],  # Trip aces
+            [Card(13, "♠"), Card(13, "♥")],  # Trip kings
+            [Card(4, "♦"), Card(3, "♦")],  # Wheel
+        ]
+        result = resolve_showdown(state, holes)
+
+        assert result.winners == (2,)
+        assert result.payouts == (0, 0, 90)
+        assert result.hand(2) == (STRAIGHT, (5,))
+        assert result.standings == ((2,), (0,), (1,))
+        assert not result.is_split
+
+    def test_split_pot_odd_chip(self):
+        """Test a tie splits the pot with the odd chip left of the button."""
+        board = [Card(10, "♠"), Card(11, "♦"), Card(12, "♥"), Card(13, "♣")]
+        board.append(Card(2, "♠"))
+        state = make_state(3, board, pot=101, button=1)
+        holes = [
+            [Card(14, "♥"), Card(3, "♦")],  # Broadway
+            [Card(4, "♥"), Card(4, "♦")],  # Pair of fours
+            [Card(14, "♣"), Card(5, "♦")],  # Broadway
+        ]
+        result = resolve_showdown(state, holes)
+
+        # Seat 2 is first left of button 1, so it gets the odd chip
+        assert result.winners == (2, 0)
+        assert result.payouts == (50, 0, 51)
+        assert result.is_split
+        assert result.standings == ((2, 0), (1,))
+
+    def test_folded_players_are_skipped(self):
+        """Test folded seats are neither evaluated nor paid."""
+        state = make_state(3, BOARD, pot=30, folded={0})
+        holes = [None, [Card(9, "♠"), Card(9, "♦")], [Card(2, "♥"), Card(2, "♦")]]
+        result = resolve_showdown(state, holes)
+
+        assert 0 not in result.ranks
+        assert result.winners == (1,)
+        assert result.hand(2)[0] == 2  # Trip twos lose to trip nines
+
+    def test_uncontested_pot(self):
+        """Test a lone live player wins without hole cards or a full board."""
+        state = make_state(4, [], pot=7, folded={0, 1, 3})
+        result = resolve_showdown(state, [None] * 4)
+
+        assert result.winners == (2,)
+        assert result.payouts == (0, 0, 7, 0)
+        assert result.ranks == {}
+
+    def test_nine_handed_matches_evaluate_hand(self):
+        """Test random 9-handed showdowns agree with evaluate_hand."""
+        rng = random.Random(9)
+        for _ in range(300):
+            deck = Deck(rng=rng)
+            deck.shuffle()
+            holes = [deck.draw(2) for _ in range(9)]
+            board = deck.draw(5)
+            state = make_state(9, board, pot=900, button=rng.randrange(9))
+            result = resolve_showdown(state, holes)
+
+            scores = [evaluate_hand(hole + board) for hole in holes]
+            best = max(scores)
+            expected = {seat for seat, s in enumerate(scores) if s == best}
+            assert set(result.winners) == expected
+            assert sum(result.payouts) == 900
+            for seat, score in enumerate(scores):
+                assert result.hand(seat) == score
+
+    def test_flush_over_full_house_ordering(self):
+        """Test standings order different categories correctly."""
+        board = [Card(8, "♥"), Card(8, "♦"), Card(6, "♥"), Card(3, "♥")]
+        board.append(Card(12, "♣"))
+        state = make_state(2, board)
+        holes = [[Card(14, "♥"), Card(10, "♥")], [Card(12, "♠"), Card(12, "♦")]]
+        result = resolve_showdown(state, holes)
+
+        assert result.hand(0)[0] == FLUSH
+        assert result.hand(1)[0] == FULL_HOUSE
+        assert result.winners == (1,)
+
+
+class TestSidePots:
+    """Test pot layering and awarding side pots."""
+
+    def test_layers_by_contribution(self):
+        """Test each all-in level closes a pot for the seats above it."""
+        pots = build_pots([50, 100, 100, 30], [True] * 4)
+        assert pots == [
+            Pot(120, (0, 1, 2, 3)),
+            Pot(60, (0, 1, 2)),
+            Pot(100, (1, 2)),
+        ]
+
+    def test_folded_levels_merge(self):
+        """Test levels only a folded seat reached add to the pot below."""
+        pots = build_pots([40, 100, 100, 70], [True, True, True, False])
+        assert pots == [Pot(160, (0, 1, 2)), Pot(150, (1, 2))]
+
+    def test_dead_money_goes_to_top_pot(self):
+        """Test chips above the last live level are still awarded."""
+        assert build_pots([100, 60], [False, True]) == [Pot(160, (1,))]
+
+    def test_uncounted_chips_form_main_pot(self):
+        """Test pot chips without contributions go to every live seat."""
+        assert build_pots([0, 0, 0], [True, False, True], 9) == [Pot(9, (0, 2))]
+        assert build_pots([5, 5], [True, True], 4) == [Pot(14, (0, 1))]
+
+    @pytest.mark.parametrize(
+        "contributions, live, match",
+        [
+            ([10, -1], [True, True], "cannot be negative"),
+            ([10, 10], [True], "Expected 2 live flags"),
+            ([10, 10], [False, False], "No live players"),
+        ],
+    )
+    def test_invalid(self, contributions, live, match):
+        """Test malformed contributions are rejected."""
+        with pytest.raises(ValueError, match=match):
+            build_pots(contributions, live)
+
+    def test_short_all_in_wins_main_pot(self):
+        """Test the best hand all-in for less only wins what it covered."""
+        state = all_in_state([20, 100, 100], BOARD)
+        holes = [
+            [Card(14, "♥"), Card(14, "♦")],  # Trip aces
+            [Card(13, "♠"), Card(13, "♥")],  # Trip kings
+            [Card(12, "♣"), Card(11, "♣")],  # Ace high
+        ]
+        result = resolve_showdown(state, holes)
+
+        assert result.pots == (Pot(60, (0, 1, 2)), Pot(160, (1, 2)))
+        assert result.pot_winners == ((0,), (1,))
+        assert result.winners == (0,)
+        assert result.payouts == (60, 160, 0)
+
+    def test_split_side_pot_odd_chip(self):
+        """Test each pot gives its own odd chip left of the button."""
+        board = [Card(10, "♠"), Card(11, "♦"), Card(12, "♥"), Card(13, "♣")]
+        board.append(Card(2, "♠"))
+        state = all_in_state([5, 8, 8, 6], board, button=0, folded={3})
+        holes = [
+            [Card(4, "♥"), Card(4, "♦")],  # Pair of fours
+            [Card(14, "♥"), Card(3, "♦")],  # Broadway
+            [Card(14, "♣"), Card(5, "♦")],  # Broadway
+            None,
+        ]
+        result = resolve_showdown(state, holes)
+
+        # Main pot 20, side pot 3 + 3 + 1 (seat 3 folded after 6)
+        assert result.pots == (Pot(20, (0, 1, 2)), Pot(7, (1, 2)))
+        assert result.payouts == (0, 14, 13, 0)
+
+    def test_over_committed_rejected(self):
+        """Test contributions larger than the pot are an error."""
+        state = all_in_state([10, 10], BOARD)
+        state.pot = 15
+        holes = [[Card(3, "♠"), Card(4, "♠")], [Card(6, "♠"), Card(7, "♠")]]
+        with pytest.raises(ValueError, match="committed 20 chips but the pot is 15"):
+            resolve_showdown(state, holes)
+
+    def test_nine_handed_all_ins_match_reference(self):
+        """Test stacked 9-handed all-ins pay out chip-exact like a slow reference."""
+        rng = random.Random(23)
+        for _ in range(300):
+            deck = Deck(rng=rng)
+            deck.shuffle()
+            holes = [deck.draw(2) for _ in range(9)]
+            committed = [rng.choice([5, 10, 10, 25, 40, 40, 77]) for _ in range(9)]
+            folded = set(rng.sample(range(9), rng.randrange(8)))
+            state = all_in_state(
+                committed, deck.draw(5), button=rng.randrange(9), folded=folded
+            )
+            result = resolve_showdown(state, holes)
+
+            assert sum(result.payouts) == state.pot
+            assert sum(pot.amount for pot in result.pots) == state.pot
+            if len(folded) < 8:
+                assert result.payouts == reference_payouts(state, holes)
+
+
+class TestShowdownValidation:
+    """Test invalid showdown inputs."""
+
+    def test_incomplete_board(self):
+        """Test contested showdowns need five board cards."""
+        state = make_state(2, BOARD[:4])
+        holes = [[Card(3, "♠"), Card(4, "♠")], [Card(6, "♠"), Card(7, "♠")]]
+        with pytest.raises(ValueError, match="5-card board"):
+            resolve_showdown(state, holes)
+
+    def test_missing_hole_cards(self):
+        """Test live seats must provide two hole cards."""
+        state = make_state(2, BOARD)
+        with pytest.raises(ValueError, match="Seat 1 needs exactly 2 hole cards"):
+            resolve_showdown(state, [[Card(3, "♠"), Card(4, "♠")], None])
+
+    def test_duplicate_cards(self):
+        """Test a card shared with the board or another seat is rejected."""
+        state = make_state(2, BOARD)
+        holes = [[Card(14, "♠"), Card(4, "♠")], [Card(6, "♠"), Card(7, "♠")]]
+        with pytest.raises(ValueError, match="already in play"):
+            resolve_showdown(state, holes)
+
+    def test_hole_cards_length(self):
+        """Test hole cards must be given for every seat."""
+        state = make_state(3, BOARD)
+        with pytest.raises(ValueError, match="Expected hole cards for 3 seats"):
+            resolve_showdown(state, [None, None])
+
+
+class TestPotHelpers:
+    """Test seat ordering and pot splitting helpers."""
+
+    def test_seats_from_button(self):
+        """Test seats start left of the button and wrap."""
+        assert seats_from_button(2, 4) == [3, 0, 1, 2]
+
+    def test_split_pot_is_chip_exact(self):
+        """Test every chip is awarded."""
+        payouts = split_pot(100, [3, 0, 1], 4)
+        assert payouts == [33, 33, 0, 34]
+        assert sum(payouts) == 100
@@ -0,0 +1,287 @@
+"""Tests for the step-based hand simulator."""
+
+import pytest
+
+from texas_holdem_ml_bot.engine.cards import Action, Deck, PlayerAction
+from texas_holdem_ml_bot.engine.game_state import GameState, PlayerState
+from texas_holdem_ml_bot.engine.rules import Street
+from texas_holdem_ml_bot.engine.simulator import (
+    apply,
+    legal_actions,
+    settle,
+    simulate_random_hands,
+    start_hand,
+)
+
+FOLD = PlayerAction(Action.FOLD)
+CHECK = PlayerAction(Action.CHECK)
+CALL = PlayerAction(Action.CALL)
+
+
+def table(*stacks, button=0, seed=1):
+    """Start a hand at a table with the given stacks."""
+    state = GameState(players=[PlayerState(stack) for stack in stacks], button=button)
+    holes = start_hand(state, Deck(seed=seed))
+    return state, holes
+
+
+def raise_to(amount):
+    """Raise to a total of ``amount``."""
+    return PlayerAction(Action.RAISE, amount)
+
+
+def bet(amount):
+    """Bet ``amount``."""
+    return PlayerAction(Action.BET, amount)
+
+
+class TestStartHand:
+    """Test dealing, blinds and the first player to act."""
+
+    def test_heads_up(self):
+        """Test the button posts the small blind and acts first."""
+        state, holes = table(100, 100)
+        assert [p.bet for p in state.players] == [1, 2]
+        assert state.pot == 3
+        assert state.to_act == 0
+        cards = [card for hole in holes for card in hole]
+        assert len(cards) == len(set(cards)) == 4
+        legal = legal_actions(state)
+        assert legal.actions == (Action.FOLD, Action.CALL, Action.RAISE)
+        assert (legal.to_call, legal.min_amount, legal.max_amount) == (1, 4, 100)
+
+    def test_three_handed(self):
+        """Test action starts left of the big blind."""
+        state, _ = table(100, 100, 100, button=1)
+        assert [p.bet for p in state.players] == [2, 0, 1]
+        assert state.to_act == 1
+
+    def test_resets_previous_hand(self):
+        """Test a reused state starts clean."""
+        state, holes = table(100, 100)
+        apply(state, FOLD)
+        settle(state, holes)
+        start_hand(state, Deck(seed=2))
+        assert state.board == []
+        assert state.street == Street.PREFLOP
+        assert all(p.in_hand for p in state.players)
+        assert state.to_act == 0
+
+    def test_invalid_tables(self):
+        """Test unsupported sizes and empty stacks are rejected."""
+        with pytest.raises(ValueError, match="supports 2-10 players"):
+            table(100)
+        with pytest.raises(ValueError, match="Seat 1 has no chips"):
+            table(100, 0)
+
+
+class TestStreets:
+    """Test round closing and street advancement."""
+
+    def test_big_blind_option(self):
+        """Test a limped pot gives the big blind a check or raise."""
+        state, _ = table(100, 100)
+        apply(state, CALL)
+        assert state.to_act == 1
+        assert legal_actions(state).actions == (Action.CHECK, Action.RAISE)
+        apply(state, CHECK)
+        assert state.street == Street.FLOP
+        assert len(state.board) == 3
+        assert state.to_act == 1  # Big blind acts first after the flop
+        assert [p.bet for p in state.players] == [0, 0]
+        assert legal_actions(state).actions == (Action.CHECK, Action.BET)
+
+    def test_check_down_to_showdown(self):
+        """Test checking every street deals the board and ends the hand."""
+        state, holes = table(100, 100)
+        apply(state, CALL)
+        apply(state, CHECK)
+        for street in (Street.FLOP, Street.TURN, Street.RIVER):
+            assert state.street == street
+            apply(state, CHECK)
+            apply(state, CHECK)
+        assert state.street == Street.SHOWDOWN
+        assert state.to_act is None
+        assert len(state.board) == 5
+        payouts = settle(state, holes)
+        assert sum(payouts) == 4
+        assert sum(p.stack for p in state.players) == 200
+
+    def test_postflop_order_skips_folded(self):
+        """Test the first live seat left of the button opens later streets."""
+        state, _ = table(100, 100, 100)
+        apply(state, CALL)
+        apply(state, FOLD)
+        apply(state, CHECK)
+        assert state.street == Street.FLOP
+        assert state.to_act == 2
+        assert state.num_in_hand == 2
+
+    def test_all_in_runs_out_board(self):
+        """Test the board is dealt out once nobody can bet."""
+        state, holes = table(100, 100)
+        apply(state, raise_to(100))
+        apply(state, CALL)
+        assert state.to_act is None
+        assert state.street == Street.SHOWDOWN
+        assert len(state.board) == 5
+        settle(state, holes)
+        assert sum(p.stack for p in state.players) == 200
+
+    def test_uncalled_bet_returned(self):
+        """Test chips nobody could match go back to the bettor."""
+        state, _ = table(100, 40)
+        apply(state, raise_to(100))
+        apply(state, CALL)
+        assert state.pot == 80
+        assert state.players[0].stack == 60
+        assert [p.committed for p in state.players] == [40, 40]
+        assert state.num_can_act == 1
+
+    def test_three_way_all_in_side_pot(self):
+        """Test uneven all-ins are settled in a main and a side pot."""
+        state, holes = table(100, 40, 100)
+        apply(state, raise_to(100))
+        apply(state, CALL)
+        apply(state, CALL)
+        assert state.to_act is None
+        assert [p.committed for p in state.players] == [100, 40, 100]
+        payouts = settle(state, holes)
+        assert sum(payouts) == 240
+        # The short stack can win at most the 120-chip main pot
+        assert payouts[1] <= 120
+        assert [p.committed for p in state.players] == [0, 0, 0]
+
+    def test_short_stack_cannot_raise(self):
+        """Test a player facing a covering all-in can only call or fold."""
+        state, _ = table(100, 40)
+        apply(state, raise_to(100))
+        assert legal_actions(state).actions == (Action.FOLD, Action.CALL)
+        assert legal_actions(state).to_call == 38
+
+
+class TestActions:
+    """Test chip movement and validation of single actions."""
+
+    def test_fold_ends_hand(self):
+        """Test the last player in the hand wins the pot uncontested."""
+        state, holes = table(100, 100)
+        apply(state, FOLD)
+        assert state.to_act is None
+        assert state.is_hand_complete()
+        assert settle(state, holes) == (0, 3)
+        assert [p.stack for p in state.players] == [99, 101]
+
+    def test_min_raise_tracks_increment(self):
+        """Test a re-raise must add at least the previous raise."""
+        state, _ = table(100, 100)
+        apply(state, raise_to(10))
+        assert legal_actions(state).min_amount == 18
+        with pytest.raises(ValueError, match="Minimum raise is to 18"):
+            apply(state, raise_to(12))
+
+    def test_short_all_in_allowed(self):
+        """Test going all-in below the minimum raise is legal."""
+        state, _ = table(100, 100, 12)
+        apply(state, raise_to(10))
+        apply(state, FOLD)
+        assert legal_actions(state).min_amount == 12
+        apply(state, raise_to(12))
+        assert state.players[2].stack == 0
+        assert state.to_act == 0
+
+    def test_short_all_in_does_not_reopen(self):
+        """Test a player who already acted may only call or fold a short all-in."""
+        # Seat 3 opens to 10, the button calls, the big blind shoves for 12
+        state, _ = table(100, 100, 12, 100)
+        apply(state, raise_to(10))
+        apply(state, CALL)
+        apply(state, FOLD)
+        apply(state, raise_to(12))
+        legal = legal_actions(state)
+        assert legal.actions == (Action.FOLD, Action.CALL)
+        assert legal.to_call == 2
+        with pytest.raises(ValueError, match="does not reopen the betting"):
+            apply(state, raise_to(30))
+        apply(state, CALL)
+        assert legal_actions(state).actions == (Action.FOLD, Action.CALL)
+        apply(state, CALL)
+        assert state.street is Street.FLOP
+
+    def test_short_all_ins_add_up(self):
+        """Test short all-ins that together make a full raise reopen the betting."""
+        # Seat 3 opens to 10 (a raise of 8), then two short all-ins add 10
+        state, _ = table(14, 20, 100, 100)
+        apply(state, raise_to(10))
+        apply(state, raise_to(14))
+        apply(state, raise_to(20))
+        # The big blind has not acted yet and may raise in any case
+        assert Action.RAISE in legal_actions(state).actions
+        apply(state, CALL)
+        legal = legal_actions(state)
+        assert legal.actions == (Action.FOLD, Action.CALL, Action.RAISE)
+        assert legal.min_amount == 28
+
+    def test_single_short_all_in_keeps_unacted_raise(self):
+        """Test players yet to act keep their raise after a short all-in."""
+        state, _ = table(14, 100, 100, 100)
+        apply(state, raise_to(10))
+        apply(state, raise_to(14))
+        assert Action.RAISE in legal_actions(state).actions
+        apply(state, FOLD)
+        apply(state, CALL)
+        assert legal_actions(state).actions == (Action.FOLD, Action.CALL)
+
+    @pytest.mark.parametrize(
+        "action, match",
+        [
+            (CHECK, "Cannot check facing a bet of 1"),
+            (bet(10), "Cannot bet here, raise instead"),
+            (raise_to(3), "Minimum raise is to 4"),
+            (raise_to(101), "all-in is 100"),
+        ],
+    )
+    def test_illegal_preflop(self, action, match):
+        """Test illegal actions are rejected without changing the state."""
+        state, _ = table(100, 100)
+        with pytest.raises(ValueError, match=match):
+            apply(state, action)
+        assert state.pot == 3
+        assert state.to_act == 0
+
+    def test_no_free_fold_or_empty_call(self):
+        """Test folding or calling when checking is free is rejected."""
+        state, _ = table(100, 100)
+        apply(state, CALL)
+        with pytest.raises(ValueError, match="checking is free"):
+            apply(state, FOLD)
+        with pytest.raises(ValueError, match="Nothing to call"):
+            apply(state, CALL)
+
+    def test_hand_over(self):
+        """Test finished hands accept no actions and unfinished cannot settle."""
+        state, holes = table(100, 100)
+        with pytest.raises(ValueError, match="still in progress"):
+            settle(state, holes)
+        apply(state, FOLD)
+        with pytest.raises(ValueError, match="hand is over"):
+            legal_actions(state)
+        with pytest.raises(ValueError, match="hand is over"):
+            apply(state, CHECK)
+
+
+class TestRandomHands:
+    """Test whole hands between random agents."""
+
+    @pytest.mark.parametrize("num_players", [2, 6, 9])
+    def test_zero_sum(self, num_players):
+        """Test chips are conserved over many hands."""
+        totals = simulate_random_hands(300, num_players, seed=3)
+        assert len(totals) == num_players
+        assert sum(totals) == 0
+
+    def test_reproducible(self):
+        """Test the same seed replays the same hands."""
+        assert simulate_random_hands(200, 3, seed=5) == simulate_random_hands(
+            200, 3, seed=5
+        )
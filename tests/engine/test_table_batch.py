@@ -0,0 +1,263 @@
+"""Tests for the struct-of-arrays multi-table simulator."""
+
+import numpy as np
+import pytest
+
+from texas_holdem_ml_bot.engine import simulator
+from texas_holdem_ml_bot.engine.cards import Card, PlayerAction
+from texas_holdem_ml_bot.engine.game_state import GameState, PlayerState
+from texas_holdem_ml_bot.engine.rules import Street
+from texas_holdem_ml_bot.engine.showdown import resolve_showdown
+from texas_holdem_ml_bot.engine.table_batch import (
+    ACTIONS,
+    BET,
+    CALL,
+    CHECK,
+    FOLD,
+    RAISE,
+    TableBatch,
+    simulate_random_batch,
+)
+
+
+def snapshot(state):
+    """Comparable summary of a GameState."""
+    return (
+        [(p.stack, p.bet, p.committed, p.in_hand, p.acted) for p in state.players],
+        state.pot,
+        state.board,
+        state.street,
+        state.to_act,
+        state.current_bet,
+        state.min_raise,
+        state.num_raises,
+        state.pending,
+        state.num_in_hand,
+        state.num_can_act,
+    )
+
+
+def player_action(code, amount):
+    """PlayerAction for a batch action code."""
+    sized = code in (BET, RAISE)
+    return PlayerAction(ACTIONS[code], int(amount) if sized else 0)
+
+
+def cards(text):
+    """Parse space-separated cards."""
+    return [Card.parse(token) for token in text.split()]
+
+
+class TestDealing:
+    """Test new hands, blinds and the deck layout."""
+
+    def test_blinds_and_first_actor(self):
+        """Test blinds match GameState.post_blinds for every button."""
+        batch = TableBatch(3, 3, seed=1)
+        batch.new_hands([0, 1, 2])
+        assert batch.bets.tolist() == [[0, 1, 2], [2, 0, 1], [1, 2, 0]]
+        assert batch.pots.tolist() == [3, 3, 3]
+        assert batch.to_act.tolist() == [0, 1, 2]
+
+    def test_decks_are_permutations(self):
+        """Test every table deals from a full, shuffled deck."""
+        batch = TableBatch(50, 6, seed=2)
+        batch.new_hands()
+        assert np.all(np.sort(batch.decks, axis=1) == np.arange(52))
+        assert batch.holes.shape == (50, 6, 2)
+        assert batch.boards.shape == (50, 5)
+        assert np.all(batch.board_sizes == 0)
+
+    def test_invalid_setup(self):
+        """Test bad sizes, buttons and empty stacks are rejected."""
+        with pytest.raises(ValueError, match="supports 2-10 players"):
+            TableBatch(4, 11)
+        with pytest.raises(ValueError, match="num_tables must be positive"):
+            TableBatch(0, 2)
+        batch = TableBatch(2, 2, seed=0)
+        with pytest.raises(ValueError, match="Button seats"):
+            batch.new_hands([0, 2])
+        batch.stacks[1, 0] = 0
+        with pytest.raises(ValueError, match="Table 1 has a seat with no chips"):
+            batch.new_hands()
+
+
+class TestStep:
+    """Test vectorized actions."""
+
+    def test_mixed_actions(self):
+        """Test different actions at different tables in one step."""
+        batch = TableBatch(3, 2, seed=3)
+        batch.new_hands()
+        batch.step([FOLD, CALL, RAISE], [0, 0, 10])
+        assert batch.done.tolist() == [True, False, False]
+        assert batch.to_act.tolist() == [-1, 1, 1]
+        assert batch.pots.tolist() == [3, 4, 12]
+        assert batch.min_raise.tolist() == [2, 2, 8]
+        batch.step([CHECK, CHECK, CALL], [0, 0, 0])
+        assert batch.streets.tolist() == [0, 1, 1]
+        assert batch.board_sizes.tolist() == [0, 3, 3]
+
+    def test_illegal_action_changes_nothing(self):
+        """Test one illegal action rejects the whole step."""
+        batch = TableBatch(2, 2, seed=4)
+        batch.new_hands()
+        before = batch.stacks.copy()
+        with pytest.raises(ValueError, match="Illegal check .* at table 1"):
+            batch.step([CALL, CHECK], [0, 0])
+        with pytest.raises(ValueError, match="Illegal raise .* at table 0"):
+            batch.step([RAISE, CALL], [3, 0])
+        assert np.array_equal(batch.stacks, before)
+
+    def test_finished_tables_ignored(self):
+        """Test entries for tables whose hand is over are skipped."""
+        batch = TableBatch(2, 2, seed=5)
+        batch.new_hands()
+        batch.step([FOLD, CALL], [0, 0])
+        batch.step([RAISE, CHECK], [999, 0])
+        assert batch.streets.tolist() == [0, 1]
+
+    def test_legal_actions(self):
+        """Test the legal mask and raise bounds."""
+        batch = TableBatch(2, 2, seed=6)
+        batch.stacks[1] = [100, 30]
+        batch.new_hands()
+        legal = batch.legal_actions()
+        assert legal.mask[0].tolist() == [True, False, True, False, True]
+        assert legal.to_call.tolist() == [1, 1]
+        assert legal.min_amount.tolist() == [4, 4]
+        assert legal.max_amount.tolist() == [200, 100]
+
+    def test_short_all_in_does_not_reopen(self):
+        """Test a seat that already acted cannot re-raise a short all-in."""
+        batch = TableBatch(1, 4, seed=7)
+        batch.stacks[0] = [100, 100, 12, 100]
+        batch.new_hands()
+        for action, amount in ((RAISE, 10), (CALL, 0), (FOLD, 0), (RAISE, 12)):
+            batch.step([action], [amount])
+        legal = batch.legal_actions()
+        assert legal.mask[0].tolist() == [True, False, True, False, False]
+        with pytest.raises(ValueError, match="Illegal raise"):
+            batch.step([RAISE], [30])
+
+
+class TestMatchesSimulator:
+    """Test the batch plays hands exactly like the scalar simulator."""
+
+    @pytest.mark.parametrize("num_players", [2, 3, 6, 9])
+    def test_lockstep(self, num_players):
+        """Test every step and settlement agrees with simulator.apply."""
+        num_tables = 60
+        batch = TableBatch(num_tables, num_players, seed=num_players)
+        # Uneven stacks so all-ins, runouts and uncalled bets all happen
+        batch.stacks[:] = np.random.default_rng(0).integers(
+            3, 120, (num_tables, num_players)
+        )
+        batch.new_hands(np.arange(num_tables) % num_players)
+        while not batch.done.all():
+            before = [batch.to_game_state(table) for table in range(num_tables)]
+            actions, amounts = batch.random_actions()
+            batch.step(actions, amounts)
+            for table, (state, _) in enumerate(before):
+                if state.to_act is None:
+                    continue
+                simulator.apply(state, player_action(actions[table], amounts[table]))
+                after, _ = batch.to_game_state(table)
+                assert snapshot(state) == snapshot(after)
+
+        finished = [batch.to_game_state(table) for table in range(num_tables)]
+        payouts = batch.settle()
+        for table, (state, holes) in enumerate(finished):
+            assert tuple(payouts[table]) == simulator.settle(state, holes)
+
+
+class TestSettle:
+    """Test batch showdowns."""
+
+    def test_split_pot_odd_chip(self):
+        """Test a chopped odd pot gives the extra chip left of the button."""
+        batch = TableBatch(1, 3, seed=7)
+        board = cards("As Ks Qs Js Ts")
+        state = GameState(
+            players=[PlayerState(50), PlayerState(50), PlayerState(50)],
+            button=0,
+            street=Street.SHOWDOWN,
+            board=board,
+            pot=7,
+        )
+        batch.set_table(0, state, [cards("2c 3c"), cards("2d 3d"), cards("2h 3h")])
+        assert batch.settle()[0].tolist() == [2, 3, 2]
+        assert batch.stacks[0].tolist() == [52, 53, 52]
+        assert batch.pots[0] == 0
+
+    def test_side_pots(self):
+        """Test an all-in for less only wins the main pot, as in showdown."""
+        batch = TableBatch(1, 3, seed=12)
+        state = GameState(
+            players=[
+                PlayerState(0, committed=10),
+                PlayerState(70, committed=30),
+                PlayerState(70, committed=30),
+            ],
+            button=0,
+            street=Street.SHOWDOWN,
+            board=cards("2c 7d 9h Js Kd"),
+            pot=70,
+        )
+        holes = [cards("Kh Kc"), cards("Ah Ad"), cards("3c 4d")]
+        expected = resolve_showdown(state, holes).payouts
+        batch.set_table(0, state, holes)
+        assert tuple(batch.settle()[0]) == expected == (30, 40, 0)
+        assert batch.committed[0].tolist() == [0, 0, 0]
+
+    def test_unfinished_tables_unpaid(self):
+        """Test tables still playing are left alone."""
+        batch = TableBatch(2, 2, seed=8)
+        batch.new_hands()
+        batch.step([FOLD, CALL], [0, 0])
+        assert batch.settle().tolist() == [[0, 3], [0, 0]]
+        assert batch.pots[1] == 4
+
+
+class TestConversion:
+    """Test round trips through GameState."""
+
+    def test_round_trip(self):
+        """Test set_table restores what to_game_state produced."""
+        batch = TableBatch(2, 3, seed=9)
+        batch.new_hands()
+        batch.step([CALL, RAISE], [0, 6])
+        state, holes = batch.to_game_state(1)
+        other = TableBatch(1, 3, seed=10)
+        other.set_table(0, state, holes)
+        copy, copy_holes = other.to_game_state(0)
+        assert snapshot(copy) == snapshot(state)
+        assert copy_holes == holes
+
+    def test_set_table_validation(self):
+        """Test mismatched seats and duplicate cards are rejected."""
+        batch = TableBatch(1, 2, seed=11)
+        state = GameState(players=[PlayerState(10), PlayerState(10)], button=0)
+        with pytest.raises(ValueError, match="Table has 2 seats"):
+            batch.set_table(0, state, [cards("As Ks")])
+        with pytest.raises(ValueError, match="distinct"):
+            batch.set_table(0, state, [cards("As Ks"), cards("As Qs")])
+        with pytest.raises(ValueError, match="out of range"):
+            batch.to_game_state(1)
+
+
+class TestRandomBatch:
+    """Test whole waves of random hands."""
+
+    @pytest.mark.parametrize("num_players", [2, 9])
+    def test_zero_sum(self, num_players):
+        """Test chips are conserved, including a partial last wave."""
+        totals = simulate_random_batch(500, num_players, num_tables=128, seed=1)
+        assert totals.shape == (num_players,)
+        assert totals.sum() == 0
+
+    def test_reproducible(self):
+        """Test the same seed replays the same hands."""
+        first = simulate_random_batch(300, 3, num_tables=64, seed=2)
+        second = simulate_random_batch(300, 3, num_tables=64, seed=2)
+        assert np.array_equal(first, second)
@@ -0,0 +1,132 @@
+"""Tests for make/unmake on GameState."""
+
+from random import Random
+
+import pytest
+
+from texas_holdem_ml_bot.engine.cards import Action, Deck, PlayerAction
+from texas_holdem_ml_bot.engine.game_state import GameState, PlayerState
+from texas_holdem_ml_bot.engine.simulator import (
+    legal_actions,
+    random_action,
+    start_hand,
+)
+from texas_holdem_ml_bot.engine.undo import UndoLog
+
+CALL = PlayerAction(Action.CALL)
+CHECK = PlayerAction(Action.CHECK)
+
+
+def snapshot(state):
+    """Comparable summary of a GameState and its deck."""
+    return (
+        [(p.stack, p.bet, p.committed, p.in_hand, p.acted) for p in state.players],
+        state.pot,
+        list(state.board),
+        state.street,
+        state.to_act,
+        state.current_bet,
+        state.min_raise,
+        state.num_raises,
+        state.pending,
+        state.num_in_hand,
+        state.num_can_act,
+        len(state.deck),
+    )
+
+
+def new_log(*stacks, seed=1):
+    """Start a hand and wrap it in an undo log."""
+    state = GameState(players=[PlayerState(stack) for stack in stacks], button=0)
+    start_hand(state, Deck(seed=seed))
+    return UndoLog(state)
+
+
+class TestMakeUnmake:
+    """Test single actions are reverted exactly."""
+
+    def test_action_within_round(self):
+        """Test a raise is undone without touching other seats."""
+        log = new_log(100, 100, 100)
+        before = snapshot(log.state)
+        log.make(PlayerAction(Action.RAISE, 6))
+        assert log.state.pot == 9
+        log.unmake()
+        assert snapshot(log.state) == before
+        assert len(log) == 0
+
+    def test_round_close_returns_board(self):
+        """Test undoing the action that dealt the flop takes it back."""
+        log = new_log(100, 100)
+        log.make(CALL)
+        before = snapshot(log.state)
+        log.make(CHECK)
+        assert len(log.state.board) == 3
+        log.unmake()
+        assert snapshot(log.state) == before
+        assert log.state.board == []
+
+    def test_all_in_runout_and_uncalled_bet(self):
+        """Test a call that runs the board out and refunds chips is undone."""
+        log = new_log(100, 40)
+        log.make(PlayerAction(Action.RAISE, 100))
+        before = snapshot(log.state)
+        log.make(CALL)
+        assert log.state.to_act is None
+        assert len(log.state.board) == 5
+        assert log.state.players[0].stack == 60
+        log.unmake()
+        assert snapshot(log.state) == before
+
+    def test_illegal_action_not_recorded(self):
+        """Test a rejected action leaves the log and state unchanged."""
+        log = new_log(100, 100)
+        before = snapshot(log.state)
+        with pytest.raises(ValueError, match="Cannot check"):
+            log.make(CHECK)
+        assert len(log) == 0
+        assert snapshot(log.state) == before
+
+    def test_empty_log(self):
+        """Test unmaking with nothing recorded is an error."""
+        log = new_log(100, 100)
+        with pytest.raises(ValueError, match="Nothing to undo"):
+            log.unmake()
+
+
+class TestBranching:
+    """Test marks and rewinds over many random branches."""
+
+    @pytest.mark.parametrize("num_players", [2, 4, 9])
+    def test_random_search_restores_root(self, num_players):
+        """Test every branch rewinds to the exact position it started from."""
+        rng = Random(num_players)
+        stacks = [rng.randrange(5, 150) for _ in range(num_players)]
+        log = new_log(*stacks, seed=num_players)
+        root = snapshot(log.state)
+        root_mark = log.mark()
+
+        def search(depth):
+            state = log.state
+            if depth == 0 or state.to_act is None:
+                return
+            here = snapshot(state)
+            mark = log.mark()
+            for _ in range(3):
+                log.make(random_action(legal_actions(state), rng))
+                search(depth - 1)
+                log.rewind(mark)
+                assert snapshot(state) == here
+
+        search(6)
+        assert log.mark() == root_mark
+        assert snapshot(log.state) == root
+
+    def test_rewind_validation(self):
+        """Test marks outside the log are rejected."""
+        log = new_log(100, 100)
+        log.make(CALL)
+        with pytest.raises(ValueError, match="not in the log"):
+            log.rewind(2)
+        log.rewind(0)
+        assert len(log) == 0
@@ -0,0 +1,234 @@
+"""Tests for Zobrist hashing of game states."""
+
+from random import Random
+
+import pytest
+
+from texas_holdem_ml_bot.engine.cards import Action, Card, Deck, PlayerAction
+from texas_holdem_ml_bot.engine.game_state import GameState, PlayerState
+from texas_holdem_ml_bot.engine.rules import Street
+from texas_holdem_ml_bot.engine.simulator import (
+    legal_actions,
+    random_action,
+    start_hand,
+)
+from texas_holdem_ml_bot.engine.zobrist import (
+    ChipBuckets,
+    HashedLog,
+    ZobristKeys,
+    default_keys,
+)
+from texas_holdem_ml_bot.utils.cache import TranspositionTable
+
+
+def cards(text):
+    """Parse space-separated cards."""
+    return [Card.parse(token) for token in text.split()]
+
+
+def new_log(*stacks, seed=1, keys=None):
+    """Start a hand and wrap it in a hashed log."""
+    state = GameState(players=[PlayerState(stack) for stack in stacks], button=0)
+    start_hand(state, Deck(seed=seed))
+    return HashedLog(state, keys)
+
+
+class TestChipBuckets:
+    """Test chip abstraction."""
+
+    def test_geometric(self):
+        """Test small amounts are exact and large ones share buckets."""
+        buckets = ChipBuckets.geometric()
+        assert [buckets.bucket(chips) for chips in range(5)] == [0, 1, 2, 3, 4]
+        assert buckets.bucket(1000) == buckets.bucket(1001)
+        assert buckets.bucket(10**9) == buckets.num_buckets - 1
+
+    def test_exact(self):
+        """Test exact buckets separate every amount up to the limit."""
+        buckets = ChipBuckets.exact(50)
+        assert len({buckets.bucket(chips) for chips in range(51)}) == 51
+
+    @pytest.mark.parametrize(
+        "make, match",
+        [
+            (lambda: ChipBuckets(()), "at least one"),
+            (lambda: ChipBuckets((1, 1)), "strictly increasing"),
+            (lambda: ChipBuckets.geometric(ratio=1.0), "ratio must be above 1"),
+        ],
+    )
+    def test_invalid(self, make, match):
+        """Test malformed bucket edges are rejected."""
+        with pytest.raises(ValueError, match=match):
+            make()
+
+
+class TestHash:
+    """Test full hashing."""
+
+    def test_equal_states_equal_keys(self):
+        """Test independently built equal states hash equally."""
+        keys = default_keys()
+
+        def build(board):
+            return GameState(
+                players=[PlayerState(90, bet=10), PlayerState(80, bet=20)],
+                button=1,
+                street=Street.FLOP,
+                board=cards(board),
+                pot=30,
+                to_act=0,
+            )
+
+        assert keys.hash(build("As Kd 2c")) == keys.hash(build("2c As Kd"))
+        assert keys.hash(build("As Kd 2c")) != keys.hash(build("As Kd 3c"))
+
+    def test_features_change_key(self):
+        """Test to-act, folds and chips all enter the key."""
+        keys = ZobristKeys(ChipBuckets.exact(200))
+        state = GameState(players=[PlayerState(100), PlayerState(100)], button=0)
+        base = keys.hash(state)
+        state.to_act = 1
+        assert keys.hash(state) != base
+        state.to_act = None
+        state.players[0].in_hand = False
+        assert keys.hash(state) != base
+        state.players[0].in_hand = True
+        state.players[1].stack = 99
+        assert keys.hash(state) != base
+        state.players[1].stack = 100
+        assert keys.hash(state) == base
+
+    def test_buckets_merge_nearby_stacks(self):
+        """Test stacks in one bucket give one key."""
+        keys = ZobristKeys(ChipBuckets((10, 100)))
+        first = GameState(players=[PlayerState(20), PlayerState(30)], button=0)
+        second = GameState(players=[PlayerState(25), PlayerState(99)], button=0)
+        assert keys.hash(first) == keys.hash(second)
+
+    def test_keys_stable(self):
+        """Test keys depend only on the seed."""
+        state = GameState(players=[PlayerState(100), PlayerState(100)], button=0)
+        assert ZobristKeys().hash(state) == ZobristKeys().hash(state)
+        assert ZobristKeys(seed=1).hash(state) != ZobristKeys().hash(state)
+
+    def test_table_too_large(self):
+        """Test tables beyond the key tables are rejected."""
+        keys = ZobristKeys(max_players=2)
+        state = GameState(players=[PlayerState(10)] * 3, button=0)
+        with pytest.raises(ValueError, match="Keys cover 2 players"):
+            keys.hash(state)
+
+
+class TestIncremental:
+    """Test keys maintained through make/unmake."""
+
+    @pytest.mark.parametrize("num_players", [2, 3, 9])
+    def test_matches_full_hash(self, num_players):
+        """Test the incremental key equals a fresh hash at every node."""
+        rng = Random(num_players)
+        keys = ZobristKeys(ChipBuckets.exact(400))
+        stacks = [rng.randrange(5, 200) for _ in range(num_players)]
+        log = new_log(*stacks, seed=num_players, keys=keys)
+        root = log.key
+
+        def search(depth):
+            state = log.state
+            assert log.key == keys.hash(state)
+            if depth == 0 or state.to_act is None:
+                return
+            mark = log.mark()
+            here = log.key
+            for _ in range(3):
+                log.make(random_action(legal_actions(state), rng))
+                search(depth - 1)
+                log.rewind(mark)
+                assert log.key == here
+
+        search(6)
+        assert log.key == root
+
+    def test_round_close_deals_board_into_key(self):
+        """Test the flop cards enter the key when the preflop round closes."""
+        log = new_log(100, 100)
+        log.make(PlayerAction(Action.CALL))
+        log.make(PlayerAction(Action.CHECK))
+        assert len(log.state.board) == 3
+        assert log.key == default_keys().hash(log.state)
+
+    def test_illegal_action_keeps_key(self):
+        """Test a rejected action changes neither key nor history."""
+        log = new_log(100, 100)
+        key = log.key
+        with pytest.raises(ValueError):
+            log.make(PlayerAction(Action.CHECK))
+        assert log.key == key
+        assert len(log) == 0
+
+
+class TestTranspositionTable:
+    """Test the fixed-size table keyed by position hashes."""
+
+    def test_store_and_probe(self):
+        """Test values come back for their key and depth."""
+        table = TranspositionTable(16)
+        table.put(12345, "value", depth=3)
+        assert table.get(12345) == "value"
+        assert table.get(12345, min_depth=4) is None
+        assert table.get(999, "missing") == "missing"
+        assert 12345 in table
+        stats = table.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+
+    def test_replacement_prefers_depth(self):
+        """Test a full bucket evicts its shallowest entry."""
+        table = TranspositionTable(4)
+        # Keys 0, 4 and 8 all map to bucket 0
+        table.put(0, "deep", depth=5)
+        table.put(4, "shallow", depth=1)
+        table.put(8, "new", depth=2)
+        assert table.get(0) == "deep"
+        assert table.get(4) is None
+        assert table.get(8) == "new"
+        assert table.stats().evictions == 1
+        assert len(table) == 2
+
+    def test_replacement_prefers_stale(self):
+        """Test entries from an older generation go first."""
+        table = TranspositionTable(4)
+        table.put(0, "old deep", depth=9)
+        table.new_generation()
+        table.put(4, "current", depth=1)
+        table.put(8, "newer", depth=1)
+        assert table.get(0) is None
+        assert table.get(4) == "current"
+
+    def test_same_key_overwrites(self):
+        """Test storing a key again replaces its entry in place."""
+        table = TranspositionTable(4)
+        table.put(6, "first", depth=1)
+        table.put(6, "second", depth=0)
+        assert table.get(6) == "second"
+        assert len(table) == 1
+
+    def test_caches_search_results(self):
+        """Test repeated positions reached in self-play hit the table."""
+        table = TranspositionTable(1 << 10)
+        for _ in range(2):
+            log = new_log(100, 100, seed=7)
+            for _ in range(3):
+                if log.key in table:
+                    assert table.get(log.key) == len(log)
+                else:
+                    table.put(log.key, len(log))
+                log.make(PlayerAction(Action.CALL if len(log) == 0 else Action.CHECK))
+        assert table.stats().hits == 3
+
+    def test_clear_and_validation(self):
+        """Test clear empties the table and capacity must be a power of two."""
+        table = TranspositionTable(8)
+        table.put(1, "x")
+        table.clear()
+        assert len(table) == 0
+        assert 1 not in table
+        with pytest.raises(ValueError, match="power of two"):
+            TranspositionTable(12)
@@ -0,0 +1 @@
+"""Eval tests package."""
@@ -0,0 +1,332 @@
+"""Tests for Monte Carlo and exact equity."""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from texas_holdem_ml_bot.engine.cards import Card
+from texas_holdem_ml_bot.engine.evaluator import evaluate_rank_indices
+from texas_holdem_ml_bot.eval.equity import (
+    COMBO_INDEX,
+    COMBOS,
+    NUM_COMBOS,
+    EquitySpot,
+    cached_equity,
+    calculate_equity,
+    combo_conflicts,
+    count_runouts,
+    exact_equity,
+    monte_carlo_equity,
+    score_showdowns,
+    spot_key,
+)
+
+
+def cards(text):
+    """Parse space-separated cards into indices."""
+    return [Card.parse(token).index for token in text.split()]
+
+
+def combo(text):
+    """Parse a two-card combo."""
+    first, second = cards(text)
+    return (first, second)
+
+
+class TestMonteCarloEquity:
+    """Test equity estimates and stopping rules."""
+
+    def test_aces_vs_kings(self):
+        """Test a classic preflop matchup lands near its exact equity."""
+        result = monte_carlo_equity(
+            cards("As Ah"), opponents=[[combo("Ks Kh")]], tolerance=0.003, seed=1
+        )
+        # Exact equity of AsAh vs KsKh is 82.6%
+        assert abs(result.equity - 0.826) < 4 * result.std_error
+        assert result.std_error <= 0.003
+        assert result.win <= result.equity <= result.win + result.tie
+
+    def test_aces_vs_random_hand(self):
+        """Test equity against an unknown hand."""
+        result = monte_carlo_equity(cards("Ac Ad"), opponents=1, seed=2)
+        assert abs(result.equity - 0.852) < 4 * result.std_error
+
+    def test_stops_early_when_precise(self):
+        """Test sampling stops well before the cap once the tolerance is met."""
+        result = monte_carlo_equity(
+            cards("7c 2d"), opponents=1, tolerance=0.01, max_samples=100_000, seed=3
+        )
+        assert result.samples < 10_000
+        assert result.std_error <= 0.01
+
+    def test_decided_river_needs_minimum_samples_only(self):
+        """Test a locked result stops after the first batch with zero error."""
+        board = cards("Ks Qs Js Ts 2c")
+        result = monte_carlo_equity(
+            cards("As 3d"), board, opponents=2, min_samples=500, batch_size=500
+        )
+        assert result.equity == 1.0
+        assert result.std_error == 0.0
+        assert result.samples == 500
+
+    def test_board_plays_splits_pot(self):
+        """Test ties are reported as ties and split the equity."""
+        board = cards("As Ks Qs Js Ts")
+        result = monte_carlo_equity(cards("2c 3c"), board, opponents=2, seed=4)
+        assert result.tie == 1.0
+        assert result.win == 0.0
+        assert result.equity == pytest.approx(1 / 3)
+        assert result.tie_share == pytest.approx(1 / 3)
+
+    def test_time_budget(self):
+        """Test a zero time budget stops after a single batch."""
+        result = monte_carlo_equity(
+            cards("As Ah"), opponents=3, tolerance=0, time_budget=0, batch_size=200
+        )
+        assert result.samples == 200
+
+    def test_max_samples(self):
+        """Test the sample cap holds when the tolerance cannot be met."""
+        result = monte_carlo_equity(
+            cards("As Ah"), tolerance=0, max_samples=3000, batch_size=1000, seed=5
+        )
+        assert result.samples == 3000
+
+    def test_seed_reproducible(self):
+        """Test the same seed gives the same estimate."""
+        first = monte_carlo_equity(cards("9h 8h"), cards("7h 2c Kd"), 2, seed=6)
+        second = monte_carlo_equity(cards("9h 8h"), cards("7h 2c Kd"), 2, seed=6)
+        assert (first.equity, first.samples) == (second.equity, second.samples)
+
+    def test_ranges_never_share_cards(self):
+        """Test overlapping ranges are dealt without card collisions."""
+        # Both ranges contain the king of spades; any collision would be
+        # rejected, so opponent 2 must hold QhQd whenever opponent 1 has KsKh
+        ranges = [[combo("Ks Kh")], [combo("Ks Qs"), combo("Qh Qd")]]
+        result = monte_carlo_equity(
+            cards("2c 2d"), opponents=ranges, tolerance=0, max_samples=2000, seed=7
+        )
+        assert 0.0 < result.equity < 0.5
+
+
+class TestEquitySpot:
+    """Test spot validation and range pruning."""
+
+    def test_dead_cards_prune_ranges(self):
+        """Test combos using known cards are dropped."""
+        spot = EquitySpot.build(
+            cards("As Ah"),
+            cards("Ks 7d 2c"),
+            opponents=[[combo("Ks Kh"), combo("Kc Kd"), combo("Kc Kh")]],
+            dead=cards("Kh"),
+        )
+        assert spot.ranges[0].tolist() == [list(combo("Kc Kd"))]
+
+    def test_empty_range_after_removal(self):
+        """Test a range left without combos is rejected."""
+        with pytest.raises(ValueError, match="no combos left"):
+            EquitySpot.build(cards("As Ah"), opponents=[[combo("As Kd")]])
+
+    @pytest.mark.parametrize(
+        "hero, board, opponents, message",
+        [
+            (cards("As"), [], 1, "exactly 2 hole cards"),
+            (cards("As Ah"), cards("As 2c 3c"), 1, "must be distinct"),
+            (cards("As Ah"), [], 0, "at least one opponent"),
+            (cards("As Ah"), [], 23, "Not enough cards"),
+            ([52, 0], [], 1, "Invalid card index"),
+        ],
+    )
+    def test_invalid_spots(self, hero, board, opponents, message):
+        """Test malformed spots raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            EquitySpot.build(hero, board, opponents)
+
+    def test_invalid_stopping_rule(self):
+        """Test inconsistent sample limits are rejected."""
+        with pytest.raises(ValueError, match="below min_samples"):
+            monte_carlo_equity(cards("As Ah"), max_samples=10, min_samples=100)
+
+
+class TestScoreShowdowns:
+    """Test pot shares from ranks."""
+
+    def test_wins_losses_and_splits(self):
+        """Test win, loss, two-way and three-way split shares."""
+        hero = np.array([10, 5, 7, 7])
+        opponents = np.array([[9, 6, 7, 7], [1, 1, 3, 7]])
+        shares = score_showdowns(hero, opponents)
+        assert shares.tolist() == pytest.approx([1.0, 0.0, 0.5, 1 / 3])
+
+
+def brute_force_equity(hero, board, opponent_range):
+    """Enumerate heads-up deals one by one with the scalar evaluator."""
+    used = set(hero) | set(board)
+    total = deals = 0
+    for completion in combinations(
+        [c for c in range(52) if c not in used], 5 - len(board)
+    ):
+        full = [*board, *completion]
+        mine = evaluate_rank_indices([*hero, *full])
+        for hand in opponent_range:
+            if set(hand) & (used | set(completion)):
+                continue
+            theirs = evaluate_rank_indices([*hand, *full])
+            total += 1.0 if mine > theirs else 0.5 if mine == theirs else 0.0
+            deals += 1
+    return total / deals, deals
+
+
+class TestExactEquity:
+    """Test exhaustive enumeration and automatic method selection."""
+
+    def test_matches_brute_force_on_turn(self):
+        """Test enumeration against a range agrees with a scalar loop."""
+        hero, board = cards("Jh Th"), cards("9h 8c 2h Kd")
+        opponent = [combo("Ah Kh"), combo("9s 9d"), combo("Qc Js"), combo("8h 2h")]
+        result = exact_equity(hero, board, [opponent])
+        expected, deals = brute_force_equity(hero, board, opponent)
+
+        # 8h2h is blocked by the board, so 3 combos x 44 rivers remain
+        assert result.samples == deals == 3 * 44
+        assert result.equity == pytest.approx(expected)
+        assert result.exact and result.std_error == 0.0
+
+    def test_matches_brute_force_against_random_hand(self):
+        """Test enumeration against a random hand on the river."""
+        hero, board = cards("Qd Qc"), cards("Qs 7h 7d 3c 2s")
+        everyone = [tuple(pair) for pair in COMBOS.tolist()]
+        result = exact_equity(hero, board, 1)
+        expected, deals = brute_force_equity(hero, board, everyone)
+        assert result.samples == deals == 990
+        assert result.equity == pytest.approx(expected)
+
+    def test_multiway_ranges_never_share_cards(self):
+        """Test joint holdings skip combos that overlap between opponents."""
+        ranges = [[combo("Ks Kh"), combo("Kc Kd")], [combo("Ks Qs"), combo("Qh Qd")]]
+        result = exact_equity(cards("2c 2d"), cards("7h 8s 9d Tc 3h"), ranges)
+        # Valid pairs: KsKh+QhQd, KcKd+KsQs, KcKd+QhQd
+        assert result.samples == 3
+
+    def test_agrees_with_sampling(self):
+        """Test the exact answer lies within the sampling error."""
+        hero, board = cards("As Kd"), cards("Ah 7c 7s 2d 9h")
+        exact = exact_equity(hero, board, 2)
+        sampled = monte_carlo_equity(hero, board, 2, tolerance=0.004, seed=8)
+        assert abs(exact.equity - sampled.equity) < 4 * sampled.std_error
+
+    def test_duplicate_combos_weigh_like_sampling(self):
+        """Test a combo listed several times counts by multiplicity in both methods."""
+        hero, board = cards("Ah Kh"), cards("Qh 7d 2c 9s")
+        opponent = [combo("As Ad")] * 5 + [combo("3s 4d")]
+        exact = exact_equity(hero, board, [opponent])
+        sampled = monte_carlo_equity(hero, board, [opponent], tolerance=0.004, seed=3)
+        assert exact.samples == 2 * 44
+        assert abs(exact.equity - sampled.equity) < 4 * sampled.std_error
+
+        # Both sides of the threshold give the same answer
+        enumerated = calculate_equity(hero, board, [opponent])
+        forced = calculate_equity(
+            hero, board, [opponent], exact_threshold=0, tolerance=0.004, seed=3
+        )
+        assert enumerated.exact and enumerated.equity == exact.equity
+        assert not forced.exact and forced.equity == sampled.equity
+
+    def test_count_runouts(self):
+        """Test deal counts for random opponents and ranges."""
+        turn = EquitySpot.build(cards("As Ah"), cards("Ks 7d 2c Jh"), 1)
+        assert count_runouts(turn) == 46 * 990
+        ranged = EquitySpot.build(cards("As Ah"), cards("Ks 7d 2c"), [[combo("Qc Qd")]])
+        assert count_runouts(ranged) == 1081
+
+    def test_too_many_runouts(self):
+        """Test preflop multiway spots are refused."""
+        with pytest.raises(ValueError, match="exact enumeration is limited"):
+            exact_equity(cards("As Ah"), opponents=2)
+
+    def test_calculate_equity_selects_method(self):
+        """Test small spots enumerate and large ones sample."""
+        turn = calculate_equity(cards("As Ah"), cards("Ks 7d 2c Jh"), seed=1)
+        preflop = calculate_equity(cards("As Ah"), seed=1, tolerance=0.01)
+        forced = calculate_equity(
+            cards("As Ah"), cards("Ks 7d 2c Jh"), exact_threshold=0, seed=1
+        )
+        assert turn.exact
+        assert not preflop.exact and preflop.std_error <= 0.01
+        assert not forced.exact
+
+    def test_combo_tables(self):
+        """Test combo ids and the conflict matrix are consistent."""
+        assert len(COMBOS) == NUM_COMBOS
+        first, second = combo("As Kd")
+        index = COMBO_INDEX[first, second]
+        assert COMBO_INDEX[second, first] == index
+        assert sorted(COMBOS[index]) == sorted([first, second])
+
+        conflicts = combo_conflicts()
+        assert conflicts[index, index]
+        assert conflicts[index, COMBO_INDEX[first, combo("2c 3c")[0]]]
+        assert not conflicts[index, COMBO_INDEX[combo("2c 3c")]]
+        # Each combo shares a card with itself and 2 * 50 others
+        assert (conflicts.sum(axis=1) == 101).all()
+
+
+class TestCachedEquity:
+    """Test memoization across suit-isomorphic spots."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start every test with an empty cache."""
+        cached_equity.cache.clear()
+
+    def test_exact_hits_across_suits(self):
+        """Test a suit-permuted turn spot is answered from the cache."""
+        first = cached_equity(cards("As Ks"), cards("Qs Js 2d 3c"), dead=cards("4s"))
+        # Spades and hearts swapped everywhere
+        second = cached_equity(cards("Ah Kh"), cards("Qh Jh 2d 3c"), dead=cards("4h"))
+        assert first.exact
+        assert second is first
+        stats = cached_equity.cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        direct = exact_equity(cards("Ah Kh"), cards("Qh Jh 2d 3c"), dead=cards("4h"))
+        assert second.equity == pytest.approx(direct.equity)
+
+    def test_dead_cards_and_ranges_are_keyed(self):
+        """Test spots differing beyond a suit permutation get their own entries."""
+        hero, board = cards("As Ks"), cards("Qs Js 2d 3c")
+        cached_equity(hero, board, dead=cards("4s"))
+        cached_equity(hero, board, dead=cards("4h"))
+        cached_equity(hero, board, [[combo("Ah Ad"), combo("Kh Kd")]])
+        cached_equity(hero, board, [[combo("Kd Kh"), combo("Ad Ah")]])
+        stats = cached_equity.cache.stats()
+        assert (stats.hits, stats.misses) == (1, 3)
+
+    def test_range_order_and_suits(self):
+        """Test permuted ranges share a key regardless of combo order."""
+        spot = EquitySpot.build(
+            cards("As Ks"), cards("Qs Js 2d"), [[combo("Ac Ad"), combo("Th 9h")]]
+        )
+        permuted = EquitySpot.build(
+            cards("Ah Kh"), cards("Qh Jh 2d"), [[combo("9s Ts"), combo("Ad Ac")]]
+        )
+        assert spot_key(spot) == spot_key(permuted)
+
+    def test_only_reproducible_sampling_is_cached(self):
+        """Test seeded Monte Carlo is cached and unseeded runs are not."""
+        options = {"tolerance": 0.02, "exact_threshold": 0}
+        seeded = cached_equity(cards("As Ah"), seed=1, **options)
+        assert cached_equity(cards("Ad Ac"), seed=1, **options) is seeded
+        assert cached_equity(cards("As Ah"), seed=2, **options) is not seeded
+        cached_equity(cards("As Ah"), **options)
+        cached_equity(cards("As Ah"), seed=1, time_budget=1.0, **options)
+        assert len(cached_equity.cache) == 2
+
+    def test_invalidate(self):
+        """Test an invalidated spot is computed again."""
+        hero, board = cards("As Ks"), cards("Qs Js 2d 3c")
+        cached_equity(hero, board)
+        key = (spot_key(EquitySpot.build(hero, board)), None)
+        assert cached_equity.cache.invalidate(key)
+        cached_equity(hero, board)
+        assert cached_equity.cache.stats().misses == 2
@@ -0,0 +1,75 @@
+"""Tests for multi-process equity."""
+
+import pytest
+
+from texas_holdem_ml_bot.engine.cards import Card
+from texas_holdem_ml_bot.eval.equity import monte_carlo_equity
+from texas_holdem_ml_bot.eval.parallel import parallel_equity, split_batches
+
+
+def cards(text):
+    """Parse space-separated cards into indices."""
+    return [Card.parse(token).index for token in text.split()]
+
+
+class TestParallelEquity:
+    """Test the process pool reproduces the single-process estimate."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"tolerance": 0.005},
+            {"tolerance": 0.0, "max_samples": 9000},
+        ],
+    )
+    def test_matches_single_process(self, options):
+        """Test the same seed gives the same result with two workers."""
+        hero, board = cards("Ah Kh"), cards("Qh 7c 2d")
+        spot = {"batch_size": 1000, "min_samples": 1000, "seed": 11, **options}
+        single = monte_carlo_equity(hero, board, 2, **spot)
+        parallel = parallel_equity(hero, board, 2, n_jobs=2, **spot)
+
+        assert parallel.equity == single.equity
+        assert parallel.samples == single.samples
+        assert parallel.std_error == single.std_error
+        assert (parallel.win, parallel.tie) == (single.win, single.tie)
+
+    def test_default_arguments_match_single_process(self):
+        """Test both functions share their default batching and stopping rule."""
+        hero, board = cards("Jc Tc"), cards("9c 8d 2s")
+        single = monte_carlo_equity(hero, board, 1, seed=5)
+        parallel = parallel_equity(hero, board, 1, n_jobs=2, seed=5)
+        assert (parallel.equity, parallel.samples, parallel.std_error) == (
+            single.equity,
+            single.samples,
+            single.std_error,
+        )
+
+    def test_worker_count_does_not_change_result(self):
+        """Test results depend on the seed, not on how work is split."""
+        hero = cards("9s 9d")
+        spot = {"tolerance": 0.0, "max_samples": 6000, "batch_size": 500, "seed": 3}
+        in_process = parallel_equity(hero, (), 3, n_jobs=1, **spot)
+        pooled = parallel_equity(hero, (), 3, n_jobs=2, batches_per_task=3, **spot)
+        assert (in_process.equity, in_process.samples) == (
+            pooled.equity,
+            pooled.samples,
+        )
+
+    def test_invalid_batches_per_task(self):
+        """Test the wave size must be positive."""
+        with pytest.raises(ValueError, match="batches_per_task must be positive"):
+            parallel_equity(cards("As Ah"), batches_per_task=0)
+
+
+class TestSplitBatches:
+    """Test dividing batch indices between workers."""
+
+    def test_contiguous_balanced_ranges(self):
+        """Test ranges cover every index once with sizes differing by one."""
+        ranges = split_batches(10, 7, 3)
+        assert ranges == [range(10, 13), range(13, 15), range(15, 17)]
+
+    def test_more_workers_than_batches(self):
+        """Test empty ranges are dropped."""
+        assert split_batches(0, 2, 4) == [range(0, 1), range(1, 2)]
@@ -0,0 +1,151 @@
+"""Tests for the precomputed preflop equity tables."""
+
+import numpy as np
+import pytest
+
+from texas_holdem_ml_bot.engine.canonical import NUM_PREFLOP_CLASSES, preflop_class
+from texas_holdem_ml_bot.engine.cards import Card
+from texas_holdem_ml_bot.eval import preflop
+from texas_holdem_ml_bot.eval.preflop import (
+    MAX_OPPONENTS,
+    approximate_multiway_equity,
+    load_preflop_tables,
+    preflop_equity,
+    preflop_equity_vs_random,
+    preflop_hand_equity,
+    use_preflop_tables,
+    write_preflop_tables,
+)
+
+
+def cards(text):
+    """Parse space-separated cards into indices."""
+    return [Card.parse(token).index for token in text.split()]
+
+
+def hand_class(text):
+    """Return the preflop class of a two-card hand."""
+    return preflop_class(*cards(text))
+
+
+@pytest.fixture(scope="module")
+def table_dir(tmp_path_factory):
+    """Write small tables once and install them for the module."""
+    directory = write_preflop_tables(
+        tmp_path_factory.mktemp("preflop"), num_boards=2048, multiway_samples=200
+    )
+    use_preflop_tables(load_preflop_tables(directory, generate=False))
+    yield directory
+    use_preflop_tables(None)
+
+
+class TestTables:
+    """Test the shape and invariants of the generated tables."""
+
+    def test_shapes_and_dtype(self, table_dir):
+        """Test both tables are float32 with the documented shapes."""
+        tables = load_preflop_tables(table_dir, generate=False)
+        shape = (NUM_PREFLOP_CLASSES, NUM_PREFLOP_CLASSES)
+        assert tables.heads_up.shape == shape
+        assert tables.vs_random.shape == (NUM_PREFLOP_CLASSES, MAX_OPPONENTS)
+        assert tables.heads_up.dtype == np.float32
+        assert tables.vs_random.dtype == np.float32
+
+    def test_memory_mapped(self, table_dir):
+        """Test loaded tables are read-only memory maps."""
+        tables = load_preflop_tables(table_dir, generate=False)
+        assert isinstance(tables.heads_up, np.memmap)
+        assert tables.directory == table_dir.resolve()
+        with pytest.raises(ValueError):
+            tables.heads_up[0, 0] = 1.0
+
+    def test_heads_up_is_zero_sum(self, table_dir):
+        """Test m + m.T == 1 and the diagonal is an even split."""
+        table = np.asarray(load_preflop_tables(table_dir, generate=False).heads_up)
+        np.testing.assert_allclose(table + table.T, 1.0, atol=1e-6)
+        np.testing.assert_allclose(np.diag(table), 0.5)
+
+    def test_missing_tables_raise(self, tmp_path):
+        """Test loading without generation fails on an empty directory."""
+        with pytest.raises(FileNotFoundError, match="Preflop tables not found"):
+            load_preflop_tables(tmp_path, generate=False)
+
+    def test_lazy_access_never_generates(self, tmp_path, monkeypatch):
+        """Test missing default tables raise and point at the generator."""
+        monkeypatch.setattr(preflop, "DEFAULT_TABLE_DIR", tmp_path / "missing")
+        monkeypatch.setattr(preflop, "_TABLES", None)
+        with pytest.raises(FileNotFoundError, match="eval.preflop --directory"):
+            preflop.get_preflop_tables()
+        assert not (tmp_path / "missing").exists()
+
+    def test_generation_is_reproducible(self):
+        """Test the same seed gives the same heads-up matrix."""
+        first = preflop.generate_heads_up(num_boards=16, seed=5)
+        second = preflop.generate_heads_up(num_boards=16, seed=5)
+        np.testing.assert_array_equal(first, second)
+
+
+class TestMatchups:
+    """Test the isomorphic matchup enumeration."""
+
+    def test_weights_cover_every_combo_pair(self):
+        """Test weights add up to all card-disjoint pairs of distinct classes."""
+        matchups = preflop._enumerate_matchups()
+        # 1326 * 1225 ordered disjoint pairs, minus same-class pairs, halved
+        same_class = sum(
+            n * (n - 1) - n * overlap
+            for n, overlap in [(6, 4)] * 13 + [(4, 0)] * 78 + [(12, 4)] * 78
+        )
+        assert matchups.weight.sum() == (1326 * 1225 - same_class) / 2
+        assert len(matchups.pairs) == NUM_PREFLOP_CLASSES * 168 // 2
+
+
+class TestLookups:
+    """Test the public lookup functions."""
+
+    def test_known_matchups(self, table_dir):
+        """Test well-known preflop matchups land near their true equity."""
+        assert preflop_equity(hand_class("As Ad"), hand_class("7c 2d")) > 0.8
+        assert preflop_equity(hand_class("As Ad"), hand_class("Kc Kd")) == (
+            pytest.approx(0.82, abs=0.04)
+        )
+        assert preflop_equity(hand_class("Qs Qd"), hand_class("As Kh")) == (
+            pytest.approx(0.57, abs=0.04)
+        )
+
+    def test_hand_equity_uses_classes(self, table_dir):
+        """Test concrete hands map onto their class entries."""
+        assert preflop_hand_equity(cards("Ah Ac"), cards("Ks Kd")) == preflop_equity(
+            hand_class("As Ad"), hand_class("Kc Kh")
+        )
+
+    def test_vs_random_drops_with_opponents(self, table_dir):
+        """Test aces lose equity as random opponents are added."""
+        aces = hand_class("As Ad")
+        equities = [preflop_equity_vs_random(aces, n) for n in (1, 4, 8)]
+        assert equities[0] > equities[1] > equities[2]
+        assert equities[0] == pytest.approx(0.85, abs=0.06)
+
+    def test_multiway_estimate(self, table_dir):
+        """Test the multiway estimate sums to 1 and orders the hands."""
+        classes = [hand_class("As Ad"), hand_class("Kc Kd"), hand_class("7c 2d")]
+        equity = approximate_multiway_equity(classes)
+        assert equity.sum() == pytest.approx(1.0)
+        assert equity[0] > equity[1] > equity[2]
+
+    @pytest.mark.parametrize("index", [-1, NUM_PREFLOP_CLASSES])
+    def test_invalid_class(self, table_dir, index):
+        """Test class indices outside 0..168 are rejected."""
+        with pytest.raises(ValueError, match="Invalid preflop class"):
+            preflop_equity(index, 0)
+
+    @pytest.mark.parametrize("count", [0, MAX_OPPONENTS + 1])
+    def test_invalid_opponent_count(self, table_dir, count):
+        """Test opponent counts outside 1..8 are rejected."""
+        with pytest.raises(ValueError, match="num_opponents must be 1-8"):
+            preflop_equity_vs_random(0, count)
+
+    def test_multiway_needs_two_players(self, table_dir):
+        """Test a single class is rejected."""
+        with pytest.raises(ValueError, match="Need at least 2 players"):
+            approximate_multiway_equity([0])
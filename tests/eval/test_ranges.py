@@ -0,0 +1,185 @@
+"""Tests for vectorized range equity."""
+
+import numpy as np
+import pytest
+
+from texas_holdem_ml_bot.engine.canonical import preflop_class
+from texas_holdem_ml_bot.engine.cards import Card
+from texas_holdem_ml_bot.eval.equity import (
+    COMBO_INDEX,
+    COMBOS,
+    NUM_COMBOS,
+    combo_conflicts,
+    exact_equity,
+)
+from texas_holdem_ml_bot.eval.ranges import (
+    CARD_COMBOS,
+    class_range,
+    full_range,
+    hand_vs_range_equity,
+    range_equity,
+    range_vector,
+    remove_cards,
+)
+
+
+def cards(text):
+    """Parse space-separated cards into indices."""
+    return [Card.parse(token).index for token in text.split()]
+
+
+def classes(*hands):
+    """Return the preflop classes of space-separated two-card hands."""
+    return [preflop_class(*cards(hand)) for hand in hands]
+
+
+def combos_of(weights):
+    """List the combos with non-zero weight."""
+    return [tuple(combo) for combo in COMBOS[np.flatnonzero(weights)]]
+
+
+class TestRangeVectors:
+    """Test building and masking weight vectors."""
+
+    def test_range_vector(self):
+        """Test combos land on their index in either card order."""
+        weights = range_vector([cards("As Kd"), cards("Kd As")], [0.25, 0.5])
+        index = COMBO_INDEX[cards("As Kd")[0], cards("As Kd")[1]]
+        assert weights[index] == 0.75
+        assert weights.sum() == 0.75
+
+    def test_class_range(self):
+        """Test classes expand to all their combos."""
+        weights = class_range(classes("As Ad", "As Kd", "As Ks"), [1.0, 0.5, 2.0])
+        assert np.count_nonzero(weights) == 6 + 12 + 4
+        assert weights.sum() == 6 + 6 + 8
+
+    def test_remove_cards(self):
+        """Test combos touching removed cards get zero weight."""
+        weights = remove_cards(full_range(), cards("As Kd"))
+        assert np.count_nonzero(weights) == NUM_COMBOS - 101
+
+    @pytest.mark.parametrize(
+        "combos, weights, match",
+        [
+            ([(0, 52)], None, "invalid card indices"),
+            ([(3, 3)], None, "two different cards"),
+            ([(0, 1)], [1.0, 2.0], "Expected 1 weights"),
+            ([(0, 1)], [-1.0], "non-negative"),
+        ],
+    )
+    def test_invalid_ranges(self, combos, weights, match):
+        """Test malformed ranges are rejected."""
+        with pytest.raises(ValueError, match=match):
+            range_vector(combos, weights)
+
+    def test_card_table_matches_conflicts(self):
+        """Test each combo conflicts exactly with its cards' combos."""
+        conflicts = combo_conflicts()
+        for index in (0, 500, NUM_COMBOS - 1):
+            first, second = COMBOS[index]
+            blocked = np.union1d(CARD_COMBOS[first], CARD_COMBOS[second])
+            np.testing.assert_array_equal(blocked, np.flatnonzero(conflicts[index]))
+
+
+class TestHandVsRange:
+    """Test a known hand against a range."""
+
+    @pytest.mark.parametrize(
+        "board", ["Qh 7c 2d 9s 3h", "Qh 7c 2d 9s", "Qh Jh 2d", "Ts 9s 8h 2s"]
+    )
+    def test_matches_exact_enumeration(self, board):
+        """Test results equal exact_equity with the same range."""
+        hero, board = cards("Ah Kh"), cards(board)
+        villain = class_range(classes("Qs Qd", "Qs Jd", "Ts 9s", "7s 7d", "As 2s"))
+        expected = exact_equity(hero, board, [combos_of(villain)])
+        result = hand_vs_range_equity(hero, villain, board)
+        assert result.equity == pytest.approx(expected.equity)
+        assert result.win == pytest.approx(expected.win)
+        assert result.tie == pytest.approx(expected.tie)
+
+    def test_weights_change_equity(self):
+        """Test weighting the range toward strong hands lowers equity."""
+        hero, board = cards("Ah Kh"), cards("Kc 7d 2s 9h 4c")
+        even = class_range(classes("As Ad", "Qs Jd"))
+        heavy = class_range(classes("As Ad", "Qs Jd"), [10.0, 1.0])
+        assert (
+            hand_vs_range_equity(hero, heavy, board).equity
+            < hand_vs_range_equity(hero, even, board).equity
+        )
+
+    def test_split_pot(self):
+        """Test a board that plays for both sides is an even split."""
+        result = hand_vs_range_equity(
+            cards("2c 3d"), full_range(), cards("As Ks Qs Js Ts")
+        )
+        assert result.equity == 0.5
+        assert result.tie == 1.0
+
+    def test_repeated_cards_rejected(self):
+        """Test hero cards cannot also be on the board."""
+        with pytest.raises(ValueError, match="must be distinct"):
+            hand_vs_range_equity(cards("As Kd"), full_range(), cards("As 7c 2d"))
+
+    def test_board_size(self):
+        """Test boards outside 3-5 cards are rejected."""
+        with pytest.raises(ValueError, match="Board must have 3-5 cards"):
+            hand_vs_range_equity(cards("As Kd"), full_range(), cards("7c 2d"))
+
+    def test_blocked_range(self):
+        """Test a range fully blocked by the board is rejected."""
+        villain = range_vector([cards("7c 2h")])
+        with pytest.raises(ValueError, match="Villain range has no combos left"):
+            hand_vs_range_equity(cards("As Kd"), villain, cards("7c 2d 9h"))
+
+
+class TestRangeVsRange:
+    """Test range against range."""
+
+    def test_matches_weighted_hand_results(self):
+        """Test range equity is the deal-weighted mix of its combos."""
+        board = cards("Qh 7c 2d 9s")
+        hero = class_range(classes("Ts Td", "Ah Kd", "9h 8h"))
+        villain = class_range(classes("Qs Qd", "Qs Jd", "7s 6s"), [1.0, 2.0, 1.0])
+        result = range_equity(hero, villain, board)
+
+        total = weight = 0.0
+        for combo in combos_of(remove_cards(hero, board)):
+            villain_combos = combos_of(remove_cards(villain, [*board, *combo]))
+            deals = 0.0
+            for other in villain_combos:
+                share = exact_equity(list(combo), board, [[other]])
+                w = villain[COMBO_INDEX[other]] * share.samples
+                total += w * share.equity
+                deals += w
+            weight += deals
+            index = COMBO_INDEX[combo]
+            hand = hand_vs_range_equity(list(combo), villain, board)
+            assert result.combo_equity[index] == pytest.approx(hand.equity)
+        assert result.equity == pytest.approx(total / weight)
+
+    def test_symmetry(self):
+        """Test both sides' equities sum to one."""
+        board = cards("Kc 8d 3s")
+        first = class_range(list(range(0, 169, 7)))
+        second = class_range(list(range(3, 169, 5)))
+        forward = range_equity(first, second, board)
+        backward = range_equity(second, first, board)
+        assert forward.equity + backward.equity == pytest.approx(1.0)
+        assert forward.runouts == 49 * 48 // 2
+
+    def test_full_ranges_are_even(self):
+        """Test identical ranges split equity evenly."""
+        result = range_equity(full_range(), full_range(), cards("Qh 7c 2d 9s 3h"))
+        assert result.equity == pytest.approx(0.5)
+
+    def test_combo_equity_nan_outside_range(self):
+        """Test combos hero never holds have no equity."""
+        hero = class_range(classes("As Ad"))
+        result = range_equity(hero, full_range(), cards("Qh 7c 2d 9s 3h"))
+        assert np.count_nonzero(~np.isnan(result.combo_equity)) == 6
+
+    def test_invalid_weights(self):
+        """Test weight vectors must cover every combo."""
+        with pytest.raises(ValueError, match="shape"):
+            range_equity(np.ones(10), full_range(), cards("Qh 7c 2d"))
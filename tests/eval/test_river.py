@@ -0,0 +1,159 @@
+"""Tests for per-board river rankings."""
+
+import numpy as np
+import pytest
+
+from texas_holdem_ml_bot.engine.canonical import preflop_class
+from texas_holdem_ml_bot.engine.cards import Card
+from texas_holdem_ml_bot.engine.lookup import rank_indices
+from texas_holdem_ml_bot.eval.equity import COMBO_INDEX, COMBOS, NUM_COMBOS
+from texas_holdem_ml_bot.eval.ranges import class_range, full_range, range_equity
+from texas_holdem_ml_bot.eval.river import RiverRanking, river_ranking
+
+
+def cards(text):
+    """Parse space-separated cards into indices."""
+    return [Card.parse(token).index for token in text.split()]
+
+
+BOARD = cards("Qh 7c 2d 9s 3h")
+
+
+@pytest.fixture(scope="module")
+def ranking():
+    """Ranking of a dry river board."""
+    return RiverRanking.build(BOARD)
+
+
+class TestBuild:
+    """Test the sorted table and tie groups."""
+
+    def test_live_combos_sorted(self, ranking):
+        """Test all 1,081 live combos are present, weakest first."""
+        assert len(ranking) == 1081
+        assert len(np.unique(ranking.combos)) == 1081
+        assert np.all(np.diff(ranking.ranks) >= 0)
+
+    def test_ranks_match_evaluator(self, ranking):
+        """Test stored ranks equal direct seven-card evaluation."""
+        for combo in ranking.combos[::97]:
+            first, second = COMBOS[combo]
+            assert ranking.rank(first, second) == rank_indices([first, second, *BOARD])
+
+    def test_tie_groups(self, ranking):
+        """Test each group holds one rank and groups cover every combo."""
+        sizes = [len(ranking.tie_group(g)) for g in range(ranking.num_groups)]
+        assert sum(sizes) == len(ranking)
+        for group in (0, ranking.num_groups // 2, ranking.num_groups - 1):
+            members = ranking.tie_group(group)
+            assert len(set(ranking.rank_of[members].tolist())) == 1
+            assert np.all(ranking.group_of[members] == group)
+
+    def test_board_combos_blocked(self, ranking):
+        """Test combos using a board card have no rank or group."""
+        combo = COMBO_INDEX[BOARD[0], BOARD[1]]
+        assert ranking.rank_of[combo] == 0
+        assert ranking.group_of[combo] == -1
+        with pytest.raises(ValueError, match="not live on this board"):
+            ranking.rank(BOARD[0], cards("As")[0])
+
+    def test_tables_read_only(self, ranking):
+        """Test cached tables cannot be modified in place."""
+        with pytest.raises(ValueError):
+            ranking.ranks[0] = 0
+
+    @pytest.mark.parametrize(
+        "board, match",
+        [
+            (cards("Qh 7c 2d 9s"), "needs 5 cards"),
+            (cards("Qh 7c 2d 9s 9s"), "distinct"),
+            ([0, 1, 2, 3, 52], "Invalid card index"),
+        ],
+    )
+    def test_invalid_board(self, board, match):
+        """Test malformed boards are rejected."""
+        with pytest.raises(ValueError, match=match):
+            RiverRanking.build(board)
+
+
+class TestQueries:
+    """Test binary searches and prefix-sum equities."""
+
+    def test_counts(self, ranking):
+        """Test combo counts agree with a direct scan."""
+        rank = ranking.rank(*cards("Ah Qd"))
+        assert ranking.count_below(rank) == np.count_nonzero(ranking.ranks < rank)
+        assert ranking.count_at_or_below(rank) == np.count_nonzero(
+            ranking.ranks <= rank
+        )
+
+    def test_equity_matches_range_equity(self, ranking):
+        """Test every combo's equity equals the enumerated range equity."""
+        villain = class_range(list(range(0, 169, 4)), np.linspace(0.2, 1.0, 43))
+        expected = range_equity(full_range(), villain, BOARD).combo_equity
+        np.testing.assert_allclose(
+            ranking.equity_vs_range(villain), expected, equal_nan=True
+        )
+
+    def test_strength_brute_force(self, ranking):
+        """Test percentile strength counts beaten and tied hands directly."""
+        hero = cards("9h 8h")
+        rank = ranking.rank(*hero)
+        wins = ties = total = 0
+        for first, second in COMBOS[ranking.combos]:
+            if first in hero or second in hero:
+                continue
+            other = ranking.rank(first, second)
+            wins += other < rank
+            ties += other == rank
+            total += 1
+        assert ranking.strength(*hero) == pytest.approx((wins + 0.5 * ties) / total)
+
+    def test_nuts_and_blocked(self, ranking):
+        """Test the nuts have full strength and board combos are NaN."""
+        strengths = ranking.strengths()
+        assert strengths[ranking.combos[-1]] == 1.0
+        assert np.count_nonzero(np.isnan(strengths)) == NUM_COMBOS - 1081
+
+    def test_hand_equity_matches_vector(self, ranking):
+        """Test single-hand equity agrees with the full vector, blockers included."""
+        villain = class_range(list(range(0, 169, 3)), np.linspace(0.1, 1.0, 57))
+        vector = ranking.equity_vs_range(villain)
+        for combo in ranking.combos[::7]:
+            first, second = COMBOS[combo]
+            assert ranking.hand_equity(first, second, villain) == pytest.approx(
+                vector[combo], nan_ok=True
+            )
+
+    def test_hand_equity_without_villain_combos(self, ranking):
+        """Test a range fully blocked by the hero hand gives NaN."""
+        villain = np.zeros(NUM_COMBOS)
+        villain[COMBO_INDEX[cards("Ah Kd")[0], cards("Ah Kd")[1]]] = 1.0
+        assert np.isnan(ranking.hand_equity(*cards("Ah Ac"), villain))
+
+    def test_strengths_are_cached(self, ranking):
+        """Test strengths are computed once and cannot be modified."""
+        strengths = ranking.strengths()
+        assert ranking.strengths() is strengths
+        assert not strengths.flags.writeable
+        assert (
+            ranking.strength(*cards("9h 8h"))
+            == strengths[COMBO_INDEX[cards("9h 8h")[0], cards("9h 8h")[1]]]
+        )
+
+    def test_hand_equity_weights(self, ranking):
+        """Test a range of only stronger hands gives zero equity."""
+        villain = class_range([preflop_class(*cards("As Ad"))])
+        assert ranking.hand_equity(*cards("Kh Kd"), villain) == 0.0
+
+
+class TestCache:
+    """Test memoization per board."""
+
+    def test_order_independent(self):
+        """Test the same board in any order shares one entry."""
+        river_ranking.cache.clear()
+        first = river_ranking(BOARD)
+        second = river_ranking(list(reversed(BOARD)))
+        assert first is second
+        assert river_ranking.cache.stats().hits == 1
@@ -0,0 +1,211 @@
+"""Tests for the micro-batching equity service."""
+
+import asyncio
+import time
+
+import pytest
+
+from texas_holdem_ml_bot.engine.cards import Card
+from texas_holdem_ml_bot.eval import service
+from texas_holdem_ml_bot.eval.equity import EquitySpot, exact_equity
+from texas_holdem_ml_bot.eval.service import EquityService, batch_equity
+
+
+def cards(text):
+    """Parse space-separated cards into indices."""
+    return [Card.parse(token).index for token in text.split()]
+
+
+def run(coroutine):
+    """Run a coroutine on a fresh event loop."""
+    return asyncio.run(coroutine)
+
+
+class TestBatchEquity:
+    """Test the synchronous batched evaluator."""
+
+    def test_mixed_spots(self):
+        """Test spots of different shapes land near their exact equity."""
+        spots = [
+            (cards("Ah Kh"), cards("Qh 7c 2d 9s"), 1),
+            (cards("7c 7d"), cards("Kc 7h 2c 9d"), 1),
+            (cards("Ah Kh"), cards("Qh 7c 2d 9s"), [[cards("Qs Qd")]]),
+        ]
+        requests = [
+            (EquitySpot.build(hero, board, opponents), 20_000, None)
+            for hero, board, opponents in spots
+        ]
+        results = batch_equity(requests)
+        for (hero, board, opponents), result in zip(spots, results):
+            expected = exact_equity(hero, board, opponents).equity
+            assert result.samples == 20_000
+            assert result.equity == pytest.approx(expected, abs=4 * result.std_error)
+
+    def test_seeded_requests_reproducible(self):
+        """Test a seeded request gives the same result in any batch."""
+        spot = EquitySpot.build(cards("Ah Kh"), cards("Qh 7c 2d"), 2)
+        other = EquitySpot.build(cards("9s 9d"), (), 1)
+        alone = batch_equity([(spot, 500, 7)])[0]
+        mixed = batch_equity([(other, 300, None), (spot, 500, 7)])[1]
+        assert alone.equity == mixed.equity
+
+    def test_elapsed_includes_evaluation(self, monkeypatch):
+        """Test reported elapsed time covers ranking the dealt hands."""
+        evaluate = service.evaluate_batch
+
+        def slow_evaluate(hands):
+            time.sleep(0.05)
+            return evaluate(hands)
+
+        monkeypatch.setattr(service, "evaluate_batch", slow_evaluate)
+        spot = EquitySpot.build(cards("Ah Kh"), cards("Qh 7c 2d"), 1)
+        result = batch_equity([(spot, 100, 7)])[0]
+        assert result.elapsed >= 0.05
+
+    def test_bad_spot_raises(self):
+        """Test a range that cannot be dealt surfaces its error."""
+        spot = EquitySpot.build(
+            cards("Ah Kh"), (), [[cards("Qs Qd")], [cards("Qs Qh")]]
+        )
+        with pytest.raises(ValueError, match="keep colliding"):
+            batch_equity([(spot, 10, None)])
+
+
+class TestEquityService:
+    """Test batching, results and statistics of the asyncio service."""
+
+    def test_concurrent_requests_are_batched(self):
+        """Test concurrent callers share batches and get their own results."""
+
+        async def scenario():
+            async with EquityService(max_batch_size=16, max_delay=0.05) as service:
+                results = await asyncio.gather(
+                    *[
+                        service.equity(cards("Ah Kh"), cards("Qh 7c 2d 9s"), 1)
+                        for _ in range(40)
+                    ]
+                )
+                return results, service.stats()
+
+        results, stats = run(scenario())
+        assert len(results) == 40
+        assert stats.requests == 40
+        assert stats.batches == 3
+        assert stats.max_batch_size == 16
+        assert stats.mean_batch_size == pytest.approx(40 / 3)
+        assert stats.queue_depth == 0
+        assert 0 < stats.latency_p50 <= stats.latency_p90 <= stats.latency_p99
+        expected = exact_equity(cards("Ah Kh"), cards("Qh 7c 2d 9s")).equity
+        mean = sum(result.equity for result in results) / len(results)
+        assert mean == pytest.approx(expected, abs=0.02)
+
+    def test_lone_request_waits_at_most_delay(self):
+        """Test a single request is answered once the window closes."""
+
+        async def scenario():
+            async with EquityService(max_delay=0.001, offload=False) as service:
+                result = await service.equity(cards("As Ad"), samples=200, seed=1)
+                return result, service.stats()
+
+        result, stats = run(scenario())
+        assert result.samples == 200
+        assert stats.batches == 1
+        assert stats.latency_p99 < 1.0
+
+    def test_invalid_spot_raises_in_caller(self):
+        """Test validation errors surface before the request is queued."""
+
+        async def scenario():
+            async with EquityService() as service:
+                with pytest.raises(ValueError, match="must be distinct"):
+                    await service.equity(cards("As Ad"), cards("As 7c 2d"))
+                with pytest.raises(ValueError, match="samples must be positive"):
+                    await service.equity(cards("As Ad"), samples=0)
+                return service.stats()
+
+        assert run(scenario()).requests == 0
+
+    def test_failed_deal_only_affects_its_caller(self):
+        """Test one undealable request does not fail the rest of its batch."""
+
+        async def scenario():
+            async with EquityService(max_delay=0.05) as service:
+                clash = [[cards("Qs Qd")], [cards("Qs Qh")]]
+                return await asyncio.gather(
+                    service.equity(cards("Ah Kh"), (), clash, samples=10),
+                    service.equity(cards("Ah Kh"), samples=100),
+                    return_exceptions=True,
+                )
+
+        failed, succeeded = run(scenario())
+        assert isinstance(failed, ValueError)
+        assert succeeded.samples == 100
+
+    def test_requires_running_service(self):
+        """Test requests are refused before start and after stop."""
+
+        async def scenario():
+            service = EquityService()
+            with pytest.raises(RuntimeError, match="not running"):
+                await service.equity(cards("As Ad"))
+            await service.start()
+            assert service.running
+            await service.stop()
+            assert not service.running
+            with pytest.raises(RuntimeError, match="not running"):
+                await service.equity(cards("As Ad"))
+
+        run(scenario())
+
+    def test_stop_answers_queued_and_refuses_new(self):
+        """Test stop answers earlier requests and refuses ones made meanwhile."""
+
+        async def scenario():
+            service = EquityService(max_delay=0.05, samples=100)
+            await service.start()
+            queued = asyncio.create_task(service.equity(cards("As Ad")))
+            await asyncio.sleep(0)
+            stopping = asyncio.create_task(service.stop())
+            await asyncio.sleep(0)
+            assert not service.running
+            with pytest.raises(RuntimeError, match="not running"):
+                await service.equity(cards("Ks Kd"))
+            await stopping
+            return await queued
+
+        assert run(scenario()).samples == 100
+
+    def test_cancelled_worker_fails_requests(self):
+        """Test callers get an error instead of hanging when the worker dies."""
+
+        async def scenario():
+            service = EquityService(max_delay=10.0, offload=False)
+            await service.start()
+            requests = [
+                asyncio.create_task(service.equity(cards(hand)))
+                for hand in ("As Ad", "Ks Kd", "Qs Qd")
+            ]
+            await asyncio.sleep(0.01)
+            service._worker.cancel()
+            outcomes = await asyncio.wait_for(
+                asyncio.gather(*requests, return_exceptions=True), timeout=1.0
+            )
+            await service.stop()
+            return outcomes
+
+        for outcome in run(scenario()):
+            assert isinstance(outcome, RuntimeError)
+            assert "stopped before answering" in str(outcome)
+
+    @pytest.mark.parametrize(
+        "options, match",
+        [
+            ({"max_batch_size": 0}, "max_batch_size must be positive"),
+            ({"max_delay": -1.0}, "max_delay cannot be negative"),
+            ({"samples": 0}, "samples must be positive"),
+        ],
+    )
+    def test_invalid_settings(self, options, match):
+        """Test bad limits are rejected at construction."""
+        with pytest.raises(ValueError, match=match):
+            EquityService(**options)
@@ -0,0 +1 @@
+"""Features tests package."""
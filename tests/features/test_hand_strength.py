@@ -0,0 +1,146 @@
+"""Tests for hand strength and potential features."""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from texas_holdem_ml_bot.engine.cards import NUM_CARDS, Card
+from texas_holdem_ml_bot.engine.lookup import rank_indices
+from texas_holdem_ml_bot.features.hand_strength import (
+    FEATURE_NAMES,
+    board_outlook,
+    canonical_row,
+    hand_strength,
+    hand_strength_batch,
+)
+
+
+def cards(text):
+    """Parse space-separated cards into indices."""
+    return [Card.parse(token).index for token in text.split()]
+
+
+def brute_force(hole, board):
+    """Compute (hs, hs2, ppot, npot) with direct evaluation loops."""
+    hp = np.zeros((3, 3))
+    deck = [c for c in range(NUM_CARDS) if c not in hole and c not in board]
+    hero_now = rank_indices([*hole, *board])
+    ahead = tied = total = 0
+    runouts = list(combinations(deck, 5 - len(board)))
+    river_ahead = {runout: [0.0, 0] for runout in runouts}
+    for opponent in combinations(deck, 2):
+        villain_now = rank_indices([*opponent, *board])
+        now = (hero_now > villain_now) - (hero_now < villain_now) + 1
+        ahead += now == 2
+        tied += now == 1
+        total += 1
+        for runout in runouts:
+            if set(runout) & set(opponent):
+                continue
+            river = [*board, *runout]
+            hero_rank = rank_indices([*hole, *river])
+            villain_rank = rank_indices([*opponent, *river])
+            later = (hero_rank > villain_rank) - (hero_rank < villain_rank) + 1
+            hp[now, later] += 1
+            river_ahead[runout][0] += later / 2
+            river_ahead[runout][1] += 1
+    strengths = [score / count for score, count in river_ahead.values()]
+    totals = hp.sum(axis=1)
+    ppot = (hp[0, 2] + hp[0, 1] / 2 + hp[1, 2] / 2) / (totals[0] + totals[1] / 2)
+    npot = (hp[2, 0] + hp[2, 1] / 2 + hp[1, 0] / 2) / (totals[2] + totals[1] / 2)
+    hs = (ahead + tied / 2) / total
+    return hs, float(np.mean(np.square(strengths))), ppot, npot
+
+
+class TestHandStrength:
+    """Test single-hand features."""
+
+    @pytest.mark.parametrize(
+        "hole, board",
+        [("Ah Kh", "Qh 7h 2d 9s"), ("7c 7d", "Kc 7h 2c Jd"), ("5s 4s", "6d 3h Kc Qs")],
+    )
+    def test_matches_brute_force(self, hole, board):
+        """Test turn features equal direct enumeration."""
+        hole, board = cards(hole), cards(board)
+        hs, hs2, ppot, npot = brute_force(hole, board)
+        result = hand_strength(hole, board)
+        assert result.hs == pytest.approx(hs)
+        assert result.hs2 == pytest.approx(hs2)
+        assert result.ppot == pytest.approx(ppot)
+        assert result.npot == pytest.approx(npot)
+        assert result.ehs == pytest.approx(hs * (1 - npot) + (1 - hs) * ppot)
+
+    def test_river_has_no_potential(self):
+        """Test river potentials are zero and hs2 is hs squared."""
+        result = hand_strength(cards("Ah Kh"), cards("Qh 7c 2d 9s 3c"))
+        assert result.ppot == result.npot == 0.0
+        assert result.hs2 == pytest.approx(result.hs**2)
+        assert result.ehs == result.hs
+
+    def test_draw_has_positive_potential(self):
+        """Test a flush draw behind now has real positive potential."""
+        result = hand_strength(cards("Ah Kh"), cards("Qh 7h 2d"))
+        assert result.ppot > 0.3
+        assert result.ehs > result.hs
+
+    def test_suit_invariant(self):
+        """Test relabelling suits does not change the features."""
+        first = hand_strength(cards("Ah Kh"), cards("Qh 7h 2d 9s"))
+        second = hand_strength(cards("As Ks"), cards("Qs 7s 2c 9h"))
+        assert first == second
+
+    @pytest.mark.parametrize(
+        "hole, board, match",
+        [
+            ("Ah Kh", "Qh 7h", "Board must have 3-5 cards"),
+            ("Ah Kh", "Ah 7h 2d", "must be distinct"),
+            ("Ah", "Qh 7h 2d", "exactly 2 hole cards"),
+        ],
+    )
+    def test_invalid_rows(self, hole, board, match):
+        """Test malformed rows are rejected."""
+        with pytest.raises(ValueError, match=match):
+            hand_strength(cards(hole), cards(board))
+
+
+class TestBatch:
+    """Test batched features and board caching."""
+
+    def test_batch_matches_single(self):
+        """Test batch rows equal single-hand results in order."""
+        rows = [
+            ("Ah Kh", "Qh 7h 2d 9s"),
+            ("7c 7d", "Kc 7h 2c"),
+            ("As Ks", "Qs 7s 2c 9h"),
+            ("Ah Kh", "Qh 7h 2d 9s"),
+            ("Td 9d", "Kc 7h 2c"),
+        ]
+        holes = [cards(hole) for hole, _ in rows]
+        boards = [cards(board) for _, board in rows]
+        batch = hand_strength_batch(holes, boards)
+        assert batch.shape == (len(rows), len(FEATURE_NAMES))
+        for row, (hole, board) in enumerate(zip(holes, boards)):
+            expected = hand_strength(hole, board).as_tuple()
+            np.testing.assert_allclose(batch[row], expected)
+
+    def test_isomorphic_boards_share_outlook(self):
+        """Test suit-relabelled boards hit one cache entry."""
+        board_outlook.cache.clear()
+        hand_strength_batch(
+            [cards("Ah Kh"), cards("As Ks"), cards("2c 3c")],
+            [cards("Qh 7h 2d 9s"), cards("Qs 7s 2c 9h"), cards("Qh 7h 2d 9s")],
+        )
+        stats = board_outlook.cache.stats()
+        assert (stats.misses, stats.size) == (1, 1)
+
+    def test_canonical_row(self):
+        """Test hero cards follow the board's suit relabelling."""
+        first = canonical_row(cards("Ah Kh"), cards("Qh 7h 2d"))
+        second = canonical_row(cards("Ac Kc"), cards("Qc 7c 2s"))
+        assert first == second
+
+    def test_length_mismatch(self):
+        """Test holes and boards must pair up."""
+        with pytest.raises(ValueError, match="hole pairs but"):
+            hand_strength_batch([cards("Ah Kh")], [])
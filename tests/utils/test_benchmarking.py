@@ -0,0 +1,135 @@
+"""Tests for the microbenchmark harness."""
+
+import json
+
+import pytest
+
+from texas_holdem_ml_bot.utils.benchmarking import (
+    Benchmark,
+    BenchmarkResult,
+    append_history,
+    compare_results,
+    format_results,
+    load_history,
+    make_record,
+    record_results,
+    run_benchmark,
+)
+
+
+def result(name, seconds_per_op, ops=10):
+    """Build a result whose rounds all ran at the given speed."""
+    return BenchmarkResult(name=name, ops=ops, timings=(seconds_per_op * ops,) * 3)
+
+
+class TestRunBenchmark:
+    """Test warmup, repeats and scaling."""
+
+    def test_warmup_and_repeats(self):
+        """Test setup runs once and the callable warmup + repeats times."""
+        calls = {"setup": [], "run": 0}
+
+        def setup(ops):
+            calls["setup"].append(ops)
+
+            def run():
+                calls["run"] += 1
+
+            return run
+
+        bench = Benchmark("noop", setup, ops=100)
+        outcome = run_benchmark(bench, warmup=2, repeats=5, scale=0.5)
+
+        assert calls["setup"] == [50]
+        assert calls["run"] == 7
+        assert outcome.ops == 50
+        assert len(outcome.timings) == 5
+
+    def test_invalid_repeats(self):
+        """Test at least one timed round is required."""
+        bench = Benchmark("noop", lambda ops: lambda: None, ops=1)
+        with pytest.raises(ValueError, match="repeats must be positive"):
+            run_benchmark(bench, repeats=0)
+
+
+class TestBenchmarkResult:
+    """Test percentile and throughput summaries."""
+
+    def test_percentiles_per_operation(self):
+        """Test percentiles interpolate per-operation round times."""
+        outcome = BenchmarkResult("x", ops=2, timings=(4.0, 2.0, 6.0, 8.0, 10.0))
+        assert outcome.percentile(0) == 1.0
+        assert outcome.median == 3.0
+        assert outcome.percentile(90) == pytest.approx(4.6)
+        assert outcome.percentile(100) == 5.0
+        assert outcome.ops_per_sec == pytest.approx(1 / 3)
+
+    def test_invalid_percentile(self):
+        """Test percentiles outside 0-100 are rejected."""
+        with pytest.raises(ValueError, match="Percentile must be in 0-100"):
+            result("x", 1.0).percentile(101)
+
+    def test_dict_round_trip(self):
+        """Test serialization keeps the raw timings."""
+        outcome = BenchmarkResult("x", ops=3, timings=(0.3, 0.6))
+        data = outcome.to_dict()
+        assert data["p50_us"] == pytest.approx(150_000)
+        assert BenchmarkResult.from_dict("x", data) == outcome
+
+
+class TestHistory:
+    """Test the JSON history file."""
+
+    def test_append_and_load(self, tmp_path):
+        """Test records accumulate oldest first."""
+        path = tmp_path / "bench" / "history.json"
+        assert load_history(path) == []
+
+        append_history(path, make_record([result("a", 1e-6)], label="first"))
+        append_history(path, make_record([result("a", 2e-6)], backend="lookup"))
+        history = load_history(path)
+
+        assert [record["label"] for record in history] == ["first", None]
+        assert history[1]["backend"] == "lookup"
+        restored = record_results(history[0])["a"]
+        assert restored.median == pytest.approx(1e-6)
+
+    def test_rejects_non_list(self, tmp_path):
+        """Test a malformed history file raises ValueError."""
+        path = tmp_path / "history.json"
+        path.write_text(json.dumps({"results": {}}))
+        with pytest.raises(ValueError, match="must be a JSON list"):
+            load_history(path)
+
+
+class TestCompareResults:
+    """Test regression detection against a baseline."""
+
+    def test_flags_drops_beyond_threshold(self):
+        """Test only slowdowns larger than the threshold regress."""
+        baseline = {"fast": result("fast", 1.0), "slow": result("slow", 1.0)}
+        current = [result("fast", 1.05), result("slow", 1.5), result("new", 1.0)]
+        comparisons = compare_results(baseline, current, threshold=0.1)
+
+        by_name = {c.name: c for c in comparisons}
+        assert set(by_name) == {"fast", "slow"}
+        assert not by_name["fast"].regressed
+        assert by_name["slow"].regressed
+        assert by_name["slow"].change == pytest.approx(-1 / 3)
+
+    def test_speedups_never_regress(self):
+        """Test a faster run passes even with a zero threshold."""
+        comparisons = compare_results({"a": result("a", 2.0)}, [result("a", 1.0)], 0)
+        assert not comparisons[0].regressed
+
+    def test_negative_threshold(self):
+        """Test negative thresholds are rejected."""
+        with pytest.raises(ValueError, match="threshold cannot be negative"):
+            compare_results({}, [], threshold=-0.1)
+
+    def test_format_marks_regressions(self):
+        """Test the report shows changes and flags regressions."""
+        current = [result("a", 2.0)]
+        comparisons = compare_results({"a": result("a", 1.0)}, current)
+        report = format_results(current, comparisons)
+        assert "-50.0% !" in report
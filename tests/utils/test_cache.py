@@ -0,0 +1,111 @@
+"""Tests for the bounded LRU cache."""
+
+import pytest
+
+from texas_holdem_ml_bot.utils.cache import LRUCache, lru_cached
+
+
+class TestLRUCache:
+    """Test LRUCache storage, eviction and counters."""
+
+    def test_hits_and_misses(self):
+        """Test lookups update hit and miss counters."""
+        cache = LRUCache(4)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_evicts_least_recently_used(self):
+        """Test a full cache drops the least recently used entry."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", 3)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats().evictions == 1
+
+    def test_get_or_compute(self):
+        """Test values are computed once per key."""
+        cache = LRUCache(8)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return 42
+
+        assert cache.get_or_compute("k", compute) == 42
+        assert cache.get_or_compute("k", compute) == 42
+        assert len(calls) == 1
+
+    def test_invalidate_and_clear(self):
+        """Test explicit invalidation of one key and of everything."""
+        cache = LRUCache(4)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        assert cache.invalidate("a") is True
+        assert cache.invalidate("a") is False
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats().misses == 0
+
+    def test_resize_evicts(self):
+        """Test shrinking the limit evicts the oldest entries."""
+        cache = LRUCache(4)
+        for key in "abcd":
+            cache.put(key, key)
+        cache.resize(2)
+
+        assert list(cache._data) == ["c", "d"]
+        assert cache.maxsize == 2
+        assert cache.stats().evictions == 2
+
+    def test_invalid_maxsize(self):
+        """Test the limit must be positive."""
+        with pytest.raises(ValueError, match="maxsize must be positive"):
+            LRUCache(0)
+
+
+class TestLRUCachedDecorator:
+    """Test the memoizing decorator."""
+
+    def test_memoizes_calls(self):
+        """Test repeated calls are served from the cache."""
+        calls = []
+
+        @lru_cached(maxsize=8)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        assert [square(3), square(3), square(4)] == [9, 9, 16]
+        assert calls == [3, 4]
+        assert square.cache.stats().hits == 1
+
+    def test_custom_key(self):
+        """Test a key function can merge equivalent calls."""
+
+        @lru_cached(maxsize=8, key=lambda text: text.lower())
+        def length(text):
+            return len(text)
+
+        length("Hello")
+        length("HELLO")
+        assert length.cache.stats().hits == 1
+
+    def test_keyword_arguments_need_key(self):
+        """Test keyword calls are rejected without a key function."""
+
+        @lru_cached(maxsize=8)
+        def identity(x):
+            return x
+
+        with pytest.raises(TypeError, match="explicit cache key"):
+            identity(x=1)
@@ -0,0 +1,39 @@
+"""Tests for data directory resolution."""
+
+from pathlib import Path
+
+from texas_holdem_ml_bot.utils.paths import (
+    APP_NAME,
+    DATA_DIR_ENV,
+    PROJECT_ROOT,
+    resolve_data_dir,
+)
+
+
+class TestResolveDataDir:
+    """Test where generated artifacts are written."""
+
+    def test_source_checkout(self):
+        """Test a checkout with a pyproject.toml keeps data at its root."""
+        assert (PROJECT_ROOT / "pyproject.toml").is_file()
+        assert resolve_data_dir({}) == PROJECT_ROOT / "data"
+
+    def test_override(self, tmp_path):
+        """Test the environment variable wins over everything else."""
+        environ = {DATA_DIR_ENV: str(tmp_path / "shared")}
+        assert resolve_data_dir(environ) == tmp_path / "shared"
+
+    def test_installed_package_uses_user_dir(self, tmp_path):
+        """Test an install without a project root never writes beside the code."""
+        site_packages = tmp_path / "lib" / "python3.11" / "site-packages"
+        site_packages.mkdir(parents=True)
+        environ = {"XDG_DATA_HOME": str(tmp_path / "xdg")}
+        resolved = resolve_data_dir(environ, project_root=site_packages)
+        assert resolved == tmp_path / "xdg" / APP_NAME
+        assert site_packages not in resolved.parents
+
+    def test_default_user_dir(self, tmp_path, monkeypatch):
+        """Test the XDG default under the home directory."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        resolved = resolve_data_dir({}, project_root=tmp_path / "missing")
+        assert resolved == tmp_path / ".local" / "share" / APP_NAME